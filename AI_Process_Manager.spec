@@ -3,7 +3,8 @@ from PyInstaller.utils.hooks import collect_all
 
 datas = []
 binaries = []
-hiddenimports = ['PIL', 'pystray', 'win32timezone']
+hiddenimports = ['PIL', 'pystray', 'win32timezone',
+                 'core.backends.windows', 'core.backends.linux', 'core.backends.procfs']
 tmp_ret = collect_all('customtkinter')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 
@@ -0,0 +1,119 @@
+"""
+GeminiAnalyzer sıcak yolları:
+- Önbellek isabeti / ıskalaması (dolu bir analysis_cache tablosunda)
+- Prompt oluşturma (tekli ve 10'luk parti)
+- Önbellek dışı tam analiz (yerel sahte Gemini sunucusuna karşı: HTTP + yönlendirici + JSON + kayıt)
+- Akış (SSE): ilk kartın dolma süresi ile tam yanıt süresi (run_stream)
+
+Kullanım:
+    python benchmarks/bench_analysis.py --rows 5000 --rounds 50 --latency 0
+    python benchmarks/bench_analysis.py --stream --chunk-delay 0.02
+"""
+import argparse
+import hashlib
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from harness import measure, run_quiet
+from fake_gemini import FakeGeminiServer, fake_analysis
+
+from core.gemini_api import GeminiAnalyzer
+
+
+def _info(i):
+    return {
+        "pid": 1000 + i,
+        "name": f"proc_{i}.exe",
+        "path": f"C:\\Program Files\\Bench\\proc_{i}.exe",
+        "hash": hashlib.sha256(str(i).encode()).hexdigest(),
+        "signature": "Geçerli (Doğrulanmış)",
+        "rss": 50 * 1024 * 1024 + i,
+    }
+
+
+def run(rows=5000, rounds=50, latency=0.0):
+    with tempfile.TemporaryDirectory() as tmp, FakeGeminiServer(latency=latency) as server:
+        gemini = GeminiAnalyzer(db_path=os.path.join(tmp, "process_audit.db"), api_base=server.base_url)
+        gemini.api_key = "bench"
+
+        # Dolu bir önbellek (gerçek kullanımdaki process_audit.db gibi)
+        for i in range(rows):
+            gemini._save_to_db(_info(i)["hash"], "TR", _info(i), fake_analysis())
+        gemini.db.flush()
+
+        hit_info = _info(rows // 2)
+        miss_info = _info(rows + 1)
+        counter = {"next": rows + 10}
+
+        def fresh_info():
+            counter["next"] += 1
+            return _info(counter["next"])
+
+        batch_infos = [_info(rows + 100 + i) for i in range(10)]
+
+        result = {
+            "rows": rows,
+            "cache_hit": measure(lambda: gemini.get_cached_analysis(hit_info, "TR"), rounds),
+            "cache_miss": measure(lambda: gemini.get_cached_analysis(miss_info, "TR"), rounds),
+            "prompt_single": measure(lambda: gemini._build_prompt(hit_info, "TR"), rounds),
+            "prompt_batch_10": measure(lambda: gemini._build_batch_prompt(batch_infos, "TR"), rounds),
+            # Önbellekte olmayan işlem: sahte sunucu + router + ayrıştırma + kayıt
+            "analyze_uncached": measure(lambda: gemini.analyze_single_process(fresh_info(), "TR"), max(1, rounds // 5), warmup=1),
+            "analyze_batch_10": measure(
+                lambda: gemini.analyze_batch([fresh_info() for _ in range(10)], "TR"), max(1, rounds // 10)
+            ),
+            "api_calls": len(server.calls),
+        }
+        gemini.db.flush()
+        return result
+
+
+def _summary(times):
+    return {"median_ms": round(statistics.median(times), 3), "min_ms": round(min(times), 3),
+            "max_ms": round(max(times), 3), "rounds": len(times)}
+
+
+def run_stream(rounds=5, chunk_size=16, chunk_delay=0.02):
+    """Akışlı analiz: ilk alan (kart) / tüm alanlar / tam sonuç süreleri ve akışsız karşılaştırma."""
+    with tempfile.TemporaryDirectory() as tmp, \
+            FakeGeminiServer(chunk_size=chunk_size, chunk_delay=chunk_delay) as server:
+        gemini = GeminiAnalyzer(db_path=os.path.join(tmp, "process_audit.db"), api_base=server.base_url)
+        gemini.api_key = "bench"
+
+        first, total = [], []
+        for i in range(rounds):
+            start = time.perf_counter()
+            seen = []
+            gemini.analyze_single_process(_info(10_000 + i), "TR", force_refresh=True,
+                                          on_field=lambda k, v: seen.append(time.perf_counter()))
+            total.append((time.perf_counter() - start) * 1000)
+            if seen:
+                first.append((seen[0] - start) * 1000)
+
+        result = {
+            "first_field": _summary(first) if first else None,
+            "stream_total": _summary(total),
+            # Akışsız istek: sunucu tüm metni tek seferde döner (referans)
+            "non_stream_total": measure(
+                lambda: gemini.analyze_single_process(_info(20_000), "TR", force_refresh=True), rounds
+            ),
+        }
+        gemini.db.flush()
+        return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analysis cache / prompt / API benchmark")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="Sahte sunucu gecikmesi (saniye)")
+    parser.add_argument("--stream", action="store_true", help="Sadece akış (SSE) ölçümü")
+    parser.add_argument("--chunk-delay", type=float, default=0.02, help="Akış olayları arası bekleme (saniye)")
+    args = parser.parse_args()
+    if args.stream:
+        print(json.dumps(run_quiet(run_stream, min(args.rounds, 10), chunk_delay=args.chunk_delay), indent=2))
+    else:
+        print(json.dumps(run_quiet(run, args.rows, args.rounds, args.latency), indent=2))
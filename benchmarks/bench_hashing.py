@@ -0,0 +1,126 @@
+"""
+Hash performans karşılaştırması.
+Eski sıralı yöntem (4 KiB okuma, tek thread) ile HashService (büyük tampon/mmap,
+thread havuzu, hash önbelleği) karşılaştırılır.
+
+--sizes ile tek dosya ölçümü: ProcessScanner._calculate_file_hash için önbelleksiz
+ve önbellekten (dosya değişmediğinde) süreler.
+
+Kullanım:
+    python benchmarks/bench_hashing.py --files 16 --size-mb 32 --workers 4
+    python benchmarks/bench_hashing.py --sizes 1,10,100
+"""
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from harness import measure, run_quiet
+
+from core.hash_cache import FileHashCache
+from core.hash_service import HashService
+from core.process_scanner import ProcessScanner
+
+
+def sequential_hash(filepath):
+    """ProcessScanner'ın eski yöntemi (referans)."""
+    sha256_hash = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for byte_block in iter(lambda: f.read(4096), b""):
+            sha256_hash.update(byte_block)
+    return sha256_hash.hexdigest()
+
+
+def make_files(directory, count, size_mb):
+    paths = []
+    block = os.urandom(1024 * 1024)
+    for i in range(count):
+        path = os.path.join(directory, f"bin_{i}.exe")
+        with open(path, "wb") as f:
+            for _ in range(size_mb):
+                f.write(block)
+            f.write(str(i).encode()) # Her dosya farklı olsun
+        paths.append(path)
+    return paths
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def run(files, size_mb, workers):
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_files(tmp, files, size_mb)
+        db_path = os.path.join(tmp, "bench.db")
+
+        t_seq, seq = timed(lambda: {p: sequential_hash(p) for p in paths})
+
+        # Önbelleksiz: saf paralel hash
+        service = HashService(max_workers=workers)
+        t_par, par = timed(lambda: dict(service.hash_many(paths)))
+        service.shutdown()
+
+        # Önbellekli: ilk tur doldurur, ikinci tur sadece stat yapar
+        cached_service = HashService(FileHashCache(db_path), max_workers=workers)
+        dict(cached_service.hash_many(paths))
+        t_warm, warm = timed(lambda: dict(cached_service.hash_many(paths)))
+        cached_service.shutdown()
+
+        assert seq == par == warm, "Hash sonuçları uyuşmuyor!"
+
+        total_mb = files * size_mb
+        return {
+            "files": files,
+            "size_mb": size_mb,
+            "workers": workers,
+            "sequential_s": round(t_seq, 4),
+            "parallel_s": round(t_par, 4),
+            "cached_s": round(t_warm, 4),
+            "sequential_mb_s": round(total_mb / t_seq, 1),
+            "parallel_mb_s": round(total_mb / t_par, 1),
+            "speedup": round(t_seq / t_par, 2),
+        }
+
+
+def run_sizes(sizes_mb=(1, 10, 100), rounds=3):
+    """Tek dosya: önbelleksiz hash ve hash önbelleği isabeti (ms)."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        scanner = ProcessScanner(db_path=os.path.join(tmp, "bench.db"))
+        uncached = HashService()
+        for size_mb in sizes_mb:
+            path = make_files(tmp, 1, size_mb)[0]
+            os.replace(path, path + f".{size_mb}mb")
+            path += f".{size_mb}mb"
+
+            miss = measure(lambda: uncached.hash_file(path), rounds)
+            scanner._calculate_file_hash(path) # Önbelleği doldur
+            hit = measure(lambda: scanner._calculate_file_hash(path), rounds)
+            digest = scanner._calculate_file_hash(path) or ""
+            results[f"{size_mb}mb"] = {
+                "uncached": miss,
+                "cached": hit,
+                "partial": digest.startswith("partial:"),
+                "mb_s": round(size_mb / (miss["median_ms"] / 1000), 1) if miss["median_ms"] else None,
+            }
+        uncached.shutdown()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hash benchmark")
+    parser.add_argument("--files", type=int, default=16)
+    parser.add_argument("--size-mb", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--sizes", type=str, default=None, help="Virgülle ayrılmış MB değerleri (örn. 1,10,100)")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    if args.sizes:
+        sizes = [int(s) for s in args.sizes.split(",") if s]
+        print(json.dumps(run_quiet(run_sizes, sizes, args.rounds), indent=2))
+    else:
+        print(json.dumps(run(args.files, args.size_mb, args.workers), indent=2))
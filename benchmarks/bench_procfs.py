@@ -0,0 +1,69 @@
+"""
+Linux işlem listeleme karşılaştırması.
+- legacy: eski yöntem, psutil.process_iter(['pid','name','memory_info','create_time','username'])
+- psutil: ProcessSnapshot (artımlı, psutil tabanlı)
+- procfs: ProcfsSnapshot (/proc/<pid>/stat doğrudan okunur)
+İlk tarama (soğuk) ve sonraki taramalar (sıcak, sadece güncelleme) ayrı ölçülür.
+--spawn ile binlerce işlemlik bir sistem taklit edilebilir.
+
+Kullanım:
+    python benchmarks/bench_procfs.py --rounds 10 --spawn 2000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from harness import measure
+
+import psutil
+from core.process_snapshot import ProcessSnapshot
+from core.backends.procfs import ProcfsSnapshot
+
+
+def legacy_scan():
+    processes = []
+    for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'create_time', 'username']):
+        try:
+            processes.append(proc.info)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            pass
+    return processes
+
+
+def bench_snapshot(factory, rounds):
+    start = time.perf_counter()
+    snapshot = factory()
+    processes, _ = snapshot.refresh()
+    cold_ms = round((time.perf_counter() - start) * 1000, 2)
+    warm = measure(snapshot.refresh, rounds)
+    return {"processes": len(processes), "cold_ms": cold_ms, "warm": warm}
+
+
+def run(rounds, spawn):
+    children = [subprocess.Popen(["sleep", "600"]) for _ in range(spawn)]
+    try:
+        return {
+            "processes": len(psutil.pids()),
+            "rounds": rounds,
+            "legacy_process_iter": measure(legacy_scan, rounds),
+            "psutil_snapshot": bench_snapshot(ProcessSnapshot, rounds),
+            "procfs_snapshot": bench_snapshot(ProcfsSnapshot, rounds),
+        }
+    finally:
+        for child in children:
+            child.kill()
+        for child in children:
+            child.wait()
+
+
+if __name__ == "__main__":
+    if not os.path.exists("/proc/self/stat"):
+        sys.exit("Bu benchmark Linux /proc gerektirir.")
+    parser = argparse.ArgumentParser(description="Linux /proc enumeration benchmark")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--spawn", type=int, default=0, help="Ölçüm süresince başlatılacak ek (sleep) işlem sayısı")
+    args = parser.parse_args()
+    print(json.dumps(run(args.rounds, args.spawn), indent=2))
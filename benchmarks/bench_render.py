@@ -0,0 +1,114 @@
+"""
+İşlem listesi filtreleme/sıralama ve çizim (filter_process_list yolu).
+Sentetik 1k / 5k / 10k işlemlik listelerle:
+- Arama indeksi + sütunlu tablo ile filtre ve sıralama (App.filter_process_list ile aynı adımlar)
+- Grafik ortam ve customtkinter varsa VirtualProcessList.set_items + çizim
+
+Kullanım:
+    python benchmarks/bench_render.py --sizes 1000,5000,10000 --rounds 10
+"""
+import argparse
+import json
+import random
+
+from harness import measure, run_quiet
+
+from core.process_record import ProcessRecord, format_mb
+from core.process_table import ProcessTable
+from core.search_index import ProcessSearchIndex
+
+NAMES = ["chrome.exe", "svchost.exe", "explorer.exe", "code.exe", "python.exe", "RuntimeBroker.exe"]
+QUERIES = ["", "chr", "chrome", "svc", "12"]
+
+
+def synthetic_records(count, seed=42):
+    rng = random.Random(seed)
+    names = NAMES + [f"app_{i}.exe" for i in range(count // 20)]
+    return [
+        ProcessRecord(
+            4 + i * 4,
+            rng.choice(names),
+            username="bench",
+            create_time=1_700_000_000 + i,
+            rss=rng.randint(1, 2048) * 1024 * 1024,
+            vms=rng.randint(1, 4096) * 1024 * 1024,
+            cpu_percent=rng.random() * 10,
+            ppid=4 + rng.randrange(max(1, i)) * 4 if i else 0,
+        )
+        for i in range(count)
+    ]
+
+
+def filter_pipeline(index, table, query, sort_col, sort_desc):
+    """App.filter_process_list'in arayüz dışı kısmı: arama maskesi + vektörel sıralama."""
+    mask = None
+    if query.strip():
+        mask = table.pid_mask(p.pid for p in index.search(query))
+    return [p for p in table.sorted_records(sort_col, sort_desc, mask) if p.name]
+
+
+def _row_text(proc):
+    return f"{f'[{proc.pid}]'.ljust(7)} {proc.name[:28].ljust(29)} ({format_mb(proc.rss)})"
+
+
+def _tk_list():
+    """Gizli pencerede sanal liste (ekran yoksa None)."""
+    try:
+        import customtkinter as ctk
+        from ui.virtual_list import VirtualProcessList
+        root = ctk.CTk()
+    except Exception:
+        return None, None
+    root.withdraw()
+    widget = VirtualProcessList(root, width=340, height=600, command=lambda p: None, formatter=_row_text)
+    widget.pack(fill="both", expand=True)
+    root.update()
+    return root, widget
+
+
+def run(sizes=(1000, 5000, 10000), rounds=10):
+    root, widget = _tk_list()
+    results = {}
+    for size in sizes:
+        records = synthetic_records(size)
+        entry = {}
+
+        entry["build_index"] = measure(lambda: ProcessSearchIndex().build(records), max(1, rounds // 5))
+        entry["build_table"] = measure(lambda: ProcessTable(records), rounds)
+
+        index = ProcessSearchIndex()
+        index.build(records)
+        table = ProcessTable(records)
+        for query in QUERIES:
+            for sort_col, desc in (("name", False), ("mem", True)):
+                # Her turda yeni sorgu: artımlı daraltma önbelleği devre dışı
+                def step(q=query, c=sort_col, d=desc):
+                    index._invalidate()
+                    filter_pipeline(index, table, q, c, d)
+                entry[f"filter[{query or '*'}]/{sort_col}"] = measure(step, rounds)
+
+        entry["format_rows_visible"] = measure(lambda: [_row_text(p) for p in records[:40]], rounds)
+
+        if widget is not None:
+            display = filter_pipeline(index, table, "", "mem", True)
+
+            def render():
+                widget.set_items(display)
+                root.update_idletasks()
+            entry["render_set_items"] = measure(render, rounds)
+        results[str(size)] = entry
+
+    if root is not None:
+        root.destroy()
+    else:
+        results["render"] = "skipped (customtkinter / ekran yok)"
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Process list filter/render benchmark")
+    parser.add_argument("--sizes", type=str, default="1000,5000,10000")
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    print(json.dumps(run_quiet(run, sizes, args.rounds), indent=2))
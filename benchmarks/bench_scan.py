@@ -0,0 +1,45 @@
+"""
+İşlem listeleme: ProcessScanner.get_running_processes
+İlk tarama (soğuk: tüm işlemler sorgulanır) ve sonraki taramalar (sıcak:
+sadece değişenler) platformun varsayılan arka ucu ve psutil yolu için ölçülür.
+
+Kullanım:
+    python benchmarks/bench_scan.py --rounds 10
+"""
+import argparse
+import json
+import os
+import tempfile
+
+from harness import measure, run_quiet, timed_ms
+
+from core.process_scanner import ProcessScanner
+from core.process_snapshot import ProcessSnapshot
+
+
+def _bench(scanner, rounds):
+    cold_ms, processes = timed_ms(scanner.get_running_processes)
+    return {
+        "snapshot": type(scanner.snapshot).__name__,
+        "processes": len(processes),
+        "cold_ms": cold_ms,
+        "warm": measure(scanner.get_running_processes, rounds),
+    }
+
+
+def run(rounds=10):
+    with tempfile.TemporaryDirectory() as tmp:
+        scanner = ProcessScanner(db_path=os.path.join(tmp, "bench.db"))
+        result = {"default": _bench(scanner, rounds)}
+        if not isinstance(scanner.snapshot, ProcessSnapshot):
+            # Karşılaştırma için psutil tabanlı artımlı tarama
+            scanner.snapshot = ProcessSnapshot()
+            result["psutil"] = _bench(scanner, rounds)
+        return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Process scan benchmark")
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    print(json.dumps(run_quiet(run, args.rounds), indent=2))
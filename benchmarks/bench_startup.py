@@ -0,0 +1,65 @@
+"""
+Açılış süresi ölçümü (time-to-first-paint).
+main.py, CHECKPROCESS_STARTUP_BENCH=1 ile başlatılır; uygulama ilk çizimde
+("first_paint") ve işlem listesi yüklendiğinde ("list_loaded") geçen süreyi
+JSON satırı olarak yazar ve kapanır. Ayrıca süreç başlatmadan itibaren geçen
+duvar saati süresi ölçülür. Grafik ortam (ekran) gerektirir.
+
+Kullanım:
+    python benchmarks/bench_startup.py --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_once(timeout):
+    env = dict(os.environ, CHECKPROCESS_STARTUP_BENCH="1")
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "main.py"], cwd=ROOT, env=env, stdout=subprocess.PIPE, text=True)
+    stages = {}
+    try:
+        for line in proc.stdout:
+            wall_ms = round((time.perf_counter() - start) * 1000, 1)
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            stages[event["stage"]] = {"in_process_ms": event["ms"], "wall_ms": wall_ms}
+            if event["stage"] == "list_loaded":
+                stages["list_loaded"]["processes"] = event.get("processes")
+                break
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+    return stages
+
+
+def summarize(runs, stage, field):
+    values = [r[stage][field] for r in runs if stage in r]
+    if not values:
+        return None
+    return {"median": statistics.median(values), "min": min(values), "max": max(values)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Startup benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    runs = [run_once(args.timeout) for _ in range(args.runs)]
+    result = {
+        "runs": args.runs,
+        "first_paint_wall_ms": summarize(runs, "first_paint", "wall_ms"),
+        "first_paint_in_process_ms": summarize(runs, "first_paint", "in_process_ms"),
+        "list_loaded_wall_ms": summarize(runs, "list_loaded", "wall_ms"),
+        "processes": runs[-1].get("list_loaded", {}).get("processes") if runs else None,
+    }
+    print(json.dumps(result, indent=2))
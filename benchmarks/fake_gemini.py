@@ -0,0 +1,150 @@
+"""
+Yerel sahte Gemini sunucusu (benchmark ve manuel test için).
+generateContent ve streamGenerateContent (?alt=sse) uç noktalarını taklit eder;
+toplu prompt'larda ("- id: N" satırları) her id için bir sonuç içeren JSON dizisi
+döner. Gecikme, akış parça boyu/aralığı ve hatalı modeller ayarlanabilir.
+
+Uygulamayı buna yönlendirmek için:
+    python benchmarks/fake_gemini.py --port 8089 --latency 0.5
+    GEMINI_API_BASE=http://127.0.0.1:8089 python main.py
+
+    python benchmarks/fake_gemini.py --chunk-size 16 --chunk-delay 0.2   # Kartların akışla dolması görünsün
+"""
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_ID_LINE = re.compile(r"- id: (\d+)")
+
+
+def fake_analysis(idx=None):
+    result = {
+        "kimlik": "Sahte analiz (benchmark)",
+        "risk_skoru": "1/10",
+        "guvenlik_analizi": "Yerel sahte sunucu yanıtı.",
+        "bellek_analizi": "Normal",
+        "sonuc": "Güvenli",
+    }
+    if idx is not None:
+        result["id"] = idx
+    return result
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # Keep-alive (gerçek API gibi)
+    disable_nagle_algorithm = True # Başlık ve gövde ayrı yazılır; 40ms ACK gecikmesi olmasın
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        model = self.path.split("/models/", 1)[-1].split(":", 1)[0]
+        with server.lock:
+            server.calls.append(model)
+
+        if server.latency:
+            time.sleep(server.latency)
+        if model in server.fail_models:
+            self._send(500, {"error": {"message": "fake failure"}})
+            return
+
+        prompt = json.loads(body)["contents"][0]["parts"][0]["text"]
+        ids = _ID_LINE.findall(prompt)
+        result = [fake_analysis(int(i)) for i in ids] if ids else fake_analysis()
+        if ":streamGenerateContent" in self.path:
+            self._send_stream(json.dumps(result, ensure_ascii=False, indent=2))
+            return
+        text = json.dumps(result, ensure_ascii=False)
+        if server.chunk_delay:
+            # Akışsız yanıt da aynı üretim süresini bekler (akışla adil karşılaştırma)
+            time.sleep(server.chunk_delay * (len(json.dumps(result, ensure_ascii=False, indent=2)) // max(1, server.chunk_size)))
+        self._send(200, {"candidates": [{"content": {"parts": [{"text": text}]}}]})
+
+    def _send_stream(self, text):
+        """Metni `chunk_size` karakterlik SSE olaylarına böler (chunked transfer, keep-alive korunur)."""
+        server = self.server
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        size = max(1, server.chunk_size)
+        for start in range(0, len(text), size):
+            if start and server.chunk_delay:
+                time.sleep(server.chunk_delay)
+            event = {"candidates": [{"content": {"parts": [{"text": text[start:start + size]}], "role": "model"}}]}
+            data = f"data: {json.dumps(event, ensure_ascii=False)}\r\n\r\n".encode("utf-8")
+            self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send(self, status, payload):
+        out = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+
+class FakeGeminiServer:
+    """
+    with FakeGeminiServer(latency=0.05) as server:
+        GeminiAnalyzer(api_base=server.base_url)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, fail_models=(), chunk_size=64, chunk_delay=0.0):
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency
+        self.httpd.fail_models = set(fail_models)
+        self.httpd.chunk_size = chunk_size    # Akışta olay başına karakter
+        self.httpd.chunk_delay = chunk_delay  # Akışta olaylar arası bekleme (saniye)
+        self.httpd.calls = []
+        self.httpd.lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def calls(self):
+        return list(self.httpd.calls)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-gemini", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake Gemini API server")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0, help="Yanıt gecikmesi (saniye)")
+    parser.add_argument("--fail", action="append", default=[], help="Hep 500 dönecek model adı")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Akış (SSE) olayı başına karakter")
+    parser.add_argument("--chunk-delay", type=float, default=0.0, help="Akış olayları arası bekleme (saniye)")
+    args = parser.parse_args()
+    server = FakeGeminiServer(port=args.port, latency=args.latency, fail_models=args.fail,
+                              chunk_size=args.chunk_size, chunk_delay=args.chunk_delay)
+    print(f"Sahte Gemini: {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
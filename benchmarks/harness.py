@@ -0,0 +1,61 @@
+"""
+Benchmark'ların ortak yardımcıları: süre ölçümü ve sonuç meta verisi.
+Tüm süreler milisaniye cinsindendir.
+"""
+import contextlib
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def measure(fn, rounds=5, warmup=0):
+    """fn'i `rounds` kez çalıştırır; medyan / en küçük / en büyük süre (ms)."""
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(times), 3),
+        "min_ms": round(min(times), 3),
+        "max_ms": round(max(times), 3),
+        "rounds": rounds,
+    }
+
+
+def timed_ms(fn):
+    """Tek çalıştırma: (süre ms, dönüş değeri)"""
+    start = time.perf_counter()
+    result = fn()
+    return round((time.perf_counter() - start) * 1000, 3), result
+
+
+def run_quiet(fn, *args, **kwargs):
+    """Uygulama log'larını (print) stderr'e yönlendirerek çalıştırır; stdout sadece JSON sonuç için."""
+    with contextlib.redirect_stdout(sys.stderr):
+        return fn(*args, **kwargs)
+
+
+def metadata():
+    """Sonuçları sürümler arasında karşılaştırabilmek için ortam bilgisi."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
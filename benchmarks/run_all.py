@@ -0,0 +1,104 @@
+"""
+Tüm benchmark'ları tek seferde çalıştırır ve sonucu tek bir JSON dosyasına yazar.
+--baseline ile önceki bir sonuç dosyasıyla karşılaştırılır; medyanı eşik
+oranından fazla yavaşlayan ölçümler "regressions" altında listelenir.
+
+Kullanım:
+    python benchmarks/run_all.py --output results.json
+    python benchmarks/run_all.py --quick --baseline results.json --output new.json
+    python benchmarks/run_all.py --startup       # Açılış ölçümü de (ekran gerekir)
+
+Tekrarlanabilirlik: sentetik veriler sabit tohumla üretilir, AI çağrıları yerel
+sahte sunucuya (fake_gemini.py) gider; ağ erişimi gerekmez.
+"""
+import argparse
+import json
+import sys
+import traceback
+
+from harness import metadata, run_quiet
+
+import bench_analysis
+import bench_hashing
+import bench_render
+import bench_scan
+
+
+def suites(quick):
+    """(isim, fonksiyon, argümanlar) listesi. --quick: CI için küçük parametreler."""
+    items = [
+        ("scan", bench_scan.run, {"rounds": 3 if quick else 10}),
+        ("hashing", bench_hashing.run_sizes, {"sizes_mb": (1, 10) if quick else (1, 10, 100), "rounds": 3}),
+        ("analysis", bench_analysis.run, {"rows": 1000 if quick else 5000, "rounds": 10 if quick else 50}),
+        ("stream", bench_analysis.run_stream, {"rounds": 3 if quick else 5}),
+        ("render", bench_render.run, {"sizes": (1000,) if quick else (1000, 5000, 10000), "rounds": 3 if quick else 10}),
+    ]
+    if sys.platform.startswith("linux"):
+        import bench_procfs
+        items.append(("procfs", bench_procfs.run, {"rounds": 3 if quick else 10, "spawn": 0}))
+    return items
+
+
+def _medians(node, prefix=""):
+    """İç içe sonuçtan {"yol/ölçüm": medyan_ms} düz sözlüğü."""
+    found = {}
+    if isinstance(node, dict):
+        if "median_ms" in node:
+            found[prefix] = node["median_ms"]
+        for key, value in node.items():
+            found.update(_medians(value, f"{prefix}/{key}" if prefix else key))
+    return found
+
+
+def compare(current, baseline, threshold):
+    old = _medians(baseline.get("results", {}))
+    regressions = []
+    for key, value in _medians(current["results"]).items():
+        before = old.get(key)
+        if before and value > before * threshold and value - before > 0.05: # Gürültü: 50µs altı yok sayılır
+            regressions.append({"metric": key, "baseline_ms": before, "current_ms": value,
+                                "ratio": round(value / before, 2)})
+    return sorted(regressions, key=lambda r: -r["ratio"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run all benchmarks")
+    parser.add_argument("--quick", action="store_true", help="Küçük parametrelerle hızlı tur")
+    parser.add_argument("--only", action="append", default=[], help="Sadece bu paket(ler) (scan, hashing, ...)")
+    parser.add_argument("--output", default=None, help="Sonuç JSON dosyası (varsayılan: stdout)")
+    parser.add_argument("--baseline", default=None, help="Karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument("--threshold", type=float, default=1.2, help="Gerileme eşiği (oran)")
+    parser.add_argument("--startup", action="store_true", help="Açılış ölçümünü de çalıştır (ekran gerekir)")
+    args = parser.parse_args()
+
+    report = {"meta": metadata(), "quick": args.quick, "results": {}, "errors": {}}
+    items = suites(args.quick)
+    if args.startup:
+        import bench_startup
+        items.append(("startup", lambda runs: [bench_startup.run_once(30) for _ in range(runs)], {"runs": 3}))
+
+    for name, fn, kwargs in items:
+        if args.only and name not in args.only:
+            continue
+        print(f"▶ {name}...", file=sys.stderr)
+        try:
+            report["results"][name] = run_quiet(fn, **kwargs)
+        except Exception:
+            report["errors"][name] = traceback.format_exc()
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            report["regressions"] = compare(report, json.load(f), args.threshold)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"✅ Sonuçlar yazıldı: {args.output}", file=sys.stderr)
+    else:
+        print(text)
+    return 1 if report["errors"] or report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
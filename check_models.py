@@ -57,25 +57,9 @@ def check_models():
         print(f"❌ Bağlantı Hatası: {e}")
 
 if __name__ == "__main__":
-    import sys
-    import datetime
+    from core.app_log import install
 
-    class Logger(object):
-        def __init__(self, filename="app_log.txt"):
-            self.log = open(filename, "a", encoding="utf-8")
-    
-        def write(self, message):
-            if message.strip():
-                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                # [ModelCheck] ön ekiyle logla
-                self.log.write(f"[{timestamp}] [ModelCheck] {message.strip()}\n")
-                self.log.flush()
-            
-        def flush(self):
-            self.log.flush()
-
-    # Terminal çıktısını dosyaya yönlendir
-    sys.stdout = Logger()
-    sys.stderr = sys.stdout
+    # Terminal çıktısını dosyaya yönlendir ("source": "ModelCheck" etiketiyle)
+    install("app_log.txt", source="ModelCheck")
 
     check_models()
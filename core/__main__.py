@@ -0,0 +1,4 @@
+import sys
+from core.cli import main
+
+sys.exit(main())
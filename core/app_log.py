@@ -0,0 +1,237 @@
+"""
+Uygulama günlüğü (app_log.txt): arka planda yazan, tamponlu ve dönen (rotating) log.
+
+    from core.app_log import install
+    install()                      # print() çıktıları artık log dosyasına gider
+    log("WARNING", "Kota doldu", model="gemini-2.0-flash")
+
+print() çağrıları sadece kuyruğa ekleme yapar; dosyaya yazma, biçimlendirme ve
+flush tek bir arka plan thread'inde, partiler halinde yapılır. Dosya `max_bytes`
+boyutunu aşınca app_log.txt.1, .2 ... olarak döndürülür (en fazla `backups` adet).
+
+Kayıt biçimi (satır başına bir JSON):
+    {"ts": "2025-01-01T12:00:00.123", "level": "INFO", "thread": "MainThread", "msg": "...", ...}
+CHECKPROCESS_LOG_FORMAT=text ile eski düz metin biçimi, CHECKPROCESS_LOG_LEVEL ile
+en düşük seviye (DEBUG/INFO/WARNING/ERROR) seçilebilir.
+"""
+import atexit
+import datetime
+import json
+import os
+import queue
+import threading
+import time
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+# Mesaj başındaki işaretlere göre seviye (kod tabanı print + emoji kullanıyor)
+_LEVEL_PREFIXES = (
+    ("❌", "ERROR"), ("!!!", "ERROR"), ("⛔", "ERROR"), ("Traceback", "ERROR"),
+    ("⚠️", "WARNING"), ("⚠", "WARNING"),
+)
+
+
+def guess_level(message, default="INFO"):
+    for prefix, level in _LEVEL_PREFIXES:
+        if message.startswith(prefix):
+            return level
+    return default
+
+
+class LogWriter:
+    """
+    Kuyruktaki kayıtları arka planda dosyaya yazar.
+    - Kuyruk sınırlıdır; doluysa kayıt atılır (çağıran thread asla beklemez) ve
+      atılan sayısı bir sonraki partide ayrı bir kayıtla bildirilir.
+    - Bir partide en fazla `batch_size` kayıt yazılır; flush en geç `flush_interval`
+      saniyede bir (veya parti dolunca) yapılır.
+    """
+
+    def __init__(self, filename="app_log.txt", max_bytes=5 * 1024 * 1024, backups=3,
+                 fmt="json", level="INFO", batch_size=256, flush_interval=1.0, max_queue=10000):
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.fmt = fmt
+        self.level = LEVELS.get(str(level).upper(), LEVELS["INFO"])
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._dropped = 0
+        self._file = None
+        self._size = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="app-log", daemon=True)
+        self._thread.start()
+
+    # --- Üretici tarafı (her thread) ---
+    def log(self, level, message, **fields):
+        level = str(level).upper()
+        if self._closed or LEVELS.get(level, LEVELS["INFO"]) < self.level:
+            return
+        record = (time.time(), level, threading.current_thread().name, message, fields)
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self._dropped += 1 # Yaklaşık sayı yeterli (kilit yok)
+
+    def close(self, timeout=2.0):
+        """Kuyruğu boşaltıp dosyayı kapatır (çıkışta atexit ile çağrılır)."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+
+    # --- Yazıcı thread'i ---
+    def _run(self):
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = [first]
+            # Kuyrukta biriken her şeyi tek partide al
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            self._write([r for r in batch if r is not None])
+            if stop:
+                self._close_file()
+                return
+
+    def _write(self, records):
+        if self._dropped:
+            dropped, self._dropped = self._dropped, 0
+            records.append((time.time(), "WARNING", "app-log", f"⚠️ {dropped} log kaydı atıldı (kuyruk dolu)", {}))
+        if not records:
+            return
+        text = "".join(self._format(r) for r in records)
+        size = len(text.encode("utf-8"))
+        try:
+            if self._file is None:
+                self._open()
+            elif self._size + size > self.max_bytes:
+                self._rotate()
+            self._file.write(text)
+            self._file.flush()
+            self._size += size
+        except Exception:
+            pass # Log yazılamıyorsa uygulamayı durdurma
+
+    def _format(self, record):
+        ts, level, thread, message, fields = record
+        stamp = datetime.datetime.fromtimestamp(ts)
+        if self.fmt == "text":
+            return f"[{stamp.strftime('%Y-%m-%d %H:%M:%S')}] {message}\n"
+        data = {"ts": stamp.isoformat(timespec="milliseconds"), "level": level, "thread": thread, "msg": message}
+        if fields:
+            data.update(fields)
+        return json.dumps(data, ensure_ascii=False, default=str) + "\n"
+
+    def _open(self):
+        self._file = open(self.filename, "a", encoding="utf-8")
+        try:
+            self._size = os.path.getsize(self.filename)
+        except OSError:
+            self._size = 0
+        if self._size >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        """app_log.txt -> .1 -> .2 ...; en eski silinir."""
+        self._close_file()
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.filename}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.filename}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.filename, f"{self.filename}.1")
+        else:
+            os.remove(self.filename)
+        self._file = open(self.filename, "a", encoding="utf-8")
+        self._size = 0
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+
+
+class StreamCapture:
+    """
+    sys.stdout / sys.stderr yerine geçer. print() parça parça yazar (mesaj, sonra
+    "\\n"), bu yüzden satırlar thread başına biriktirilir; tamamlanan her satır tek kayıt olur.
+    """
+
+    def __init__(self, writer, default_level="INFO", source=None):
+        self.writer = writer
+        self.default_level = default_level
+        self.source = source
+        self._local = threading.local()
+
+    def write(self, message):
+        buffer = getattr(self._local, "buffer", "") + message
+        if "\n" not in buffer:
+            self._local.buffer = buffer
+            return len(message)
+        *lines, self._local.buffer = buffer.split("\n")
+        for line in lines:
+            self._emit(line)
+        return len(message)
+
+    def _emit(self, line):
+        line = line.strip()
+        if not line:
+            return
+        fields = {"source": self.source} if self.source else {}
+        self.writer.log(guess_level(line, self.default_level), line, **fields)
+
+    def flush(self):
+        # Yarım kalan satır (sonunda \n olmayan write) varsa onu da kaydet
+        buffer = getattr(self._local, "buffer", "")
+        if buffer:
+            self._local.buffer = ""
+            self._emit(buffer)
+
+    def isatty(self):
+        return False
+
+
+_writer = None
+
+
+def install(filename="app_log.txt", source=None, **options):
+    """
+    stdout/stderr'i log dosyasına yönlendirir ve yazıcıyı döner.
+    source: her kayda eklenen kaynak etiketi (örn. "ModelCheck").
+    """
+    global _writer
+    options.setdefault("fmt", os.environ.get("CHECKPROCESS_LOG_FORMAT", "json"))
+    options.setdefault("level", os.environ.get("CHECKPROCESS_LOG_LEVEL", "INFO"))
+    _writer = LogWriter(filename, **options)
+
+    import sys
+    sys.stdout = StreamCapture(_writer, "INFO", source)
+    sys.stderr = StreamCapture(_writer, "ERROR", source) # Traceback'ler ve uyarılar
+    atexit.register(_writer.close)
+    return _writer
+
+
+def log(level, message, **fields):
+    """Yapılandırılmış kayıt (ek alanlar JSON'a eklenir). install() çağrılmadıysa print edilir."""
+    if _writer is None:
+        print(message)
+        return
+    _writer.log(level, message, **fields)
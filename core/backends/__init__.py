@@ -0,0 +1,26 @@
+import sys
+
+_instance = None
+
+
+def _create(platform):
+    # Statik import'lar (PyInstaller modülleri görebilsin); yine de sadece ilgili
+    # platformun modülü yüklenir (örn. Linux'ta pywin32 hiç import edilmez).
+    if platform == "win32":
+        from core.backends.windows import WindowsBackend
+        return WindowsBackend()
+    from core.backends.linux import LinuxBackend
+    return LinuxBackend()
+
+
+def get_backend(platform=None):
+    """Çalışılan platform için tarayıcı arka ucunu (tekil örnek) döner."""
+    global _instance
+    if platform is None and _instance is not None:
+        return _instance
+
+    backend = _create(platform or sys.platform)
+
+    if platform is None:
+        _instance = backend
+    return backend
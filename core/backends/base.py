@@ -0,0 +1,26 @@
+from core.process_snapshot import ProcessSnapshot
+
+
+class ScannerBackend:
+    """
+    ProcessScanner'ın platforma bağlı kısımları:
+    işlem listeleme, ikon çıkarma, imza kontrolü ve "dosya konumunu aç".
+    """
+
+    name = "base"
+
+    def create_snapshot(self):
+        """Artımlı işlem tablosu (varsayılan: psutil tabanlı)."""
+        return ProcessSnapshot()
+
+    def get_file_icon(self, path):
+        """Dosyanın ikonunu PIL Image olarak döner; desteklenmiyorsa None."""
+        return None
+
+    def create_signature_backend(self):
+        """core.signature.SignatureBackend örneği."""
+        raise NotImplementedError
+
+    def open_location(self, path):
+        """Dosyayı sistemin dosya yöneticisinde gösterir."""
+        raise NotImplementedError
@@ -0,0 +1,28 @@
+import os
+import subprocess
+from core.backends.base import ScannerBackend
+from core.signature import ChecksumManifestBackend
+
+
+class LinuxBackend(ScannerBackend):
+    """
+    Linux (sunucu/collector): /proc'u doğrudan okuyan hızlı listeleme (procfs),
+    checksum manifesti ile imza kontrolü. pywin32 veya Tk gerektirmez; ikon
+    desteği yoktur. CHECKPROCESS_PROCFS=0 ile psutil yoluna dönülür.
+    """
+
+    name = "linux"
+
+    def create_snapshot(self):
+        if os.environ.get("CHECKPROCESS_PROCFS", "1") != "0" and os.path.exists("/proc/self/stat"):
+            from core.backends.procfs import ProcfsSnapshot
+            return ProcfsSnapshot()
+        return super().create_snapshot()
+
+    def create_signature_backend(self):
+        manifests = [m for m in os.environ.get("CHECKPROCESS_MANIFESTS", "").split(os.pathsep) if m]
+        return ChecksumManifestBackend(manifests)
+
+    def open_location(self, path):
+        # Masaüstü ortamı varsa klasörü aç (sunucuda sessizce başarısız olur)
+        subprocess.Popen(["xdg-open", os.path.dirname(path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
@@ -0,0 +1,189 @@
+import os
+import pwd
+import time
+import psutil
+from core.process_record import ProcessRecord
+
+CLK_TCK = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+# /proc/<pid>/stat içinde ")" sonrası alan sıraları (man 5 proc, 3. alandan başlayarak)
+_STATE, _PPID, _UTIME, _STIME, _STARTTIME, _VSIZE, _RSS = 0, 1, 11, 12, 19, 20, 21
+
+
+class ProcfsSnapshot:
+    """
+    Linux hızlı yolu: ProcessSnapshot ile aynı arayüz, psutil yerine /proc'u
+    doğrudan okur.
+    - Bilinen işlemler için sadece /proc/<pid>/stat okunur (open + read + close).
+      PPID, CPU süresi, başlangıç zamanı, VSZ ve RSS bu tek dosyadadır.
+    - Okuma için tek bir tampon yeniden kullanılır (os.readv).
+    - Kullanıcı adı sadece yeni işlemler için (status'taki gerçek uid),
+      uid -> isim önbelleğiyle çözülür.
+    - Tam isim (15 karakterden uzunsa cmdline) sadece yeni işlemlerde okunur.
+    """
+
+    def __init__(self, proc_root="/proc"):
+        self.proc_root = proc_root
+        self.table = {}    # (pid, create_time) -> ProcessRecord
+        self._keys = {}    # pid -> (pid, create_time)
+        self._cpu = {}     # pid -> (toplam CPU tick, ölçüm zamanı)
+        self._psutil = {}  # pid -> psutil.Process (kaynak geçmişi için, ilk istekte)
+        self._users = {}   # uid -> kullanıcı adı
+        self._sorted = None
+        self._buf = bytearray(4096)
+        self._boot_time = self._read_boot_time()
+
+    def _read_boot_time(self):
+        with open(os.path.join(self.proc_root, "stat"), "rb") as f:
+            for line in f:
+                if line.startswith(b"btime"):
+                    return float(line.split()[1])
+        return psutil.boot_time()
+
+    def _read_stat(self, pid):
+        """(isim, alanlar) — alanlar ")" sonrası bölünmüş bytes listesi."""
+        fd = os.open(f"{self.proc_root}/{pid}/stat", os.O_RDONLY)
+        try:
+            n = os.readv(fd, [self._buf])
+        finally:
+            os.close(fd)
+        buf = self._buf
+        # İsim parantez ve boşluk içerebilir: son ")" ayırıcıdır
+        end = buf.rfind(b")", 0, n)
+        name = buf[buf.find(b"(") + 1:end].decode("utf-8", "replace")
+        return name, buf[end + 2:n].split()
+
+    def refresh(self, on_progress=None, chunk_size=256):
+        """ProcessSnapshot.refresh ile aynı: (isme göre sıralı liste, diff)"""
+        diff = {"added": [], "removed": [], "updated": []}
+        now = time.monotonic()
+        seen = set()
+
+        for entry in os.listdir(self.proc_root):
+            if not entry.isdigit():
+                continue
+            pid = int(entry)
+            try:
+                name, fields = self._read_stat(pid)
+            except OSError:
+                continue # Bu arada kapandı
+            if fields[_STATE] == b"Z":
+                continue # Zombi: psutil yolunda da listelenmez
+
+            create_time = self._boot_time + int(fields[_STARTTIME]) / CLK_TCK
+            ticks = int(fields[_UTIME]) + int(fields[_STIME])
+            rss = int(fields[_RSS]) * PAGE_SIZE
+            vms = int(fields[_VSIZE])
+            ppid = int(fields[_PPID])
+            seen.add(pid)
+
+            key = self._keys.get(pid)
+            if key is not None and key[1] != create_time:
+                self._drop(pid, diff) # PID yeniden kullanılmış
+                key = None
+
+            if key is not None:
+                record = self.table[key]
+                record.cpu_percent = self._cpu_percent(pid, ticks, now)
+                if rss != record.rss or ppid != record.ppid:
+                    record.rss = rss
+                    record.vms = vms
+                    record.ppid = ppid
+                    diff["updated"].append(record)
+                continue
+
+            record = ProcessRecord(
+                pid,
+                self._full_name(pid, name),
+                username=self._username(pid),
+                create_time=create_time,
+                rss=rss,
+                vms=vms,
+                cpu_percent=0.0, # İlk ölçüm referanstır (psutil ile aynı)
+                ppid=ppid,
+            )
+            self._cpu[pid] = (ticks, now)
+            key = record.key
+            self.table[key] = record
+            self._keys[pid] = key
+            diff["added"].append(record)
+            if on_progress and len(diff["added"]) % chunk_size == 0:
+                on_progress(list(diff["added"]))
+
+        for pid in [p for p in self._keys if p not in seen]:
+            self._drop(pid, diff)
+
+        if diff["added"] or diff["removed"]:
+            self._sorted = None
+        if self._sorted is None:
+            self._sorted = sorted(self.table.values(), key=lambda x: x.name.lower())
+
+        return list(self._sorted), diff
+
+    def _cpu_percent(self, pid, ticks, now):
+        last_ticks, last_time = self._cpu.get(pid, (ticks, now))
+        self._cpu[pid] = (ticks, now)
+        elapsed = now - last_time
+        if elapsed <= 0:
+            return 0.0
+        return round((ticks - last_ticks) / CLK_TCK / elapsed * 100, 1)
+
+    def _full_name(self, pid, comm):
+        # Çekirdek comm'u 15 karakterde keser; psutil gibi cmdline'dan tamamla
+        if len(comm) < 15:
+            return comm
+        try:
+            with open(f"{self.proc_root}/{pid}/cmdline", "rb") as f:
+                argv0 = f.read().split(b"\x00", 1)[0].decode("utf-8", "replace")
+        except OSError:
+            return comm
+        base = os.path.basename(argv0)
+        return base if base.startswith(comm) else comm
+
+    def _real_uid(self, pid):
+        """status dosyasındaki "Uid:" satırının ilk alanı (gerçek uid; psutil de bunu kullanır)."""
+        with open(f"{self.proc_root}/{pid}/status", "rb") as f:
+            for line in f:
+                if line.startswith(b"Uid:"):
+                    return int(line.split()[1])
+        raise OSError(f"Uid satırı yok: {pid}")
+
+    def _username(self, pid):
+        # /proc/<pid> sahibi etkin uid'dir (setuid/yetki düşüren işlemlerde farklı)
+        try:
+            uid = self._real_uid(pid)
+        except (OSError, ValueError):
+            return None
+        name = self._users.get(uid)
+        if name is None:
+            try:
+                name = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                name = str(uid) # psutil ile aynı davranış
+            self._users[uid] = name
+        return name
+
+    def processes(self):
+        """Canlı işlemler: [(ProcessRecord, psutil.Process), ...] (psutil nesneleri ilk istekte oluşur)"""
+        result = []
+        for pid, key in list(self._keys.items()):
+            record = self.table.get(key)
+            if record is None:
+                continue
+            proc = self._psutil.get(pid)
+            if proc is None:
+                try:
+                    proc = self._psutil[pid] = psutil.Process(pid)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            result.append((record, proc))
+        return result
+
+    def _drop(self, pid, diff):
+        key = self._keys.pop(pid)
+        self._cpu.pop(pid, None)
+        self._psutil.pop(pid, None)
+        record = self.table.pop(key, None)
+        if record is not None:
+            diff["removed"].append(record)
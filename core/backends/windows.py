@@ -0,0 +1,91 @@
+import os
+import subprocess
+from core.backends.base import ScannerBackend
+from core.signature import PowerShellSignatureBackend
+
+
+class WindowsBackend(ScannerBackend):
+    """Windows: pywin32 ile ikon, PowerShell ile Authenticode imza, Explorer ile konum."""
+
+    name = "windows"
+
+    def get_file_icon(self, path):
+        """
+        Dosya ikonunu alır. Önce ExtractIconEx (daha hızlı/uyumlu) dener,
+        olmazsa SHGetFileInfo (daha kapsamlı) dener.
+        """
+        try:
+            # pywin32 ve PIL sadece ikon gerektiğinde yüklenir
+            import win32ui
+            import win32gui
+            import win32con
+            from PIL import Image
+
+            # YÖNTEM 1: ExtractIconEx (Eski ve güvenilir yöntem)
+            hicon = None
+            try:
+                large, small = win32gui.ExtractIconEx(path, 0)
+                if large:
+                    hicon = large[0]
+                    # small varsa temizle
+                    if small: win32gui.DestroyIcon(small[0])
+                    # large'ın geri kalanını temizle
+                    for h in large[1:]: win32gui.DestroyIcon(h)
+                elif small:
+                    hicon = small[0]
+                    for h in small[1:]: win32gui.DestroyIcon(h)
+            except:
+                pass
+
+            # YÖNTEM 2: SHGetFileInfo (Yedek)
+            if not hicon:
+                try:
+                    flags = win32con.SHGFI_ICON | win32con.SHGFI_LARGEICON
+                    retval, info = win32gui.SHGetFileInfo(path, 0, flags)
+                    if info and info[0]:
+                        hicon = info[0]
+                except:
+                    pass
+
+            if not hicon:
+                return None
+
+            # HICON -> PIL Image Dönüştürme
+            hdc = win32ui.CreateDCFromHandle(win32gui.GetDC(0))
+            hbmp = win32ui.CreateBitmap()
+            hbmp.CreateCompatibleBitmap(hdc, 32, 32)
+            
+            hdc_mem = hdc.CreateCompatibleDC()
+            hdc_mem.SelectObject(hbmp)
+            
+            # Çiz
+            win32gui.DrawIconEx(hdc_mem.GetHandleOutput(), 0, 0, hicon, 32, 32, 0, 0, 3) 
+
+            # Bitmap verisini al
+            bmpinfo = hbmp.GetInfo()
+            bmpstr = hbmp.GetBitmapBits(True)
+            
+            img = Image.frombuffer(
+                'RGB',
+                (bmpinfo['bmWidth'], bmpinfo['bmHeight']),
+                bmpstr, 'raw', 'BGRX', 0, 1)
+
+            img = img.copy()
+            
+            # Temizlik
+            win32gui.DestroyIcon(hicon)
+            win32gui.DeleteObject(hbmp.GetHandle())
+            hdc_mem.DeleteDC()
+            hdc.DeleteDC()
+            
+            return img
+
+        except Exception:
+            return None
+
+    def create_signature_backend(self):
+        return PowerShellSignatureBackend()
+
+    def open_location(self, path):
+        # Dosya gezgininde seçili olarak aç
+        subprocess.Popen(f'explorer /select,"{os.path.normpath(path)}"')
@@ -0,0 +1,184 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from core.tracing import tracer
+
+
+class RateLimiter:
+    """Basit hız sınırlayıcı: iki çağrı arasında en az `60 / per_minute` saniye bekletir."""
+
+    def __init__(self, per_minute=30):
+        self.interval = 60.0 / per_minute if per_minute else 0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self, cancel_event=None):
+        """Sıra gelene kadar bekler. İptal edilirse False döner."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            if cancel_event is not None:
+                return not cancel_event.wait(delay)
+            time.sleep(delay)
+        return True
+
+
+class BatchAnalyzer:
+    """
+    Çok sayıda işlemi toplu analiz eder (Filo denetimi).
+    1. İşlemler dosya yoluna göre tekilleştirilir (50 svchost = 1 analiz).
+    2. Her dosya için önce hash alınır; önbellekte varsa anında döner.
+    3. Kalanların imzası tek bir toplu sorguyla alınır.
+    4. Aynı hash'e sahip dosyalar birleştirilir ve AI'ya `batch_size`'lık
+       partiler halinde (tek prompt) gönderilir.
+    Adımlar sınırlı bir thread havuzunda, dakikalık istek sınırına uyularak
+    çalışır. İlerleme `progress` geri çağrısıyla bildirilir, `cancel()` ile durdurulabilir.
+    """
+
+    def __init__(self, scanner, gemini, max_workers=4, requests_per_minute=30, batch_size=10):
+        self.scanner = scanner
+        self.gemini = gemini
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.limiter = RateLimiter(requests_per_minute)
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def group_by_path(self, processes):
+        """İşlemleri (ProcessRecord) çalıştırılabilir dosya yoluna göre gruplar. {path: [proc, ...]}"""
+        groups = {}
+        for proc in processes:
+            path = proc.path or self.scanner.get_process_path(proc.pid)
+            if not path:
+                continue # Erişim yok / sistem işlemi
+            groups.setdefault(path, []).append(proc)
+        return groups
+
+    def run(self, processes, lang="TR", force_refresh=False, progress=None):
+        """
+        Toplu analizi çalıştırır (bloklar; arayüzden ayrı thread'de çağrılmalı).
+        progress(done, total, item): her dosya tamamlandığında çağrılır.
+        Dönüş: [{"path", "name", "pids", "hash", "cached", "result"}, ...]
+        """
+        self.cancel_event.clear()
+        groups = self.group_by_path(processes)
+        total = len(groups)
+        results = []
+        state = {"done": 0}
+
+        def finish(item):
+            # item None ise dosya analiz edilemedi (hata/erişim yok); ilerleme yine de sayılır
+            state["done"] += 1
+            if item is not None:
+                results.append(item)
+            if progress:
+                progress(state["done"], total, item)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # --- Aşama 1: Hash (paralel, aynı dosya tek sefer) + önbellek ---
+            misses = {} # içerik anahtarı -> [(item, proc), ...]
+            for path, digest in self.scanner.calculate_hashes(groups):
+                if self.cancelled:
+                    break
+                try:
+                    item, proc = self._prepare(path, groups[path], digest, lang, force_refresh)
+                except Exception as e:
+                    print(f"⚠️ Toplu Analiz Hatası: {e}")
+                    item = None
+                if item is None or item["result"] is not None:
+                    finish(item) # Önbellekten (veya hatalı): hemen bildir
+                else:
+                    # Aynı hash'e sahip farklı yollardaki dosyalar tek kez analiz edilsin
+                    misses.setdefault(item["hash"] or item["path"], []).append((item, proc))
+
+            # --- Aşama 2: İmzalar (tek worker'a toplu sorgu) ---
+            if misses and not self.cancelled:
+                with tracer.span("batch.signatures", files=len(misses)):
+                    signatures = self.scanner.get_file_signatures(
+                        [(proc['path'], proc.get('hash')) for group in misses.values() for _, proc in group[:1]]
+                    )
+                for group in misses.values():
+                    for _, proc in group:
+                        proc["signature"] = signatures.get(proc['path'], "Bilinmiyor")
+
+            # --- Aşama 3: AI (partiler halinde, hız sınırlı) ---
+            keys = list(misses)
+            chunks = [keys[i:i + self.batch_size] for i in range(0, len(keys), self.batch_size)]
+            futures = [] if self.cancelled else [
+                pool.submit(self._analyze_chunk, [misses[k] for k in chunk], lang, force_refresh)
+                for chunk in chunks
+            ]
+            for future in as_completed(futures):
+                try:
+                    entries = future.result()
+                except Exception as e:
+                    print(f"⚠️ Toplu Analiz Hatası: {e}")
+                    entries = []
+                for item in entries:
+                    finish(item)
+                if self.cancelled:
+                    # Başlamamış işleri iptal et (çalışanlar kendi kontrolünde durur)
+                    for f in futures:
+                        f.cancel()
+                    break
+
+        print(f"📊 Toplu Analiz: {len(results)}/{total} dosya ({sum(1 for r in results if r['cached'])} önbellekten)")
+        return results
+
+    def _prepare(self, path, procs, digest, lang, force_refresh):
+        """Hash'i hesaplanmış dosya için önbelleğe bakar; bulunamazsa AI için hazırlar."""
+        if self.cancelled:
+            return None, None
+        proc = procs[0].to_info()
+        item = {
+            "path": path,
+            "name": proc.get('name'),
+            "pids": [p.pid for p in procs],
+            "hash": None,
+            "cached": False,
+            "result": None,
+        }
+
+        # A) Önbellek (ucuz yol); hash HashService'ten gelir
+        with tracer.span("batch.prepare"):
+            proc.update({"path": path, "hash": digest, "signature": "-"})
+            item["hash"] = digest
+            if not force_refresh:
+                cached = self.gemini.get_cached_analysis(proc, lang)
+                if cached:
+                    item["cached"] = True
+                    item["result"] = cached
+                    return item, proc
+
+        # İmza, tüm önbellek dışı dosyalar için sonradan tek seferde alınır
+        return item, proc
+
+    def _analyze_chunk(self, groups, lang, force_refresh):
+        """Bir partiyi tek AI isteğiyle analiz eder. groups: [[(item, proc), ...], ...]"""
+        if self.cancelled:
+            return []
+        infos = [group[0][1] for group in groups]
+        # Sınırlayıcı her HTTP isteğinde çağrılır (bölünmüş tekrarlar ve yedek modeller dahil)
+        acquire = lambda: self.limiter.wait(self.cancel_event)
+        with tracer.span("batch.chunk", files=len(infos)):
+            # Önbellek 1. aşamada sorgulandı ve sayıldı; tekrar kontrol metriklere yansımaz
+            analyses = self.gemini.analyze_batch(infos, lang=lang, batch_size=len(infos),
+                                                 force_refresh=force_refresh, acquire=acquire, count_cache=False)
+        if self.cancelled:
+            return []
+
+        entries = []
+        for group, analysis in zip(groups, analyses):
+            for item, _ in group:
+                item["result"] = analysis
+                entries.append(item)
+        return entries
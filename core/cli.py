@@ -0,0 +1,252 @@
+"""
+Arayüzsüz (headless) giriş noktası: sunucularda tarama ve analiz.
+
+Örnekler:
+    python -m core scan                       # Tek seferlik liste (tablo)
+    python -m core scan --json                # NDJSON çıktı
+    python -m core scan --analyze --json      # Tara + AI analizi
+    python -m core scan --analyze --interval 300 --json   # Daemon modu
+    python -m core scan --sort mem --top 10   # En çok bellek kullanan 10 işlem
+    python -m core scan --group               # İsme göre toplam bellek (örn. tüm chrome)
+    python -m core scan --tree                # Ebeveyn/çocuk ağacı + alt ağaç toplamları
+    python -m core scan --subtree 1234 --analyze   # Bir işlem ve tüm alt işlemlerini analiz et
+    python -m core scan --analyze --interval 300 --metrics metrics.prom  # Prometheus metrikleri
+
+customtkinter / Tk import edilmez.
+"""
+import argparse
+import json
+import signal
+import sys
+import threading
+import time
+from core.process_record import format_mb
+from core.tracing import tracer
+
+
+def _process_record(proc):
+    """İşlem kaydını (ProcessRecord) JSON'a uygun sözlüğe çevirir."""
+    return {
+        "pid": proc.pid,
+        "ppid": proc.ppid,
+        "name": proc.name,
+        "username": proc.username,
+        "create_time": proc.create_time,
+        "rss": proc.rss,
+        "vms": proc.vms,
+        "cpu_percent": proc.cpu_percent,
+        "memory_mb": format_mb(proc.rss),
+    }
+
+
+class NdjsonWriter:
+    """Her olayı tek satır JSON olarak yazar ve hemen flush eder (akış için)."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def emit(self, event_type, **fields):
+        line = json.dumps({"type": event_type, "ts": round(time.time(), 3), **fields}, ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+
+def _print_table(out, processes):
+    out.write(f"{'PID':>7}  {'İSİM':<32} {'BELLEK':>12}\n")
+    for proc in processes:
+        out.write(f"{proc.pid:>7}  {str(proc.name)[:32]:<32} {format_mb(proc.rss):>12}\n")
+    out.flush()
+
+
+def _print_groups(out, groups):
+    out.write(f"{'ADET':>5}  {'İSİM':<32} {'TOPLAM BELLEK':>14}\n")
+    for group in groups:
+        out.write(f"{group['count']:>5}  {group['name'][:32]:<32} {format_mb(group['rss']):>14}\n")
+    out.flush()
+
+
+def _print_tree(out, rows, totals):
+    out.write(f"{'PID':>7}  {'İSİM':<40} {'BELLEK':>12} {'ALT AĞAÇ':>12} {'ADET':>5}\n")
+    for proc, depth in rows:
+        total = totals.get(proc.pid, {})
+        name = ("  " * depth + str(proc.name))[:40]
+        out.write(f"{proc.pid:>7}  {name:<40} {format_mb(proc.rss):>12} "
+                  f"{format_mb(total.get('rss')):>12} {total.get('count', 1):>5}\n")
+    out.flush()
+
+
+def _select(processes, args):
+    """Filtre + sıralama + ilk-N (sütunlu tablo üzerinde)."""
+    from core.process_table import ProcessTable
+    table = ProcessTable(processes)
+    mask = table.name_mask(args.filter) if args.filter else None
+    if args.top:
+        rows = table.top(args.sort, args.top, mask, descending=args.sort != "name")
+    else:
+        rows = table.argsort(args.sort, args.sort != "name", mask)
+    return table, mask, table.take(rows)
+
+
+def _matches(proc, name_filter):
+    return not name_filter or name_filter in (proc.name or '').lower()
+
+
+def run_scan(args, out):
+    # Ağır modüller sadece gerekirse yüklenir (örn. --analyze yoksa requests yüklenmez)
+    from core.process_scanner import ProcessScanner
+
+    scanner = ProcessScanner(db_path=args.db)
+    writer = NdjsonWriter(out) if args.json else None
+    gemini = batch = None
+    if args.analyze:
+        from core.gemini_api import GeminiAnalyzer
+        from core.batch_analyzer import BatchAnalyzer
+        gemini = GeminiAnalyzer(db_path=args.db)
+        if args.api_key:
+            gemini.api_key = args.api_key
+        batch = BatchAnalyzer(scanner, gemini, max_workers=args.workers, requests_per_minute=args.rpm)
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: (stop.set(), batch and batch.cancel()))
+
+    first = True
+    while not stop.is_set():
+        all_processes, diff = scanner.get_process_changes()
+        table, mask, processes = _select(all_processes, args)
+
+        tree = None
+        if args.tree or args.subtree:
+            from core.process_tree import ProcessTree
+            tree = ProcessTree()
+            tree.build(all_processes)
+            if args.subtree:
+                keep = {p.pid for p in tree.subtree(args.subtree)}
+                processes = [p for p in processes if p.pid in keep]
+
+        # İlk turda tam liste, sonraki turlarda sadece değişiklikler
+        if first:
+            targets = processes
+            if args.group:
+                groups = table.group_by_name(mask)
+                if writer:
+                    for group in groups:
+                        writer.emit("group", **group)
+                else:
+                    _print_groups(out, groups)
+            elif args.tree:
+                # Kardeşler --sort sırasında; filtre varsa eşleşenler ve ataları
+                filtered = args.filter or args.top or args.subtree
+                rows = tree.flatten(table.sorted_records(args.sort, args.sort != "name"),
+                                    [p.pid for p in processes] if filtered else None)
+                totals = tree.totals()
+                if writer:
+                    for proc, depth in rows:
+                        total = totals.get(proc.pid, {})
+                        writer.emit("process", depth=depth, subtree_rss=total.get("rss"),
+                                    subtree_count=total.get("count"), **_process_record(proc))
+                else:
+                    _print_tree(out, rows, totals)
+            elif writer:
+                for proc in processes:
+                    writer.emit("process", **_process_record(proc))
+            else:
+                _print_table(out, processes)
+        else:
+            targets = [p for p in diff["added"] if _matches(p, args.filter)]
+            if args.subtree:
+                targets = [p for p in targets if p.pid in keep]
+            if writer:
+                for proc in targets:
+                    writer.emit("added", **_process_record(proc))
+                for proc in diff["removed"]:
+                    if _matches(proc, args.filter):
+                        writer.emit("removed", pid=proc.pid, name=proc.name)
+            elif targets:
+                _print_table(out, targets)
+
+        if batch and targets:
+            def progress(done, total, item):
+                if item is None:
+                    return
+                if writer:
+                    writer.emit("analysis", path=item["path"], name=item["name"], pids=item["pids"],
+                                hash=item["hash"], cached=item["cached"], result=item["result"])
+                else:
+                    result = item["result"] or {}
+                    out.write(f"[{done}/{total}] {item['name']}: {result.get('risk_skoru', '?')} - {result.get('sonuc', '')}\n")
+                    out.flush()
+
+            batch.run(targets, lang=args.lang, force_refresh=args.force, progress=progress)
+
+        if args.metrics:
+            _write_metrics(args.metrics)
+        first = False
+        if not args.interval:
+            break
+        stop.wait(args.interval)
+
+    if gemini:
+        gemini.db.flush()
+    return 0
+
+
+def _write_metrics(path):
+    """İzleme verisini yazar (.prom: Prometheus metin biçimi, diğerleri: JSON).
+    Önce geçici dosyaya yazılır; node_exporter textfile toplayıcısı yarım dosya görmez."""
+    text = tracer.to_prometheus() if path.endswith(".prom") else tracer.to_json()
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        import os
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"⚠️ Metrik dosyası yazılamadı: {e}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m core", description="AI Process Manager (headless)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    scan = sub.add_parser("scan", help="İşlemleri tara (ve isteğe bağlı analiz et)")
+    scan.add_argument("--analyze", action="store_true", help="Her çalıştırılabilir dosyayı AI ile analiz et")
+    scan.add_argument("--json", action="store_true", help="NDJSON çıktı (satır başına bir olay)")
+    scan.add_argument("--interval", type=float, default=0, help="Daemon modu: N saniyede bir tekrar tara")
+    scan.add_argument("--filter", type=str.lower, default="", help="İsme göre filtre (içerir)")
+    scan.add_argument("--sort", choices=["name", "mem", "cpu", "pid"], default="name",
+                      help="Sıralama (name dışındakiler azalan)")
+    scan.add_argument("--top", type=int, default=0, help="Sadece ilk N işlem")
+    scan.add_argument("--group", action="store_true", help="İsme göre grupla (adet + toplam bellek)")
+    scan.add_argument("--tree", action="store_true", help="Ebeveyn/çocuk ağacı olarak göster")
+    scan.add_argument("--subtree", type=int, default=None, metavar="PID",
+                      help="Sadece bu işlem ve alt işlemleri (analiz dahil)")
+    scan.add_argument("--lang", choices=["TR", "EN"], default="TR")
+    scan.add_argument("--force", action="store_true", help="Önbelleği atla")
+    scan.add_argument("--workers", type=int, default=4)
+    scan.add_argument("--rpm", type=int, default=30, help="Dakikalık AI istek sınırı")
+    scan.add_argument("--db", default="process_audit.db")
+    scan.add_argument("--api-key", default=None, help="Kayıtlı anahtar yerine bunu kullan")
+    scan.add_argument("--metrics", default=None, metavar="PATH",
+                      help="Her turdan sonra izleme metriklerini yaz (.prom: Prometheus, aksi halde JSON)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    # Kütüphane print'leri (log) stderr'e; stdout sadece sonuç akışı için
+    out = sys.stdout
+    sys.stdout = sys.stderr
+    try:
+        if args.command == "scan":
+            return run_scan(args, out)
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # Çıktı kapatıldı (örn. "| head"); sessizce çık
+        return 0
+    finally:
+        sys.stdout = out
+    return 1
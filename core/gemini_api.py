@@ -1,18 +1,37 @@
-import requests
 import json
-import time
-import sqlite3
+import os
 import threading
+import time
 from datetime import datetime
+from core.storage import Database
+from core.process_record import format_mb
+from core.tracing import tracer
+from core.json_stream import JsonFieldStream
+from core.hash_service import PARTIAL_PREFIX
+
+# requests / asyncio ilk API çağrısında yüklenir (Açılış süresi kısalsın)
+
+# Prompt metni değiştiğinde artırılmalı (eski analizler otomatik geçersiz olur)
+PROMPT_VERSION = 1
+
+# Gerçek uç nokta; testlerde yerel sahte sunucuya yönlendirmek için GEMINI_API_BASE kullanılabilir
+DEFAULT_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
 
 class GeminiAnalyzer:
-    def __init__(self):
-        # SQL Veritabanı
-        self.db_path = "process_audit.db"
+    def __init__(self, db_path="process_audit.db", api_base=None):
+        # SQL Veritabanı (Uzun ömürlü ortak bağlantı)
+        self.db_path = db_path
+        self.db = Database.shared(db_path)
         self._init_db()
         
         # API Anahtarını Veritabanından Yükle
         self.api_key = self.get_saved_api_key()
+
+        # HTTP katmanı: Keep-alive bağlantı havuzu (her istekte TLS el sıkışması olmasın)
+        self.api_base = (api_base or os.environ.get("GEMINI_API_BASE") or DEFAULT_API_BASE).rstrip("/")
+        self._session = None
+        self._router = None
+        self._lazy_lock = threading.Lock()
         
         # Modeller (Sırasıyla denenecek)
         self.models = [
@@ -22,46 +41,143 @@ class GeminiAnalyzer:
             "gemini-1.5-flash"
         ]
 
-    def _connect_db(self):
-        return sqlite3.connect(self.db_path)
+    @property
+    def session(self):
+        """Keep-alive HTTP oturumu (ilk kullanımda oluşturulur)."""
+        if self._session is None:
+            with self._lazy_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    @property
+    def router(self):
+        """Model yönlendirici: hedging + devre kesici + gecikme istatistikleri (ilk kullanımda)."""
+        if self._router is None:
+            with self._lazy_lock:
+                if self._router is None:
+                    from core.model_router import AsyncModelRouter
+                    # Hedging isteğe bağlı (her hedge ayrı ücretli çağrı): GEMINI_HEDGE=1
+                    self._router = AsyncModelRouter(self._call_api, self.models,
+                                                    hedge=os.environ.get("GEMINI_HEDGE") == "1")
+        return self._router
+
+    @staticmethod
+    def _create_session(pool_size=8):
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({'Content-Type': 'application/json'})
+        return session
 
     def _init_db(self):
         try:
-            conn = self._connect_db()
-            cursor = conn.cursor()
-            # Analiz tablosu
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS process_analysis (
-                    cache_key TEXT PRIMARY KEY,
+            # Analiz tablosu (İçerik adresli: aynı dosya = aynı kayıt, PID/yol fark etmez)
+            # Ayarlar tablosu (API Key vb.)
+            self.db.script('''
+                CREATE TABLE IF NOT EXISTS analysis_cache (
+                    file_hash TEXT NOT NULL,
+                    lang TEXT NOT NULL,
+                    prompt_version INTEGER NOT NULL,
                     process_name TEXT,
                     file_path TEXT,
                     signature TEXT,
                     risk_score TEXT,
                     analysis_json TEXT,
-                    updated_at DATETIME
-                )
-            ''')
-            # Ayarlar tablosu (API Key vb.)
-            cursor.execute('''
+                    updated_at DATETIME,
+                    PRIMARY KEY (file_hash, lang, prompt_version)
+                );
                 CREATE TABLE IF NOT EXISTS config (
                     key TEXT PRIMARY KEY,
                     value TEXT
-                )
+                );
             ''')
-            conn.commit()
-            conn.close()
+            self._migrate_legacy_cache()
             print(f"✅ SQL Veritabanı Hazır: {self.db_path}")
         except Exception as e:
             print(f"⚠️ Veritabanı Hatası: {e}")
 
+    def _migrate_legacy_cache(self):
+        """
+        Eski process_analysis tablosunu (name|path|signature|lang|pid anahtarlı)
+        analysis_cache tablosuna taşır. Eski kayıtlarda hash olmadığı için
+        dosya yolu "path:<yol>" sahte hash'i ile saklanır; dosya bir sonraki
+        analizde gerçek hash ile yeniden kaydedilir.
+        """
+        if not self.db.fetchone("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'process_analysis'"):
+            return
+
+        # Eskiden yeniye: aynı yol+dil için en son analiz kalır
+        rows = self.db.fetchall('''
+            SELECT cache_key, process_name, file_path, signature, risk_score, analysis_json, updated_at
+            FROM process_analysis ORDER BY updated_at ASC
+        ''')
+        migrated = []
+        for cache_key, name, path, signature, risk, analysis_json, updated_at in rows:
+            # Ad veya yol "|" içerebilir: dil sondan alınır (...|lang|pid)
+            parts = (cache_key or "").rsplit("|", 2)
+            if (cache_key or "").count("|") < 4 or not path or path == "Bilinmiyor":
+                continue
+            lang = parts[1].strip()
+            if lang not in ("TR", "EN"):
+                continue # Bozuk anahtar: taşınmaz
+            migrated.append((self._path_key(path), lang, PROMPT_VERSION, name, path, signature, risk, analysis_json, updated_at))
+
+        self.db.executemany('''
+            INSERT OR REPLACE INTO analysis_cache
+            (file_hash, lang, prompt_version, process_name, file_path, signature, risk_score, analysis_json, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', migrated)
+        self.db.execute("DROP TABLE process_analysis", commit=True)
+        print(f"🔁 Eski analiz tablosu taşındı: {len(migrated)} kayıt")
+
+    @staticmethod
+    def _path_key(path):
+        return f"path:{path}"
+
+    @staticmethod
+    def _memory_text(process_info):
+        """Bellek değeri sadece prompt/sonuç metnine yazılırken biçimlendirilir."""
+        rss = process_info.get('rss')
+        return format_mb(rss) if rss is not None else process_info.get('memory_mb', '?')
+
+    @staticmethod
+    def _hash_text(process_info, lang="TR"):
+        """
+        Prompt'taki SHA256 satırı. Çok büyük dosyaların kısmi parmak izi gerçek SHA256
+        değildir; model onu "sorgulamaya" çalışmasın diye değer yerine açıklama yazılır.
+        """
+        file_hash = process_info.get('hash') or 'Hesaplanamadı'
+        if str(file_hash).startswith(PARTIAL_PREFIX):
+            if lang == "EN":
+                return "N/A (file too large: only a partial fingerprint was taken, hash lookup does not apply)"
+            return "Yok (dosya çok büyük: yalnızca kısmi parmak izi alındı, hash sorgusu uygulanamaz)"
+        return file_hash
+
+    @staticmethod
+    def _is_sha256(value):
+        return len(value) == 64 and all(c in "0123456789abcdef" for c in value)
+
+    def _content_key(self, process_info):
+        """
+        Önbellek anahtarı: dosyanın SHA256 değeri; çok büyük dosyalarda kısmi parmak
+        izi (boyut + baş/orta/son parçalar). İçerik anahtarı yoksa (erişim yok) None:
+        analiz önbelleğe alınmaz, yol ile saklanan karar dosya değişince eskirdi.
+        """
+        file_hash = (process_info.get('hash') or '').strip().lower()
+        if self._is_sha256(file_hash):
+            return file_hash
+        if file_hash.startswith(PARTIAL_PREFIX) and self._is_sha256(file_hash[len(PARTIAL_PREFIX):]):
+            return file_hash
+        return None
+
     def get_saved_api_key(self):
         """Veritabanından kayıtlı API anahtarını getirir."""
         try:
-            conn = self._connect_db()
-            cursor = conn.cursor()
-            cursor.execute("SELECT value FROM config WHERE key = 'gemini_api_key'")
-            row = cursor.fetchone()
-            conn.close()
+            row = self.db.fetchone("SELECT value FROM config WHERE key = 'gemini_api_key'")
             if row:
                 return row[0]
         except Exception:
@@ -72,42 +188,39 @@ class GeminiAnalyzer:
         """Yeni API anahtarını kaydeder."""
         try:
             self.api_key = key
-            conn = self._connect_db()
-            cursor = conn.cursor()
-            cursor.execute("INSERT OR REPLACE INTO config (key, value) VALUES ('gemini_api_key', ?)", (key,))
-            conn.commit()
-            conn.close()
+            # Ayar hemen kalıcı olmalı (toplu commit beklenmez)
+            self.db.execute("INSERT OR REPLACE INTO config (key, value) VALUES ('gemini_api_key', ?)", (key,), commit=True)
             return True
         except Exception as e:
             print(f"API Key Kayıt Hatası: {e}")
             return False
 
-    def _get_from_db(self, cache_key):
+    def _get_from_db(self, file_hash, lang):
         try:
-            conn = self._connect_db()
-            cursor = conn.cursor()
-            cursor.execute("SELECT analysis_json FROM process_analysis WHERE cache_key = ?", (cache_key,))
-            row = cursor.fetchone()
-            conn.close()
+            row = self.db.fetchone(
+                "SELECT analysis_json FROM analysis_cache WHERE file_hash = ? AND lang = ? AND prompt_version = ?",
+                (file_hash, lang, PROMPT_VERSION)
+            )
             if row:
                 return json.loads(row[0])
         except Exception:
             return None
         return None
 
-    def _save_to_db(self, cache_key, proc_info, analysis_data):
+    def _save_to_db(self, file_hash, lang, proc_info, analysis_data):
         try:
-            conn = self._connect_db()
-            cursor = conn.cursor()
             now = datetime.now().isoformat()
             analysis_json = json.dumps(analysis_data)
             
-            cursor.execute('''
-                INSERT OR REPLACE INTO process_analysis 
-                (cache_key, process_name, file_path, signature, risk_score, analysis_json, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+            # Toplu commit: çok sayıda analizde her kayıt ayrı diske yazılmaz
+            self.db.execute('''
+                INSERT OR REPLACE INTO analysis_cache 
+                (file_hash, lang, prompt_version, process_name, file_path, signature, risk_score, analysis_json, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
-                cache_key, 
+                file_hash,
+                lang,
+                PROMPT_VERSION,
                 proc_info.get('name'), 
                 proc_info.get('path'), 
                 proc_info.get('signature'), 
@@ -115,109 +228,271 @@ class GeminiAnalyzer:
                 analysis_json, 
                 now
             ))
-            conn.commit()
-            conn.close()
+            tracer.count("gemini.cache_store")
             print(f"💾 Veritabanına Kaydedildi: {proc_info.get('name')}")
         except Exception as e:
             print(f"⚠️ DB Kayıt Hatası: {e}")
 
-    def _call_api(self, model, prompt):
-        if not self.api_key:
-            return None # API Key yoksa deneme bile
+    def _delete_from_db(self, file_hash, lang):
+        try:
+            self.db.execute("DELETE FROM analysis_cache WHERE file_hash = ? AND lang = ?", (file_hash, lang))
+        except Exception as e:
+            print(f"⚠️ DB Silme Hatası: {e}")
+
+    def _call_api(self, model, prompt, cancel=None):
+        """
+        generateContent çağrısı; metin veya None döner.
+        cancel (threading.Event): router kaybeden denemede set eder; gövde okunurken
+        kontrol edilir ve yanıt kapatılır (bağlantı havuza dönmez, istek yarıda kesilir).
+        """
+        if not self.api_key or (cancel is not None and cancel.is_set()):
+            return None # API Key yoksa (veya iptal edildiyse) deneme bile
             
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={self.api_key}"
-        headers = {'Content-Type': 'application/json'}
+        url = f"{self.api_base}/models/{model}:generateContent"
         data = {
             "contents": [{"parts": [{"text": prompt}]}],
             "generationConfig": {"temperature": 0.3}
         }
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=30)
-            if response.status_code == 200:
-                result = response.json()
-                if 'candidates' in result and result['candidates']:
-                    return result['candidates'][0]['content']['parts'][0]['text']
+            # Ortak oturum: bağlantı havuzdan gelir (keep-alive)
+            with self.session.post(url, params={"key": self.api_key}, json=data, timeout=30, stream=True) as response:
+                if response.status_code != 200:
+                    tracer.count(f"gemini.api_status_{response.status_code}") # örn. 429 = kota
+                    return None
+                body = bytearray()
+                for block in response.iter_content(16384):
+                    if cancel is not None and cancel.is_set():
+                        tracer.count("gemini.api_cancelled")
+                        return None
+                    body += block
+            result = json.loads(body)
+            if 'candidates' in result and result['candidates']:
+                return result['candidates'][0]['content']['parts'][0]['text']
+            tracer.count("gemini.api_empty")
+            return None
+        except Exception as e:
+            import requests
+            tracer.count("gemini.api_timeout" if isinstance(e, requests.Timeout) else "gemini.api_error")
             return None
-        except:
+
+    def _call_api_stream(self, model, prompt, on_chunk, cancel=None):
+        """
+        streamGenerateContent (SSE) ile çağırır; her metin parçası geldikçe on_chunk(text)
+        çağrılır. Dönüş: birleştirilmiş tam metin veya None (_call_api ile aynı sözleşme).
+        cancel set edilirse akış bir sonraki olayda kapatılır.
+        """
+        if not self.api_key or (cancel is not None and cancel.is_set()):
             return None
 
-    def _get_best_response(self, prompt):
+        url = f"{self.api_base}/models/{model}:streamGenerateContent"
+        data = {
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": {"temperature": 0.3}
+        }
+        parts = []
+        try:
+            # timeout: bağlantı ve iki parça arası bekleme (toplam süre değil)
+            with self.session.post(url, params={"key": self.api_key, "alt": "sse"}, json=data,
+                                   timeout=30, stream=True) as response:
+                if response.status_code != 200:
+                    tracer.count(f"gemini.api_status_{response.status_code}")
+                    return None
+                response.encoding = "utf-8" # SSE her zaman UTF-8 (charset yoksa requests latin-1 varsayar)
+                for line in response.iter_lines(decode_unicode=True):
+                    if cancel is not None and cancel.is_set():
+                        tracer.count("gemini.api_cancelled")
+                        return None
+                    if not line or not line.startswith("data:"):
+                        continue # Boş satır = olay sınırı
+                    event = json.loads(line[5:])
+                    for candidate in event.get('candidates') or []:
+                        for part in candidate.get('content', {}).get('parts', []):
+                            text = part.get('text')
+                            if text:
+                                parts.append(text)
+                                on_chunk(text)
+            if not parts:
+                tracer.count("gemini.api_empty")
+                return None
+            return "".join(parts)
+        except Exception as e:
+            import requests
+            tracer.count("gemini.api_timeout" if isinstance(e, requests.Timeout) else "gemini.api_error")
+            return None
+
+    def _streaming_call(self, on_field):
+        """
+        Router için akışlı çağrı fonksiyonu: her modelin yanıtı ayrı ayrıştırılır,
+        üst seviye alanlar tamamlandıkça on_field(key, value) çağrılır (çağıranın thread'i değil!).
+        Hedging'de birden fazla model akabilir; ilk alanı gönderen model akışı sahiplenir.
+        """
+        lock = threading.Lock()
+        state = {"owner": None}
+        start = time.monotonic()
+
+        def call(model, prompt, cancel=None):
+            parser = JsonFieldStream()
+
+            def on_chunk(text):
+                fields = parser.feed(text)
+                if not fields:
+                    return
+                with lock:
+                    if state["owner"] is None:
+                        state["owner"] = model
+                        tracer.record("gemini.first_field", time.monotonic() - start, model=model)
+                    if state["owner"] != model:
+                        return
+                for key, value in fields:
+                    on_field(key, value)
+
+            return self._call_api_stream(model, prompt, on_chunk, cancel)
+        return call
+
+    def _get_best_response(self, prompt, on_field=None, acquire=None):
+        """
+        acquire(): her HTTP isteğinden (yedek model denemeleri dahil) önce çağrılır;
+        hız sınırlayıcı buraya bağlanır. False dönerse istek gönderilmez (iptal).
+        """
         if not self.api_key:
             return None, "API Anahtarı Eksik. Lütfen Ayarlar'dan ekleyiniz."
+        import asyncio
+        call = self._streaming_call(on_field) if on_field else None
+        # Her çağıran thread kendi event loop'unu kullanır (UI/toplu analiz thread'leri)
+        with tracer.span("gemini.request", stream=bool(on_field)):
+            return asyncio.run(self._get_best_response_async(prompt, call, acquire))
 
-        last_error = None
-        for model in self.models:
-            print(f"🚀 İstek Gönderiliyor: {model}...")
-            text = self._call_api(model, prompt)
-            if text:
-                print(f"✅ Başarılı Model: {model}")
-                return text, None
-            print(f"⚠️ {model} BULUNAMADI/HATA. Sonraki...")
-            time.sleep(1) # Hızlı retry
-            
+    async def _get_best_response_async(self, prompt, call=None, acquire=None):
+        """Modelleri hedging ile dener; ilk başarılı yanıt kazanır."""
+        if not self.api_key:
+            return None, "API Anahtarı Eksik. Lütfen Ayarlar'dan ekleyiniz."
+
+        text, model = await self.router.request(prompt, call, acquire)
+        if text:
+            print(f"✅ Başarılı Model: {model}")
+            return text, None
         return None, "Tüm modeller başarısız."
 
+    def get_model_stats(self):
+        """
+        Model başına çağrı/hata sayısı, gecikme (ms) ve devre kesici durumu.
+        Henüz istek yapılmadıysa (router oluşmadı) None; sorgu router'ı oluşturmaz.
+        """
+        router = self._router
+        return router.stats() if router is not None else None
+
+    def _get_cached(self, process_info, lang, count=True):
+        """
+        İçerik adresli önbellek araması (tek indeksli sorgu).
+        Hash ile bulunamazsa eski tablodan taşınmış yol kaydına bakılır ve dosya
+        o kayıttan beri değişmediyse gerçek hash altına kaydedilir.
+        count=False: aynı işlem için üst katmanda sayılmış tekrar kontrolü
+        (hit/miss metrikleri mantıksal arama başına bir kez artar).
+        """
+        cache_key = self._content_key(process_info)
+        if not cache_key:
+            if count:
+                tracer.count("gemini.cache_miss")
+            return None
+
+        with tracer.span("gemini.cache_lookup"):
+            result = self._get_from_db(cache_key, lang)
+            if result is None:
+                path = (process_info.get('path') or '').strip()
+                if path:
+                    result = self._get_by_path_and_lang(path, lang)
+                    if result is not None:
+                        # Tek seferlik terfi: yol kaydı silinir ki dosya değişince eski analiz dönmesin
+                        self._save_to_db(cache_key, lang, process_info, result)
+                        self._delete_from_db(self._path_key(path), lang)
+        if count:
+            tracer.count("gemini.cache_hit" if result is not None else "gemini.cache_miss")
+        return result
+
+    def get_cached_analysis(self, process_info, lang="TR", count=True):
+        """API'ye gitmeden sadece önbellekte analiz var mı bakar (Toplu analiz için)."""
+        result = self._get_cached(process_info, lang.strip(), count)
+        if result:
+            mem_note = "(Current Value)" if lang == "EN" else "(Güncel Değer)"
+            result['bellek_analizi'] = f"{self._memory_text(process_info)} {mem_note}"
+        return result
+
     def _get_by_path_and_lang(self, path, lang):
-        """Dosya yolu ve dile göre veritabanında eski analiz var mı bakar (PID değişse bile)."""
+        """
+        Eski (hash'siz) tablodan taşınan kayıt var mı bakar. Dosya kayıttan sonra
+        değiştiyse (mtime > updated_at) kayıt başka bir içeriğe aittir: kullanılmaz.
+        """
         try:
-            conn = self._connect_db()
-            cursor = conn.cursor()
-            # En son analiz edileni getir
-            cursor.execute("SELECT analysis_json, cache_key FROM process_analysis WHERE file_path = ? ORDER BY updated_at DESC", (path,))
-            rows = cursor.fetchall()
-            conn.close()
-            
-            # Dile uygun olanı bul (Cache key içinde dil kodu var mı?)
-            search_tag = f"|{lang}|"
-            for row in rows:
-                json_data, key = row
-                if search_tag in key:
-                    return json.loads(json_data)
+            row = self.db.fetchone(
+                "SELECT analysis_json, updated_at FROM analysis_cache WHERE file_hash = ? AND lang = ? AND prompt_version = ?",
+                (self._path_key(path), lang, PROMPT_VERSION)
+            )
+            if not row:
+                return None
+            if os.path.getmtime(path) > datetime.fromisoformat(row[1]).timestamp():
+                self._delete_from_db(self._path_key(path), lang)
+                return None
+            return json.loads(row[0])
         except Exception:
-            pass
-        return None
+            return None
 
-    def analyze_single_process(self, process_info, lang="TR", force_refresh=False):
+    def analyze_single_process(self, process_info, lang="TR", force_refresh=False, on_field=None, acquire=None,
+                               count_cache=True):
         """
         Tek bir işlemi detaylı analiz eder (SQL Cache + Multi-Model).
+        Önbellek anahtarı (dosya hash'i, dil, prompt sürümü) olduğu için aynı
+        dosya hangi yolda veya PID ile çalışırsa çalışsın aynı kayıt kullanılır.
+        on_field(key, value) verilirse yanıt akış (SSE) ile alınır ve her alan
+        tamamlandıkça (API thread'inden) bildirilir; dönüş değeri yine tam sonuçtur.
+        acquire: bkz. _get_best_response (toplu analizde hız sınırlayıcı).
+        count_cache=False: önbellek araması çağıranda zaten sayıldı (bkz. _get_cached).
         """
-        path = process_info.get('path', 'Bilinmiyor')
-        signature = process_info.get('signature', 'Bilinmiyor')
         name = process_info.get('name', 'bilinmiyor')
-        c_pid = str(process_info.get('pid', '0'))
-        
-        # 1. CACHE KONTROLÜ (Tam Eşleşme: PID Dahil)
-        c_name = name.strip()
-        c_path = path.strip()
-        c_sign = signature.strip()
         c_lang = lang.strip()
-        
-        cache_key = f"{c_name}|{c_path}|{c_sign}|{c_lang}|{c_pid}"
-        print(f"🔑 Cache Key (PID Veritabanı): {cache_key}")
+
+        # 1. CACHE KONTROLÜ (Hash + Dil + Prompt Sürümü)
+        cache_key = self._content_key(process_info)
+        print(f"🔑 Cache Key (Hash): {cache_key}")
         
         if not force_refresh:
-            # A) Tam PID eşleşmesi var mı? (Oturum içi hız)
-            cached_result = self._get_from_db(cache_key)
+            cached_result = self._get_cached(process_info, c_lang, count_cache)
             if cached_result:
-                print(f"📦 SQL Veritabanından Getirildi (Tam Eşleşme): {name}")
+                print(f"📦 SQL Veritabanından Getirildi (Dosya/Hash Eşleşmesi): {name}")
+                # Bellek bilgisini güncelle
+                mem_note = "(Current Value)" if lang == "EN" else "(Güncel Değer)"
+                cached_result['bellek_analizi'] = f"{self._memory_text(process_info)} {mem_note}"
                 return cached_result
-    
-            # B) Dosya daha önce analiz edilmiş mi? (PID değişse bile kurtar)
-            if c_path and c_path != "Bilinmiyor":
-                prev_result = self._get_by_path_and_lang(c_path, c_lang)
-                if prev_result:
-                    print(f"📦 SQL Veritabanından Getirildi (Dosya/Hash Eşleşmesi): {name}")
-                    # Eski analizi kullan ama bu yeni PID için de kaydet ki bir dahaki sefere daha hızlı olsun
-                    self._save_to_db(cache_key, process_info, prev_result)
-                    
-                    # Bellek bilgisini güncelle
-                    mem_note = "(Current Value)" if lang == "EN" else "(Güncel Değer)"
-                    prev_result['bellek_analizi'] = f"{process_info.get('memory_mb', '?')} {mem_note}"
-                    return prev_result
         else:
              print(f"🔄 ZORLA YENİLEME: Cache atlanıyor... ({name})")
 
-        file_hash = process_info.get('hash', 'Hesaplanamadı')
+        with tracer.span("gemini.prompt"):
+            prompt = self._build_prompt(process_info, lang)
+        
+        # Modelleri sırayla dene
+        text, error = self._get_best_response(prompt, on_field, acquire)
+        
+        if error:
+            print("❌ Hiçbir AI modeli yanıt vermedi. Yerel Analiz yapılıyor.")
+            tracer.count("gemini.local_fallback")
+            return self._local_analysis(process_info, lang)
+        
+        try:
+            with tracer.span("gemini.parse"):
+                clean_text = text.replace("```json", "").replace("```", "").strip()
+                data = json.loads(clean_text)
+            if cache_key:
+                self._save_to_db(cache_key, c_lang, process_info, data)
+            return data
+        except json.JSONDecodeError:
+            tracer.count("gemini.parse_error")
+            return self._local_analysis(process_info, lang)
+
+    def _build_prompt(self, process_info, lang="TR"):
+        """Tek işlem için analiz prompt'u."""
+        path = process_info.get('path', 'Bilinmiyor')
+        signature = process_info.get('signature', 'Bilinmiyor')
+        name = process_info.get('name', 'bilinmiyor')
+        file_hash = self._hash_text(process_info, lang)
 
         if lang == "EN":
              prompt = f"""
@@ -229,7 +504,7 @@ class GeminiAnalyzer:
             - Path: {path}
             - SHA256 HASH: {file_hash}
             - Digital Signature: {signature}
-            - Memory: {process_info.get('memory_mb')}
+            - Memory: {self._memory_text(process_info)}
             
             **ANALYSIS RULES:**
             1. **HASH CHECK:** Check this SHA256 hash against your knowledge base of known good/bad files.
@@ -258,7 +533,7 @@ class GeminiAnalyzer:
             - Dosya Yolu: {path}
             - SHA256 HASH: {file_hash}
             - Dijital İmza: {signature}
-            - Bellek: {process_info.get('memory_mb')}
+            - Bellek: {self._memory_text(process_info)}
             
             **ANALİZ KURALLARI:**
             1. **HASH KONTROLÜ:** Bu SHA256 değerini veritabanındaki bilinen zararlı/temiz dosyalarla karşılaştır.
@@ -276,21 +551,166 @@ class GeminiAnalyzer:
                 "sonuc": "Güvenli / Şüpheli / Tehlikeli"
             }}
             """
-        
-        # Modelleri sırayla dene
-        text, error = self._get_best_response(prompt)
-        
+        return prompt
+
+    def _build_batch_prompt(self, process_infos, lang="TR"):
+        """
+        Birden fazla işlem için tek prompt. Yanıt, her eleman "id" alanı
+        taşıyan bir JSON dizisi olmalı (id = listedeki sıra numarası).
+        """
+        lines = []
+        for idx, p in enumerate(process_infos):
+            lines.append(
+                f"- id: {idx} | Name: {p.get('name', 'bilinmiyor')} | Path: {p.get('path', 'Bilinmiyor')} | "
+                f"SHA256: {self._hash_text(p, lang)} | Signature: {p.get('signature', 'Bilinmiyor')} | "
+                f"Memory: {self._memory_text(p)}"
+            )
+        targets = "\n".join(lines)
+
+        if lang == "EN":
+            return f"""
+            **ROLE:** You represent the engine of VirusTotal and major Thread Intelligence databases.
+            **TASK:** Perform a security audit of EACH process below using its **SHA256 HASH**, **Digital Signature** and path.
+
+            **TARGET PROCESSES:**
+{targets}
+
+            **ANALYSIS RULES:**
+            1. **HASH CHECK:** Check each SHA256 hash against your knowledge base of known good/bad files.
+            2. **SIGNATURE CHECK:** If the signature is invalid or missing, increase Risk Score.
+            3. **BEHAVIOR:** If the path is suspicious (e.g. Temp folder, mimicking system files), flag it.
+            4. **FILE.NET / COMMUNITY:** Cross-reference with `file.net` and community discussions.
+
+            **OUTPUT:**
+            Return ONLY a strict JSON array with exactly one object per process, in any order:
+            [
+                {{
+                    "id": 0,
+                    "kimlik": "Official identification. Use **bold** for app name.",
+                    "risk_skoru": "X/10",
+                    "guvenlik_analizi": "Threat report. Highlight key risks/safety factors with **bold**.",
+                    "bellek_analizi": "Memory usage analysis.",
+                    "sonuc": "Safe / Suspicious / Dangerous"
+                }}
+            ]
+            """
+        return f"""
+            **ROL:** Sen VirusTotal ve Küresel Tehdit İstihbarat (Threat Intel) motorusun.
+            **GÖREV:** Aşağıdaki HER işlemi **SHA256 HASH**, **Dijital İmza**, dosya yolu, **file.net** ve **Topluluk Yorumlarına** dayanarak tara.
+
+            **HEDEF İŞLEMLER:**
+{targets}
+
+            **ANALİZ KURALLARI:**
+            1. **HASH KONTROLÜ:** Her SHA256 değerini bilinen zararlı/temiz dosyalarla karşılaştır.
+            2. **İMZA KONTROLÜ:** İmza yoksa veya geçersizse risk puanını artır.
+            3. **DAVRANIŞ/KONUM:** Dosya yolu şüpheliyse (Temp, System32 taklidi vb.) uyar.
+            4. **FILE.NET / TOPLULUK:** `file.net` ve forum yorumlarını baz al.
+
+            **ÇIKTI (SADECE JSON DİZİSİ):** Her işlem için tam olarak bir nesne:
+            [
+                {{
+                    "id": 0,
+                    "kimlik": "Detaylı yazılım kimliği. Uygulama adını **kalın** yaz.",
+                    "risk_skoru": "X/10 (1: Çok Güvenli - 10: Çok Tehlikeli)",
+                    "guvenlik_analizi": "Kapsamlı güvenlik raporu. Önemli uyarıları **kalın** ile vurgula.",
+                    "bellek_analizi": "Bellek kullanım yorumu.",
+                    "sonuc": "Güvenli / Şüpheli / Tehlikeli"
+                }}
+            ]
+            """
+
+    def analyze_batch(self, process_infos, lang="TR", batch_size=10, force_refresh=False, acquire=None,
+                      count_cache=True):
+        """
+        Çok sayıda işlemi az sayıda istekle analiz eder.
+        N işlem tek prompt'ta gönderilir, yanıt (JSON dizisi) işlem başına ayrılır
+        ve her sonuç önbelleğe ayrı kaydedilir. Yanıt çözülemezse parti ikiye
+        bölünerek yeniden denenir; tek işleme inince analyze_single_process kullanılır.
+        acquire(): bölünmüş tekrarlar dahil her istekten önce çağrılır (hız sınırı).
+        count_cache=False: önbellek araması çağıranda zaten sayıldı (örn. BatchAnalyzer).
+        Dönüş: process_infos ile aynı sırada sonuç listesi.
+        """
+        c_lang = lang.strip()
+        results = [None] * len(process_infos)
+        pending = []
+
+        for idx, info in enumerate(process_infos):
+            if not force_refresh:
+                cached = self.get_cached_analysis(info, c_lang, count_cache)
+                if cached:
+                    results[idx] = cached
+                    continue
+            pending.append(idx)
+
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            self._analyze_chunk(process_infos, chunk, c_lang, results, force_refresh, acquire)
+        return results
+
+    def _analyze_chunk(self, process_infos, indexes, lang, results, force_refresh=False, acquire=None):
+        if len(indexes) == 1:
+            idx = indexes[0]
+            # Önbellek bu işlem için analyze_batch'te zaten sorgulandı (tekrar sayılmaz)
+            results[idx] = self.analyze_single_process(process_infos[idx], lang=lang, force_refresh=force_refresh,
+                                                       acquire=acquire, count_cache=False)
+            return
+
+        infos = [process_infos[i] for i in indexes]
+        print(f"📦 Toplu Prompt: {len(infos)} işlem tek istekte")
+        text, error = self._get_best_response(self._build_batch_prompt(infos, lang), acquire=acquire)
+
+        with tracer.span("gemini.parse_batch"):
+            parsed = self._parse_batch_response(text, len(infos)) if not error else {}
+        missing = []
+        for local_id, idx in enumerate(indexes):
+            data = parsed.get(local_id)
+            if data is None:
+                missing.append(idx)
+                continue
+            results[idx] = data
+            cache_key = self._content_key(process_infos[idx])
+            if cache_key:
+                self._save_to_db(cache_key, lang, process_infos[idx], data)
+
+        if not missing:
+            return
+        tracer.count("gemini.batch_missing", len(missing))
         if error:
-            print("❌ Hiçbir AI modeli yanıt vermedi. Yerel Analiz yapılıyor.")
-            return self._local_analysis(process_info, lang)
-        
+            # Hiçbir model yanıt vermediyse bölmek sonuç değiştirmez
+            for idx in missing:
+                results[idx] = self._local_analysis(process_infos[idx], lang)
+            return
+
+        # Eksik/çözülemeyen kısmı daha küçük partilerle tekrar dene
+        print(f"⚠️ Toplu yanıtta {len(missing)} işlem eksik. Parti bölünüyor...")
+        half = (len(missing) + 1) // 2
+        self._analyze_chunk(process_infos, missing[:half], lang, results, force_refresh, acquire)
+        if missing[half:]:
+            self._analyze_chunk(process_infos, missing[half:], lang, results, force_refresh, acquire)
+
+    @staticmethod
+    def _parse_batch_response(text, count):
+        """JSON dizisini {id: sonuç} sözlüğüne çevirir. Geçersiz elemanlar atlanır."""
         try:
             clean_text = text.replace("```json", "").replace("```", "").strip()
             data = json.loads(clean_text)
-            self._save_to_db(cache_key, process_info, data)
-            return data
-        except json.JSONDecodeError:
-            return self._local_analysis(process_info, lang)
+        except (json.JSONDecodeError, AttributeError):
+            return {}
+        if not isinstance(data, list):
+            return {}
+
+        parsed = {}
+        for entry in data:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                idx = int(entry.pop("id"))
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 0 <= idx < count and "risk_skoru" in entry:
+                parsed[idx] = entry
+        return parsed
 
     def _local_analysis(self, p, lang="TR"):
         """API çalışmadığında devreye giren basit kurallı analiz."""
@@ -321,6 +741,6 @@ class GeminiAnalyzer:
             "kimlik": f"{p.get('name')} (Offline)",
             "risk_skoru": riskscore,
             "guvenlik_analizi": desc,
-            "bellek_analizi": f"{p.get('memory_mb')}",
+            "bellek_analizi": f"{self._memory_text(p)}",
             "sonuc": result_txt
         }
@@ -0,0 +1,108 @@
+import hashlib
+import mmap
+import os
+import threading
+from datetime import datetime
+from core.storage import Database
+
+# Bu boyutun üzerindeki dosyalar bellek eşlemeli (mmap) okunur
+MMAP_THRESHOLD = 4 * 1024 * 1024
+# Normal okumada kullanılan tampon (4 KiB yerine 1 MiB: çok daha az sistem çağrısı)
+READ_BUFFER_SIZE = 1024 * 1024
+
+
+def sha256_file(filepath, size=None):
+    """Dosyanın SHA256 değerini büyük tampon / mmap ile hesaplar."""
+    if size is None:
+        size = os.path.getsize(filepath)
+    sha256_hash = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                sha256_hash.update(mm)
+        else:
+            buf = bytearray(READ_BUFFER_SIZE)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                sha256_hash.update(view[:n])
+    return sha256_hash.hexdigest()
+
+
+class FileHashCache:
+    """
+    Kalıcı hash önbelleği.
+    Dosya yolu, boyut, değişiklik zamanı (mtime) ve inode değişmediyse daha önce
+    hesaplanan SHA256 tekrar kullanılır; dosya hiç okunmaz (sadece stat).
+    Kayıtlar process_audit.db içindeki file_hashes tablosunda tutulur.
+    """
+
+    def __init__(self, db_path="process_audit.db"):
+        self.db = Database.shared(db_path)
+        self._memory = {} # path -> (size, mtime_ns, inode, sha256)
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _init_db(self):
+        try:
+            self.db.script('''
+                CREATE TABLE IF NOT EXISTS file_hashes (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER,
+                    mtime_ns INTEGER,
+                    inode INTEGER,
+                    sha256 TEXT,
+                    updated_at DATETIME
+                );
+            ''')
+        except Exception as e:
+            print(f"⚠️ Hash Önbelleği Hatası: {e}")
+
+    @staticmethod
+    def _signature(st):
+        return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+    def lookup(self, filepath, st=None):
+        """Dosya değişmediyse kayıtlı hash'i döner, aksi halde None."""
+        if st is None:
+            st = os.stat(filepath)
+        sig = self._signature(st)
+
+        with self._lock:
+            entry = self._memory.get(filepath)
+        if entry and entry[:3] == sig:
+            return entry[3]
+
+        try:
+            row = self.db.fetchone("SELECT size, mtime_ns, inode, sha256 FROM file_hashes WHERE path = ?", (filepath,))
+        except Exception:
+            row = None
+        if row and tuple(row[:3]) == sig:
+            with self._lock:
+                self._memory[filepath] = tuple(row)
+            return row[3]
+        return None
+
+    def store(self, filepath, st, sha256):
+        entry = self._signature(st) + (sha256,)
+        with self._lock:
+            self._memory[filepath] = entry
+        try:
+            self.db.execute('''
+                INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, inode, sha256, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (filepath,) + entry + (datetime.now().isoformat(),))
+        except Exception as e:
+            print(f"⚠️ Hash Önbelleği Kayıt Hatası: {e}")
+
+    def get(self, filepath):
+        """Önbellekte varsa onu, yoksa hesaplayıp kaydettiği SHA256 değerini döner."""
+        st = os.stat(filepath)
+        cached = self.lookup(filepath, st)
+        if cached:
+            return cached
+        sha256 = sha256_file(filepath, st.st_size)
+        self.store(filepath, st, sha256)
+        return sha256
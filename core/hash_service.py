@@ -0,0 +1,104 @@
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from core.hash_cache import sha256_file
+from core.tracing import tracer
+
+# Bu boyutun üzerindeki dosyalar için kısmi (parçalı) hash hesaplanır
+PARTIAL_THRESHOLD = 100 * 1024 * 1024
+# Kısmi hash'te baştan, ortadan ve sondan okunan parça boyutu
+PARTIAL_CHUNK = 8 * 1024 * 1024
+# Kısmi hash'ler tam SHA256 ile karışmasın diye ön ek taşır
+PARTIAL_PREFIX = "partial:"
+
+
+def partial_sha256_file(filepath, size=None, chunk=PARTIAL_CHUNK):
+    """
+    Çok büyük dosyalar için hızlı parmak izi: boyut + baş/orta/son parçaların SHA256'sı.
+    Tam hash ile aynı değildir (VirusTotal karşılaştırması için kullanılamaz),
+    ancak aynı dosyanın tekrar tanınması için yeterlidir.
+    """
+    if size is None:
+        size = os.path.getsize(filepath)
+    sha256_hash = hashlib.sha256(str(size).encode())
+    with open(filepath, "rb") as f:
+        for offset in (0, max(0, size // 2 - chunk // 2), max(0, size - chunk)):
+            f.seek(offset)
+            sha256_hash.update(f.read(chunk))
+    return PARTIAL_PREFIX + sha256_hash.hexdigest()
+
+
+class HashService:
+    """
+    Çok sayıda dosyayı paralel hash'ler.
+    - Thread havuzu: hashlib büyük bloklarda GIL'i bıraktığı için gerçek paralellik sağlar.
+    - Aynı dosya için devam eden hesaplama varsa yenisi başlatılmaz (aynı Future döner).
+    - `hash_many` sonuçları tamamlandıkça akış halinde (generator) döner.
+    - `partial_threshold` üzerindeki dosyalar atlanmaz, kısmi hash ile parmak izi alınır.
+    FileHashCache verilirse değişmemiş dosyalar hiç okunmaz.
+    """
+
+    def __init__(self, hash_cache=None, max_workers=None, partial_threshold=PARTIAL_THRESHOLD):
+        self.hash_cache = hash_cache
+        self.partial_threshold = partial_threshold
+        self._pool = ThreadPoolExecutor(max_workers=max_workers or min(8, (os.cpu_count() or 2)), thread_name_prefix="hash")
+        self._inflight = {} # normalize edilmiş yol -> Future
+        self._lock = threading.Lock()
+
+    def hash_file(self, filepath):
+        """Tek dosyanın hash'ini hesaplar (çağıran thread'de). Hata olursa None."""
+        try:
+            st = os.stat(filepath)
+            if self.hash_cache is not None:
+                cached = self.hash_cache.lookup(filepath, st)
+                if cached:
+                    tracer.count("hash.cache_hit")
+                    return cached
+                tracer.count("hash.cache_miss")
+
+            with tracer.span("hash.compute"):
+                if st.st_size > self.partial_threshold:
+                    digest = partial_sha256_file(filepath, st.st_size)
+                else:
+                    digest = sha256_file(filepath, st.st_size)
+
+            if self.hash_cache is not None:
+                self.hash_cache.store(filepath, st, digest)
+            return digest
+        except (OSError, ValueError):
+            # ValueError: stat ile okuma arasında boşaltılan dosyada mmap (boş eşleme)
+            return None
+
+    def submit(self, filepath):
+        """Dosyayı kuyruğa ekler; aynı dosya zaten hesaplanıyorsa mevcut Future döner."""
+        key = os.path.normcase(os.path.abspath(filepath))
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = self._pool.submit(self.hash_file, filepath)
+            self._inflight[key] = future
+        future.add_done_callback(lambda f, k=key: self._forget(k, f))
+        return future
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def hash_many(self, paths):
+        """
+        Dosyaları paralel hash'ler; (yol, hash) çiftlerini tamamlanma sırasıyla üretir.
+        Aynı yol birden fazla verilirse bir kez hesaplanır, her yol bir kez döner.
+        """
+        futures = {} # Future -> [yol, ...] (farklı yazılmış aynı dosya tek Future paylaşır)
+        for path in dict.fromkeys(paths):
+            futures.setdefault(self.submit(path), []).append(path)
+        for future in as_completed(futures):
+            digest = future.result()
+            for path in futures[future]:
+                yield path, digest
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
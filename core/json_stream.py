@@ -0,0 +1,98 @@
+"""
+Akış halinde gelen JSON nesnesi için artımlı ayrıştırıcı.
+
+Model yanıtı parça parça gelirken (SSE), üst seviye nesnenin her alanı
+tamamlandığı anda (key, value) olarak bildirilir:
+
+    parser = JsonFieldStream()
+    for chunk in chunks:
+        for key, value in parser.feed(chunk):
+            ...  # örn. ("risk_skoru", "2/10")
+
+Baştaki ```json çiti veya açıklama metni '{' görülene kadar atlanır.
+Alan değerleri iç içe nesne/dizi olabilir; tamamı json.loads ile çözülür.
+Her karakter yalnızca bir kez taranır (toplam maliyet yanıt uzunluğuyla doğrusal).
+"""
+import json
+
+
+class JsonFieldStream:
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0         # Sonraki taranacak karakter
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+        self._key_start = None
+        self._key = None
+        self._value_start = None
+        self.fields = {}      # Tamamlanan alanlar (sırasıyla)
+        self.done = False     # Üst seviye nesne kapandı
+
+    def feed(self, chunk):
+        """Yeni metni ekler; bu parçayla tamamlanan [(key, value), ...] listesini döner."""
+        if self.done or not chunk:
+            return []
+        self._buf += chunk
+        completed = []
+        buf = self._buf
+        i = self._pos
+        n = len(buf)
+        while i < n:
+            ch = buf[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        self._key = json.loads(buf[self._key_start:i + 1])
+                        self._key_start = None
+            elif ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect_key:
+                    self._key_start = i
+                    self._expect_key = False
+            elif ch in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    if ch != "{":
+                        self._depth = 0 # Üst seviye dizi beklenmiyor; atla
+                    else:
+                        self._expect_key = True
+            elif ch in "}]":
+                if self._depth == 1:
+                    self._finish_value(buf, i, completed)
+                    self._depth = 0
+                    self.done = True
+                    break
+                if self._depth > 0:
+                    self._depth -= 1
+            elif self._depth == 1:
+                if ch == ":" and self._key is not None:
+                    self._value_start = i + 1
+                elif ch == ",":
+                    self._finish_value(buf, i, completed)
+                    self._expect_key = True
+            i += 1
+        self._pos = i
+        return completed
+
+    def _finish_value(self, buf, end, completed):
+        if self._key is None or self._value_start is None:
+            return
+        raw = buf[self._value_start:end].strip()
+        key, self._key, self._value_start = self._key, None, None
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return # Bozuk alan: atlanır, tam yanıt sonunda yine ayrıştırılır
+        self.fields[key] = value
+        completed.append((key, value))
+
+    @property
+    def text(self):
+        return self._buf
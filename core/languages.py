@@ -36,7 +36,24 @@ class Language:
         "confirm_kill": "{0} (PID: {1}) işlemini sonlandırmak istediğinize emin misiniz?",
         "success_kill": "İşlem sonlandırıldı.",
         "error_path": "Dosya yolu bulunamadı veya erişilemiyor.",
-        "start_msg": "Analiz için 'Analiz Et' butonuna basınız.\nDosya hash'i hesaplanacak ve taranacaktır."
+        "start_msg": "Analiz için 'Analiz Et' butonuna basınız.\nDosya hash'i hesaplanacak ve taranacaktır.",
+        "batch_btn": "📊 Tümünü Analiz Et",
+        "batch_cancel": "⏹ Durdur",
+        "batch_confirm": "Listedeki {0} işlem (tekrarlar birleştirilerek) analiz edilecek. Devam edilsin mi?",
+        "batch_progress": "Toplu analiz: {0}/{1} dosya tamamlandı...",
+        "batch_done": "Toplu analiz tamamlandı: {0} dosya ({1} önbellekten)",
+        "batch_cancelled": "Toplu analiz durduruldu: {0} dosya",
+        "batch_show": "(sonuçlar için tıklayın)",
+        "subtree_confirm": "{0} (PID: {1}) ve alt işlemleri ({2} işlem) analiz edilecek. Devam edilsin mi?",
+        "diag_title": "Tanılama / Performans",
+        "diag_spans": "İşlem Süreleri (ms)",
+        "diag_counters": "Sayaçlar",
+        "diag_models": "AI Modelleri",
+        "diag_empty": "Henüz ölçüm yok.",
+        "diag_export_json": "JSON Kaydet",
+        "diag_export_prom": "Prometheus Kaydet",
+        "diag_reset": "Sıfırla",
+        "diag_saved": "Kaydedildi: {0}"
     }
 
     EN = {
@@ -76,5 +93,22 @@ class Language:
         "confirm_kill": "Are you sure you want to terminate {0} (PID: {1})?",
         "success_kill": "Process terminated.",
         "error_path": "File path not found or inaccessible.",
-        "start_msg": "Click 'Analyze' button to start.\nFile hash will be calculated and scanned."
+        "start_msg": "Click 'Analyze' button to start.\nFile hash will be calculated and scanned.",
+        "batch_btn": "📊 Analyze All",
+        "batch_cancel": "⏹ Stop",
+        "batch_confirm": "{0} processes in the list will be analyzed (duplicates merged). Continue?",
+        "batch_progress": "Batch analysis: {0}/{1} files done...",
+        "batch_done": "Batch analysis finished: {0} files ({1} from cache)",
+        "batch_cancelled": "Batch analysis stopped: {0} files",
+        "batch_show": "(click to view results)",
+        "subtree_confirm": "{0} (PID: {1}) and its child processes ({2} processes) will be analyzed. Continue?",
+        "diag_title": "Diagnostics / Performance",
+        "diag_spans": "Operation Timings (ms)",
+        "diag_counters": "Counters",
+        "diag_models": "AI Models",
+        "diag_empty": "No measurements yet.",
+        "diag_export_json": "Save JSON",
+        "diag_export_prom": "Save Prometheus",
+        "diag_reset": "Reset",
+        "diag_saved": "Saved: {0}"
     }
@@ -0,0 +1,196 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from core.tracing import tracer
+
+
+class ModelHealth:
+    """Tek bir model için gecikme istatistikleri ve devre kesici (circuit breaker) durumu."""
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.total_latency = 0.0
+        self.last_latency = None
+        self.open_until = 0.0 # Bu zamana kadar model atlanır
+        self.latencies = deque(maxlen=50) # Son başarılı çağrılar (p95 için)
+
+    def p95(self, min_samples=5):
+        """Son başarılı çağrıların 95. yüzdeliği (saniye); yeterli örnek yoksa None."""
+        if len(self.latencies) < min_samples:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def to_dict(self, now):
+        successes = self.calls - self.failures
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "avg_ms": round(self.total_latency / successes * 1000, 1) if successes else None,
+            "last_ms": round(self.last_latency * 1000, 1) if self.last_latency is not None else None,
+            "p95_ms": round(self.p95() * 1000, 1) if self.p95() is not None else None,
+            "state": "open" if self.open_until > now else "closed",
+            "cooldown_left": max(0.0, round(self.open_until - now, 1)),
+        }
+
+
+class AsyncModelRouter:
+    """
+    Modelleri asyncio ile yönetir:
+    - Yedekleme (failover): model başarısız olursa sıradaki denenir.
+    - Hedging (isteğe bağlı, `hedge=True`): çalışan model kendi gözlenen p95
+      gecikmesini (en az `min_hedge_delay`) aşarsa sıradaki de başlatılır; ilk başarılı
+      yanıt kazanır. Yeterli gecikme örneği olmayan model için hedge yapılmaz.
+      Kapalıyken (varsayılan) her istek tek bir ücretli çağrıdır (kota).
+    - Devre kesici: art arda `failure_threshold` kez başarısız olan model
+      `cooldown` saniye boyunca denenmez (süre dolunca tekrar denenir).
+    - Her model için gecikme istatistikleri tutulur (`stats()`).
+
+    `call(model, prompt, cancel)` senkron bir fonksiyondur (metin veya None döner);
+    router'a ait thread havuzunda çalıştırılır. `cancel` bir threading.Event'tir: kaybeden
+    denemelerde set edilir, çağrı HTTP/akış döngüsünde bunu kontrol edip yanıtı kapatmalıdır.
+    """
+
+    def __init__(self, call, models, hedge=False, min_hedge_delay=1.0, failure_threshold=2, cooldown=60.0,
+                 overall_timeout=45.0):
+        self.call = call
+        self.models = models
+        self.hedge = hedge
+        self.min_hedge_delay = min_hedge_delay
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.overall_timeout = overall_timeout
+
+        self._health = {}
+        self._lock = threading.Lock() # Birden fazla thread aynı router'ı kullanabilir
+        # Kendi havuzumuz: asyncio.run() çıkışta varsayılan havuzu bekler,
+        # bu da iptal edilen (kaybeden) isteklerin bitmesini beklemek demek olurdu.
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="gemini")
+
+    def _get_health(self, model):
+        health = self._health.get(model)
+        if health is None:
+            health = self._health[model] = ModelHealth()
+        return health
+
+    def available_models(self):
+        """Devresi kapalı (sağlıklı) modeller; hepsi açıksa en erken soğuyanla denenir."""
+        now = time.monotonic()
+        with self._lock:
+            models = list(self.models)
+            healthy = [m for m in models if self._get_health(m).open_until <= now]
+            if healthy:
+                return healthy
+            return sorted(models, key=lambda m: self._get_health(m).open_until)[:1]
+
+    def _record(self, model, latency, ok):
+        with self._lock:
+            health = self._get_health(model)
+            health.calls += 1
+            if ok:
+                health.total_latency += latency
+                health.last_latency = latency
+                health.latencies.append(latency)
+                health.consecutive_failures = 0
+                health.open_until = 0.0
+            else:
+                health.failures += 1
+                health.consecutive_failures += 1
+                if health.consecutive_failures >= self.failure_threshold:
+                    health.open_until = time.monotonic() + self.cooldown
+                    print(f"⛔ {model} devre dışı ({self.cooldown:.0f} sn)")
+
+    def hedge_delay(self, model):
+        """Bu model için hedge bekleme süresi (saniye) veya None (hedge yok)."""
+        if not self.hedge:
+            return None
+        with self._lock:
+            p95 = self._get_health(model).p95()
+        return None if p95 is None else max(self.min_hedge_delay, p95)
+
+    async def _attempt(self, model, prompt, call, cancel):
+        start = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(self._executor, call, model, prompt, cancel)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            text = None
+        latency = time.monotonic() - start
+        self._record(model, latency, bool(text))
+        tracer.record("gemini.model_call", latency, error=not text, model=model)
+        return model, text
+
+    async def request(self, prompt, call=None, acquire=None):
+        """
+        İlk başarılı yanıtı döner: (metin, model) veya (None, None).
+        call: bu istek için `self.call` yerine kullanılacak fonksiyon (örn. akışlı çağrı).
+        acquire: her deneme (yedek/hedge dahil) başlamadan önce çağrılan senkron fonksiyon
+        (hız sınırlayıcı); bloklayabilir, False dönerse yeni deneme başlatılmaz.
+        """
+        call = call or self.call
+        queue = self.available_models()
+        running = set()
+        cancels = {} # görev -> threading.Event (kaybedenlerin HTTP isteğini durdurmak için)
+        deadline = time.monotonic() + self.overall_timeout
+        attempts = 0
+        hedge_after = None
+
+        try:
+            while queue or running:
+                if queue:
+                    if acquire is not None:
+                        loop = asyncio.get_running_loop()
+                        if not await loop.run_in_executor(self._executor, acquire):
+                            queue.clear() # İptal: çalışanları bekle, yenisini başlatma
+                            if not running:
+                                break
+                            continue
+                    model = queue.pop(0)
+                    if attempts:
+                        tracer.count("gemini.api_retry") # Hedge veya hata sonrası sıradaki model
+                    attempts += 1
+                    print(f"🚀 İstek Gönderiliyor: {model}...")
+                    cancel = threading.Event()
+                    task = asyncio.create_task(self._attempt(model, prompt, call, cancel))
+                    cancels[task] = cancel
+                    running.add(task)
+                    hedge_after = self.hedge_delay(model)
+
+                while running:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        tracer.count("gemini.api_deadline")
+                        return None, None
+                    # Hedge açıksa ve sırada model varsa p95 kadar, yoksa sonuç gelene kadar bekle
+                    hedging = queue and hedge_after is not None
+                    wait_for = min(hedge_after, remaining) if hedging else remaining
+                    done, running = await asyncio.wait(running, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+
+                    for task in done:
+                        cancels.pop(task, None)
+                        model, text = task.result()
+                        if text:
+                            return text, model
+                        print(f"⚠️ {model} BULUNAMADI/HATA. Sonraki...")
+                    if done and queue:
+                        break # Başarısız: sıradakini başlat (failover)
+                    if not done and hedging:
+                        tracer.count("gemini.api_hedge")
+                        break # p95 aşıldı: sıradakini de başlat
+            return None, None
+        finally:
+            # Kaybedenleri iptal et: görev + çalışan HTTP isteği (cancel event)
+            for task in running:
+                cancels[task].set()
+                task.cancel()
+
+    def stats(self):
+        now = time.monotonic()
+        with self._lock:
+            return {m: self._get_health(m).to_dict(now) for m in self.models}
@@ -0,0 +1,54 @@
+class ProcessRecord:
+    """
+    Tek bir işlemin sayısal kaydı.
+    Alanlar ham değerlerdir (byte, saniye, yüzde); metne çevirme sadece
+    gösterim anında yapılır (bkz. format_mb). __slots__ sayesinde binlerce
+    kayıtta sözlüğe göre çok daha az bellek kullanır.
+    """
+
+    __slots__ = ("pid", "ppid", "name", "username", "create_time", "rss", "vms", "cpu_percent", "path")
+
+    def __init__(self, pid, name, username=None, create_time=0.0, rss=0, vms=0, cpu_percent=0.0, path=None, ppid=None):
+        self.pid = pid
+        self.ppid = ppid
+        self.name = name
+        self.username = username
+        self.create_time = create_time
+        self.rss = rss
+        self.vms = vms
+        self.cpu_percent = cpu_percent
+        self.path = path # Analiz sırasında öğrenilirse doldurulur (arama için)
+
+    @property
+    def key(self):
+        """Tablo anahtarı: PID yeniden kullanılsa bile benzersiz."""
+        return (self.pid, self.create_time)
+
+    def to_info(self):
+        """
+        Analiz katmanının (GeminiAnalyzer / BatchAnalyzer) kullandığı sözlük.
+        Kayıt değiştirilmez; path/hash/signature bu sözlüğe eklenir.
+        """
+        info = {
+            'pid': self.pid,
+            'ppid': self.ppid,
+            'name': self.name,
+            'username': self.username,
+            'create_time': self.create_time,
+            'rss': self.rss,
+            'vms': self.vms,
+            'cpu_percent': self.cpu_percent,
+        }
+        if self.path:
+            info['path'] = self.path
+        return info
+
+    def __repr__(self):
+        return f"ProcessRecord(pid={self.pid}, name={self.name!r}, rss={self.rss})"
+
+
+def format_mb(num_bytes):
+    """Byte değerini arayüzde gösterilen "12.34 MB" biçimine çevirir."""
+    if num_bytes is None:
+        return "?"
+    return f"{num_bytes / (1024 * 1024):.2f} MB"
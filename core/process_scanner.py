@@ -1,109 +1,64 @@
 import psutil
-import hashlib
 import os
-import win32ui
-import win32gui
-import win32con
-import subprocess
-from PIL import Image
+from core.backends import get_backend
+from core.hash_cache import FileHashCache
+from core.hash_service import HashService
+from core.resource_history import ResourceHistory
+from core.signature import SignatureVerifier
+from core.tracing import tracer
 
 class ProcessScanner:
+    def __init__(self, db_path="process_audit.db", backend=None):
+        # Platform arka ucu (Windows: pywin32/PowerShell, Linux: /proc + manifest)
+        self.backend = backend or get_backend()
+        # Artımlı tarama motoru (önceki tabloyu saklar)
+        self.snapshot = self.backend.create_snapshot()
+        # Kalıcı hash önbelleği (dosya değişmediyse tekrar okunmaz)
+        self.hash_cache = FileHashCache(db_path)
+        # Paralel hash servisi (çok dosyalı analizlerde)
+        self.hash_service = HashService(self.hash_cache)
+        # İmza doğrulama (tek uzun ömürlü worker + hash'e göre önbellek)
+        self.signatures = SignatureVerifier(self.backend.create_signature_backend(), db_path=db_path)
+        self.last_diff = {"added": [], "removed": [], "updated": []}
+        # İşlem başına kaynak kullanımı geçmişi (sabit boyutlu halka tamponlar)
+        self.history = ResourceHistory()
+
     def get_running_processes(self):
         """
         Sistemde çalışan işlemleri listeler.
-        Dönen liste şunları içerir: pid, name, memory_info
+        Dönen liste ProcessRecord nesnelerinden oluşur (pid, name, rss, vms, cpu_percent...)
+        Sadece yeni/değişen işlemler sorgulanır; son farklar self.last_diff içinde tutulur.
         """
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'create_time', 'username']):
-            try:
-                p_info = proc.info
-                # Bellek kullanımını MB cinsine çevir
-                mem_mb = p_info['memory_info'].rss / (1024 * 1024)
-                p_info['memory_mb'] = f"{mem_mb:.2f} MB"
-                
-                processes.append(p_info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                pass
-        
-        # İsme göre sırala
-        return sorted(processes, key=lambda x: x['name'].lower())
+        with tracer.span("scanner.refresh"):
+            processes, self.last_diff = self.snapshot.refresh()
+        return processes
 
-    def get_process_icon(self, pid):
+    def get_process_changes(self, on_progress=None):
         """
-        İşlem ikonunu alır. Önce ExtractIconEx (daha hızlı/uyumlu) dener,
-        olmazsa SHGetFileInfo (daha kapsamlı) dener.
+        Tam liste ile birlikte son taramaya göre farkları (added/removed/updated) döner.
+        on_progress: tarama sürerken yeni bulunan işlemlerle parça parça çağrılır.
         """
-        try:
-            try:
-                proc = psutil.Process(pid)
-                path = proc.exe()
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                return None
-            
-            if not path:
-                return None
-
-            # YÖNTEM 1: ExtractIconEx (Eski ve güvenilir yöntem)
-            hicon = None
-            try:
-                large, small = win32gui.ExtractIconEx(path, 0)
-                if large:
-                    hicon = large[0]
-                    # small varsa temizle
-                    if small: win32gui.DestroyIcon(small[0])
-                    # large'ın geri kalanını temizle
-                    for h in large[1:]: win32gui.DestroyIcon(h)
-                elif small:
-                    hicon = small[0]
-                    for h in small[1:]: win32gui.DestroyIcon(h)
-            except:
-                pass
-
-            # YÖNTEM 2: SHGetFileInfo (Yedek)
-            if not hicon:
-                try:
-                    flags = win32con.SHGFI_ICON | win32con.SHGFI_LARGEICON
-                    retval, info = win32gui.SHGetFileInfo(path, 0, flags)
-                    if info and info[0]:
-                        hicon = info[0]
-                except:
-                    pass
-
-            if not hicon:
-                return None
-
-            # HICON -> PIL Image Dönüştürme
-            hdc = win32ui.CreateDCFromHandle(win32gui.GetDC(0))
-            hbmp = win32ui.CreateBitmap()
-            hbmp.CreateCompatibleBitmap(hdc, 32, 32)
-            
-            hdc_mem = hdc.CreateCompatibleDC()
-            hdc_mem.SelectObject(hbmp)
-            
-            # Çiz
-            win32gui.DrawIconEx(hdc_mem.GetHandleOutput(), 0, 0, hicon, 32, 32, 0, 0, 3) 
+        with tracer.span("scanner.refresh"):
+            processes, self.last_diff = self.snapshot.refresh(on_progress=on_progress)
+        return processes, self.last_diff
 
-            # Bitmap verisini al
-            bmpinfo = hbmp.GetInfo()
-            bmpstr = hbmp.GetBitmapBits(True)
-            
-            img = Image.frombuffer(
-                'RGB',
-                (bmpinfo['bmWidth'], bmpinfo['bmHeight']),
-                bmpstr, 'raw', 'BGRX', 0, 1)
+    def sample_resources(self):
+        """Son taramadaki tüm işlemler için CPU/RSS/thread/handle/I/O örneği kaydeder."""
+        self.history.sample(self.snapshot.processes())
 
-            img = img.copy()
-            
-            # Temizlik
-            win32gui.DestroyIcon(hicon)
-            win32gui.DeleteObject(hbmp.GetHandle())
-            hdc_mem.DeleteDC()
-            hdc.DeleteDC()
-            
-            return img
+    def get_resource_stats(self, pid, window=None):
+        """
+        İşlemin son `window` saniyedeki kaynak istatistikleri.
+        {ölçüm: {"min", "max", "avg", "slope", "count"} veya None}
+        """
+        return self.history.summary(pid, window)
 
-        except Exception:
+    def get_process_icon(self, pid):
+        """İşlem ikonunu alır (PIL Image). Platform desteklemiyorsa None."""
+        path = self.get_process_path(pid)
+        if not path:
             return None
+        return self.backend.get_file_icon(path)
 
     def get_process_details(self, pid):
         """
@@ -112,72 +67,48 @@ class ProcessScanner:
         """
         details = {"path": "Bilinmiyor", "hash": "-", "signature": "-"}
         try:
-            p = psutil.Process(pid)
-            path = p.exe() # En önemli bilgi
+            with tracer.span("scanner.path"):
+                path = psutil.Process(pid).exe() # En önemli bilgi
             if path:
-                details["path"] = path
-                # İmza kontrolü açık (Timeout korumalı)
-                details["signature"] = self._check_digital_signature(path)
-                # Hash açık (VirusTotal tarzi analiz için şart)
-                details["hash"] = self._calculate_file_hash(path)
+                details.update(self.get_file_details(path))
                 
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
         return details
 
-    def _calculate_file_hash(self, filepath):
-        """Bir dosyanın SHA256 özetini çıkarır. (Max 100MB)"""
-        try:
-            # Dosya boyutu kontrolü (100MB üzeri ise hesaplama)
-            if os.path.getsize(filepath) > 100 * 1024 * 1024:
-                return "Dosya Çok Büyük (>100MB) - Hash Atlandı"
+    def get_file_details(self, path):
+        """
+        Tek dosya için Hash ve İmza bilgisini getirir (tekli analiz).
+        Toplu analiz bunun yerine calculate_hashes / get_file_signatures kullanır.
+        """
+        details = {"path": path, "hash": "-", "signature": "-"}
+        # Hash açık (VirusTotal tarzi analiz için şart)
+        with tracer.span("scanner.hash"):
+            details["hash"] = self._calculate_file_hash(path)
+        # İmza kontrolü açık (Hash'e göre önbellekli)
+        with tracer.span("scanner.signature"):
+            details["signature"] = self.signatures.verify(path, details["hash"])
+        return details
 
-            sha256_hash = hashlib.sha256()
-            with open(filepath, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
-        except:
-            return None
+    def get_file_signatures(self, items):
+        """
+        Birden fazla dosyanın imzasını tek seferde doğrular.
+        items: [(yol, hash), ...] -> {yol: durum metni}
+        """
+        return self.signatures.verify_many(items)
 
-    def _check_digital_signature(self, filepath):
-        """PowerShell kullanarak dijital imzayı kontrol eder. (Timeout: 2s)"""
-        try:
-            cmd = [
-                "powershell", 
-                "-NoProfile", 
-                "-Command", 
-                f"Get-AuthenticodeSignature -FilePath '{filepath}' | Select-Object -ExpandProperty Status"
-            ]
-            
-            # Pencere açılmasını önle
-            creationflags = 0x08000000 # CREATE_NO_WINDOW
-            
-            # Subprocess ile çalıştır ve zaman aşımı ekle (1.5 sn yeterli)
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                timeout=1.5, 
-                creationflags=creationflags
-            )
-            status = result.stdout.strip()
-            
-            if "Valid" in status:
-                return "Geçerli (Doğrulanmış)"
-            elif "NotSigned" in status:
-                return "İmzasız"
-            elif "HashMismatch" in status:
-                return "İmza Bozuk (RİSKLİ)"
-            elif "NotTrusted" in status:
-                return "Güvenilmeyen Sertifika"
-            else:
-                return f"Durum: {status}" if status else "Bilinmiyor"
-                
-        except subprocess.TimeoutExpired:
-            return "Kontrol Zaman Aşımı"
-        except Exception:
-            return "Kontrol Edilemedi"
+    def calculate_hashes(self, paths):
+        """Birden fazla dosyayı paralel hash'ler; (yol, hash) çiftlerini tamamlandıkça döner."""
+        return self.hash_service.hash_many(paths)
+
+    def _calculate_file_hash(self, filepath):
+        """
+        Bir dosyanın SHA256 özetini çıkarır.
+        Yol/boyut/mtime/inode değişmediyse önbellekteki değer döner (disk okunmaz).
+        100MB üzeri dosyalarda atlamak yerine kısmi hash ("partial:...") hesaplanır.
+        Hash servisi üzerinden: aynı dosya başka thread'de hesaplanıyorsa o sonuç beklenir.
+        """
+        return self.hash_service.submit(filepath).result()
 
     def kill_process(self, pid):
         """Verilen PID'ye sahip işlemi sonlandırır."""
@@ -199,3 +130,15 @@ class ProcessScanner:
             return p.exe()
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return None
+
+    def open_location(self, pid):
+        """İşlemin dosyasını sistemin dosya yöneticisinde gösterir. Başarılıysa True."""
+        path = self.get_process_path(pid)
+        if not path or not os.path.exists(path):
+            return False
+        try:
+            self.backend.open_location(path)
+            return True
+        except Exception as e:
+            print(f"⚠️ Konum açılamadı: {e}")
+            return False
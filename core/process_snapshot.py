@@ -0,0 +1,108 @@
+import psutil
+from core.process_record import ProcessRecord
+
+
+class ProcessSnapshot:
+    """
+    Artımlı (incremental) işlem tablosu.
+    Önceki taramanın tablosunu (pid, create_time) anahtarıyla saklar; yeni
+    işlemler için tam sorgu yapar, bilinen işlemler için sadece bellek bilgisini
+    günceller. Her yenilemede eklenen / kapanan / değişen işlemleri döner.
+    """
+
+    def __init__(self):
+        self.table = {}      # (pid, create_time) -> ProcessRecord
+        self._procs = {}     # pid -> ((pid, create_time), psutil.Process)
+        self._sorted = None  # İsme göre sıralı görünüm (ekleme/silme olursa sıfırlanır)
+
+    def refresh(self, on_progress=None, chunk_size=256):
+        """
+        Tabloyu günceller.
+        Dönüş: (isme göre sıralı tam liste, diff)
+        diff = {"added": [kayıt], "removed": [kayıt], "updated": [kayıt]}
+        on_progress verilirse yeni işlemler `chunk_size`'lık parçalar halinde
+        (o ana kadar eklenenler) bildirilir; ilk açılışta liste kademeli dolar.
+        """
+        diff = {"added": [], "removed": [], "updated": []}
+        current_pids = set(psutil.pids())
+
+        # 1. Kapanan işlemler
+        for pid in [p for p in self._procs if p not in current_pids]:
+            self._drop(pid, diff)
+
+        # 2. Bilinen işlemler: sadece bellek ve CPU güncelle (yerinde, yeni nesne yok)
+        for pid, (key, proc) in list(self._procs.items()):
+            try:
+                with proc.oneshot():
+                    # PID yeniden kullanıldıysa create_time farklı olur
+                    if not proc.is_running():
+                        self._drop(pid, diff)
+                        continue
+                    rss, vms = proc.memory_info()[:2]
+                    cpu = proc.cpu_percent(interval=None)
+                    ppid = proc.ppid()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                self._drop(pid, diff)
+                continue
+
+            record = self.table[key]
+            record.cpu_percent = cpu # CPU değişimi tek başına "updated" sayılmaz
+            if rss != record.rss or ppid != record.ppid:
+                # Ebeveyn değişimi: ebeveyni kapanan işlem init'e / yeni ebeveyne devredildi
+                record.rss = rss
+                record.vms = vms
+                record.ppid = ppid
+                diff["updated"].append(record)
+
+        # 3. Yeni işlemler: tam sorgu
+        for pid in current_pids:
+            if pid in self._procs:
+                continue
+            try:
+                proc = psutil.Process(pid)
+                with proc.oneshot():
+                    mem = proc.memory_info()
+                    record = ProcessRecord(
+                        pid,
+                        proc.name(),
+                        username=self._safe_username(proc),
+                        create_time=proc.create_time(),
+                        rss=mem.rss,
+                        vms=mem.vms,
+                        cpu_percent=proc.cpu_percent(interval=None), # İlk çağrı 0.0 (referans)
+                        ppid=proc.ppid(),
+                    )
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+
+            key = record.key
+            self.table[key] = record
+            self._procs[pid] = (key, proc)
+            diff["added"].append(record)
+            if on_progress and len(diff["added"]) % chunk_size == 0:
+                on_progress(list(diff["added"]))
+
+        if diff["added"] or diff["removed"]:
+            self._sorted = None
+        if self._sorted is None:
+            self._sorted = sorted(self.table.values(), key=lambda x: x.name.lower())
+
+        return list(self._sorted), diff
+
+    def processes(self):
+        """Canlı işlemler: [(ProcessRecord, psutil.Process), ...]"""
+        return [(self.table[key], proc) for key, proc in self._procs.values() if key in self.table]
+
+    def _drop(self, pid, diff):
+        key, _ = self._procs.pop(pid)
+        record = self.table.pop(key, None)
+        if record is not None:
+            diff["removed"].append(record)
+
+    @staticmethod
+    def _safe_username(proc):
+        # process_iter ile aynı davranış: erişim yoksa None
+        try:
+            return proc.username()
+        except (psutil.AccessDenied, KeyError):
+            return None
@@ -0,0 +1,129 @@
+import numpy as np
+
+# Sıralanabilir sütunlar (arayüzdeki "mem" = rss)
+SORT_COLUMNS = ("name", "pid", "rss", "vms", "cpu", "create_time")
+
+
+class ProcessTable:
+    """
+    İşlem listesinin sütunlu (columnar) görünümü.
+    Her alan ayrı bir NumPy dizisinde tutulur; isimler tamsayı kimliklerine
+    çevrilir (interning). Sıralama, filtreleme, ilk-N ve isme göre gruplama
+    Python döngüsü olmadan yapılır. Satır i, `records[i]` kaydına karşılık gelir.
+
+    Tablo bir taramanın anlık görüntüsüdür: kayıtlar yerinde güncellendiğinde
+    (yeni RSS vb.) tablo yeniden kurulmalıdır.
+    """
+
+    def __init__(self, records):
+        self.records = list(records)
+        n = len(self.records)
+
+        self.pid = np.fromiter((r.pid for r in self.records), dtype=np.int64, count=n)
+        self.rss = np.fromiter((r.rss or 0 for r in self.records), dtype=np.int64, count=n)
+        self.vms = np.fromiter((r.vms or 0 for r in self.records), dtype=np.int64, count=n)
+        self.cpu = np.fromiter((r.cpu_percent or 0.0 for r in self.records), dtype=np.float64, count=n)
+        self.create_time = np.fromiter((r.create_time or 0.0 for r in self.records), dtype=np.float64, count=n)
+
+        # İsim interning: aynı isim (örn. 40 adet chrome.exe) tek kimlik
+        ids = {}
+        self.names = [] # kimlik -> isim
+        name_id = np.empty(n, dtype=np.int32)
+        for i, record in enumerate(self.records):
+            name = record.name or ""
+            idx = ids.get(name)
+            if idx is None:
+                idx = ids[name] = len(self.names)
+                self.names.append(name)
+            name_id[i] = idx
+        self.name_id = name_id
+
+        # İsme göre sıralama için her kimliğin alfabetik sırası (büyük/küçük harf duyarsız)
+        order = sorted(range(len(self.names)), key=lambda i: self.names[i].lower())
+        rank = np.empty(len(self.names), dtype=np.int32)
+        rank[order] = np.arange(len(order), dtype=np.int32)
+        self.name_rank = rank[self.name_id] if n else np.empty(0, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.records)
+
+    def column(self, name):
+        if name == "name":
+            return self.name_rank
+        if name == "mem":
+            return self.rss
+        if name not in SORT_COLUMNS:
+            raise ValueError(f"Bilinmeyen sütun: {name}")
+        return getattr(self, name)
+
+    # --- Filtreler (boolean maske döner) ---
+
+    def name_mask(self, substring):
+        """İsmi `substring` içeren satırlar (büyük/küçük harf duyarsız)."""
+        substring = (substring or "").lower()
+        if not substring:
+            return np.ones(len(self), dtype=bool)
+        matching = [i for i, name in enumerate(self.names) if substring in name.lower()]
+        return np.isin(self.name_id, matching)
+
+    def pid_mask(self, pids):
+        """PID'si verilen kümede olan satırlar (örn. arama indeksinin sonucu)."""
+        return np.isin(self.pid, np.fromiter(pids, dtype=np.int64))
+
+    # --- Sıralama / seçim (satır indeksleri döner) ---
+
+    def argsort(self, column="name", descending=False, mask=None):
+        """Sıralı satır indeksleri. mask verilirse sadece seçili satırlar."""
+        rows = np.flatnonzero(mask) if mask is not None else np.arange(len(self))
+        values = self.column(column)[rows]
+        # Kararlı sıralama: eşit değerler giriş sırasını korur
+        order = np.argsort(-values if descending else values, kind="stable")
+        return rows[order]
+
+    def top(self, column="rss", n=10, mask=None, descending=True):
+        """
+        Sıralamada ilk `n` satır: argsort(column, descending, mask)[:n] ile aynı.
+        Tam sıralama yerine argpartition kullanılır.
+        """
+        rows = np.flatnonzero(mask) if mask is not None else np.arange(len(self))
+        sign = -1 if descending else 1
+        if len(rows) > n:
+            values = sign * self.column(column)[rows]
+            rows = rows[np.argpartition(values, n - 1)[:n]]
+        values = sign * self.column(column)[rows]
+        return rows[np.argsort(values, kind="stable")]
+
+    def take(self, rows):
+        """Satır indekslerini kayıt listesine çevirir."""
+        return [self.records[i] for i in rows]
+
+    def sorted_records(self, column="name", descending=False, mask=None):
+        return self.take(self.argsort(column, descending, mask))
+
+    # --- Gruplama ---
+
+    def group_by_name(self, mask=None):
+        """
+        Aynı çalıştırılabilir dosya adına sahip işlemleri toplar (örn. tüm chrome.exe).
+        Dönüş: [{"name", "count", "rss", "cpu"}, ...] toplam RSS'e göre azalan.
+        """
+        name_id = self.name_id if mask is None else self.name_id[mask]
+        rss = self.rss if mask is None else self.rss[mask]
+        cpu = self.cpu if mask is None else self.cpu[mask]
+
+        size = len(self.names)
+        counts = np.bincount(name_id, minlength=size)
+        rss_total = np.bincount(name_id, weights=rss, minlength=size)
+        cpu_total = np.bincount(name_id, weights=cpu, minlength=size)
+
+        present = np.flatnonzero(counts)
+        present = present[np.argsort(-rss_total[present], kind="stable")]
+        return [
+            {
+                "name": self.names[i],
+                "count": int(counts[i]),
+                "rss": int(rss_total[i]),
+                "cpu": float(cpu_total[i]),
+            }
+            for i in present
+        ]
@@ -0,0 +1,164 @@
+class ProcessTree:
+    """
+    İşlem ağacı (ebeveyn -> çocuklar).
+    Snapshot diff'leriyle artımlı güncellenir: sadece eklenen / kapanan /
+    ebeveyni değişen işlemlerin bağlantıları değişir. Ebeveyni kapanmış
+    (veya PID'i yeniden kullanılmış) işlemler köke taşınır.
+    """
+
+    def __init__(self):
+        self.nodes = {}     # pid -> ProcessRecord
+        self.children = {}  # pid -> {çocuk pid, ...}
+        self.parent = {}    # pid -> bağlı olduğu ebeveyn pid (kökse yok)
+
+    def build(self, records):
+        """Ağacı sıfırdan kurar."""
+        self.nodes.clear()
+        self.children.clear()
+        self.parent.clear()
+        for record in records:
+            self.nodes[record.pid] = record
+        for record in records:
+            self._link(record)
+
+    def apply_diff(self, diff):
+        """ProcessScanner diff'ini uygular (added / removed / updated)."""
+        for record in diff.get("removed", []):
+            if self.nodes.get(record.pid) is record:
+                self._remove(record.pid)
+        added = diff.get("added", [])
+        for record in added:
+            self.nodes[record.pid] = record
+        # Yeni ebeveyn gelmiş olabilir: hem yeni kayıtlar hem kökteki yetimler bağlanır
+        for record in added:
+            self._link(record)
+        if added:
+            for pid in [p for p in self.nodes if p not in self.parent]:
+                self._link(self.nodes[pid])
+        # Ebeveyni değişen (örn. init'e devredilen) işlemler
+        for record in diff.get("updated", []):
+            if self.nodes.get(record.pid) is record and self.parent.get(record.pid) != self._parent_pid(record):
+                self._unlink(record.pid)
+                self._link(record)
+
+    def _parent_pid(self, record):
+        ppid = getattr(record, 'ppid', None)
+        if ppid is None or ppid == record.pid:
+            return None # PID 0 / System Idle kendisinin ebeveyni
+        parent = self.nodes.get(ppid)
+        # PID yeniden kullanıldıysa "ebeveyn" çocuktan sonra başlamış olur
+        if parent is None or parent.create_time > record.create_time:
+            return None
+        return ppid
+
+    def _link(self, record):
+        ppid = self._parent_pid(record)
+        if ppid is None or self.parent.get(record.pid) == ppid:
+            return
+        # Döngü koruması (bozuk / yarış durumlu ppid bilgisi)
+        node = ppid
+        while node is not None:
+            if node == record.pid:
+                return
+            node = self.parent.get(node)
+        self.parent[record.pid] = ppid
+        self.children.setdefault(ppid, set()).add(record.pid)
+
+    def _unlink(self, pid):
+        ppid = self.parent.pop(pid, None)
+        if ppid is not None:
+            siblings = self.children.get(ppid)
+            if siblings is not None:
+                siblings.discard(pid)
+                if not siblings:
+                    del self.children[ppid]
+
+    def _remove(self, pid):
+        self._unlink(pid)
+        self.nodes.pop(pid, None)
+        # Çocuklar köke taşınır (işletim sistemi de onları yeniden ebeveynler)
+        for child in self.children.pop(pid, ()):
+            self.parent.pop(child, None)
+
+    def roots(self):
+        return [pid for pid in self.nodes if pid not in self.parent]
+
+    def subtree(self, pid):
+        """pid ve tüm torunlarının kayıtları (önce ebeveyn)."""
+        if pid not in self.nodes:
+            return []
+        result = []
+        stack = [pid]
+        while stack:
+            current = stack.pop()
+            result.append(self.nodes[current])
+            stack.extend(self.children.get(current, ()))
+        return result
+
+    def ancestors(self, pid):
+        result = []
+        node = self.parent.get(pid)
+        while node is not None:
+            result.append(node)
+            node = self.parent.get(node)
+        return result
+
+    def totals(self):
+        """
+        Alt ağaç toplamları, tek geçişte (çocuklar ebeveynden önce işlenir).
+        Dönüş: {pid: {"rss", "cpu", "count"}}
+        """
+        totals = {}
+        order = []
+        stack = self.roots()
+        while stack:
+            pid = stack.pop()
+            order.append(pid)
+            stack.extend(self.children.get(pid, ()))
+        for pid in reversed(order):
+            record = self.nodes[pid]
+            total = {"rss": record.rss or 0, "cpu": record.cpu_percent or 0.0, "count": 1}
+            for child in self.children.get(pid, ()):
+                sub = totals[child]
+                total["rss"] += sub["rss"]
+                total["cpu"] += sub["cpu"]
+                total["count"] += sub["count"]
+            totals[pid] = total
+        return totals
+
+    def flatten(self, order, include=None):
+        """
+        Ağacı liste görünümü için düzleştirir: [(kayıt, derinlik), ...]
+        order: kardeşlerin sırası (örn. sıralanmış kayıt listesi).
+        include: verilirse sadece bu PID'ler ve ataları gösterilir (arama).
+        """
+        if include is not None:
+            visible = set()
+            for pid in include:
+                if pid in self.nodes and pid not in visible:
+                    visible.add(pid)
+                    visible.update(self.ancestors(pid))
+        else:
+            visible = None
+
+        # Kardeşleri verilen sırada grupla (tek geçiş)
+        ordered_children = {}
+        roots = []
+        for record in order:
+            pid = record.pid
+            if self.nodes.get(pid) is not record or (visible is not None and pid not in visible):
+                continue
+            ppid = self.parent.get(pid)
+            if ppid is None:
+                roots.append(pid)
+            else:
+                ordered_children.setdefault(ppid, []).append(pid)
+
+        result = []
+        stack = [(pid, 0) for pid in reversed(roots)]
+        while stack:
+            pid, depth = stack.pop()
+            result.append((self.nodes[pid], depth))
+            for child in reversed(ordered_children.get(pid, ())):
+                stack.append((child, depth + 1))
+        return result
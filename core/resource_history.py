@@ -0,0 +1,200 @@
+import math
+import threading
+import time
+from array import array
+import psutil
+
+# Kaydedilen ölçümler ve array tip kodları. Ondalık gerekmeyenler tamsayı
+# tutulur (8 yerine 4 bayt: 'f', 'i'); baytlar 64 bit ('q').
+METRICS = ("cpu_percent", "rss", "num_threads", "num_handles", "read_bytes", "write_bytes")
+TYPECODES = {
+    "cpu_percent": "f",
+    "rss": "q",
+    "num_threads": "i",
+    "num_handles": "i",
+    "read_bytes": "q",
+    "write_bytes": "q",
+}
+
+# Okunamayan örnekler: ondalık tamponlarda NaN, tamsayı tamponlarda -1
+MISSING_INT = -1
+
+
+class RingBuffer:
+    """
+    Sabit kapasiteli, array tabanlı halka tampon.
+    Tampon örnek geldikçe büyür (kısa ömürlü işlemler tüm kapasiteyi ayırmaz);
+    kapasite dolunca en eski değerin üzerine yazılır.
+    """
+
+    __slots__ = ("capacity", "_data", "_start", "_float")
+
+    def __init__(self, capacity, typecode="d"):
+        self.capacity = capacity
+        self._data = array(typecode)
+        self._start = 0
+        self._float = typecode in "fd"
+
+    @property
+    def missing(self):
+        """Okunamayan örnek için yazılan değer."""
+        return math.nan if self._float else MISSING_INT
+
+    def is_missing(self, value):
+        return math.isnan(value) if self._float else value == MISSING_INT
+
+    def append(self, value):
+        if value is None:
+            value = self.missing
+        if len(self._data) < self.capacity:
+            self._data.append(value)
+        else:
+            self._data[self._start] = value
+            self._start = (self._start + 1) % self.capacity
+
+    def values(self):
+        """Eskiden yeniye sıralı değerler."""
+        if not self._start:
+            return self._data.tolist()
+        return self._data[self._start:].tolist() + self._data[:self._start].tolist()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class ProcessSeries:
+    """Tek bir işlemin zaman serisi: zaman damgaları + her ölçüm için bir halka tampon."""
+
+    __slots__ = ("times", "metrics")
+
+    def __init__(self, capacity):
+        self.times = RingBuffer(capacity)
+        self.metrics = {name: RingBuffer(capacity, TYPECODES[name]) for name in METRICS}
+
+    def append(self, timestamp, sample):
+        self.times.append(timestamp)
+        for name, buffer in self.metrics.items():
+            buffer.append(sample.get(name))
+
+
+class ResourceHistory:
+    """
+    İşlem başına kaynak kullanımı geçmişi (CPU%, RSS, thread, handle/fd, I/O).
+    Her işlem için en fazla `capacity` örnek tutulur; işlem kapanınca
+    serisi silinir. Anahtar (pid, create_time) olduğundan yeniden kullanılan
+    PID'ler eski geçmişi devralmaz.
+    """
+
+    def __init__(self, capacity=360):
+        self.capacity = capacity
+        self._series = {}  # (pid, create_time) -> ProcessSeries
+        self._keys = {}    # pid -> (pid, create_time)
+        self._lock = threading.Lock()
+
+    def sample(self, processes):
+        """
+        processes: [(ProcessRecord, psutil.Process), ...]
+        Tüm işlemler için tek bir örnek alır; listede olmayanların geçmişi silinir.
+        CPU yüzdesi kayıttan alınır (taramada hesaplanmış olur).
+        """
+        now = time.time()
+        seen = set()
+        samples = []
+        for record, proc in processes:
+            sample = self._read(proc)
+            if sample is not None:
+                sample["cpu_percent"] = record.cpu_percent
+                seen.add(record.key)
+                samples.append((record.key, sample))
+
+        with self._lock:
+            for key in [k for k in self._series if k not in seen]:
+                self._forget(key)
+            for key, sample in samples:
+                series = self._series.get(key)
+                if series is None:
+                    series = self._series[key] = ProcessSeries(self.capacity)
+                    self._keys[key[0]] = key
+                series.append(now, sample)
+
+    @staticmethod
+    def _read(proc):
+        sample = {}
+        try:
+            with proc.oneshot():
+                sample["rss"] = proc.memory_info().rss
+                sample["num_threads"] = proc.num_threads()
+                try:
+                    # Windows: handle sayısı, diğerleri: açık dosya tanımlayıcısı
+                    sample["num_handles"] = proc.num_handles() if psutil.WINDOWS else proc.num_fds()
+                except (psutil.AccessDenied, AttributeError):
+                    pass
+                try:
+                    io = proc.io_counters()
+                    sample["read_bytes"] = io.read_bytes
+                    sample["write_bytes"] = io.write_bytes
+                except (psutil.AccessDenied, AttributeError):
+                    pass
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return None
+        except psutil.AccessDenied:
+            # Korumalı işlem: okunabilenler (varsa) yine kaydedilir
+            if not sample:
+                return None
+        return sample
+
+    def _forget(self, key):
+        self._series.pop(key, None)
+        if self._keys.get(key[0]) == key:
+            del self._keys[key[0]]
+
+    def forget(self, key):
+        with self._lock:
+            self._forget(key)
+
+    def series(self, pid, metric, window=None):
+        """
+        [(zaman, değer), ...] — son `window` saniye (None: tüm geçmiş).
+        Okunamayan örnekler atlanır.
+        """
+        with self._lock:
+            key = self._keys.get(pid)
+            series = self._series.get(key) if key else None
+            if series is None:
+                return []
+            times = series.times.values()
+            buffer = series.metrics[metric]
+            values = buffer.values()
+
+        since = times[-1] - window if (window and times) else None
+        return [(t, v) for t, v in zip(times, values)
+                if not buffer.is_missing(v) and (since is None or t >= since)]
+
+    def stats(self, pid, metric, window=None):
+        """
+        Pencere içindeki min / max / ortalama / eğim (birim/saniye).
+        Eğim en küçük kareler ile hesaplanır; bellek sızıntısı gibi sürekli
+        artışlar pozitif eğim olarak görünür. Veri yoksa None.
+        """
+        points = self.series(pid, metric, window)
+        if not points:
+            return None
+
+        values = [v for _, v in points]
+        count = len(values)
+        avg = sum(values) / count
+
+        slope = 0.0
+        if count > 1:
+            t0 = points[0][0]
+            mean_t = sum(t - t0 for t, _ in points) / count
+            var_t = sum((t - t0 - mean_t) ** 2 for t, _ in points)
+            if var_t > 0:
+                cov = sum((t - t0 - mean_t) * (v - avg) for t, v in points)
+                slope = cov / var_t
+
+        return {"min": min(values), "max": max(values), "avg": avg, "slope": slope, "count": count}
+
+    def summary(self, pid, window=None):
+        """Tüm ölçümler için stats(): {ölçüm: {...} veya None}"""
+        return {metric: self.stats(pid, metric, window) for metric in METRICS}
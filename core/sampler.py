@@ -0,0 +1,75 @@
+import queue
+import threading
+import time
+
+
+class ProcessSampler:
+    """
+    Arka planda periyodik işlem taraması.
+    Tarama UI thread'inden ayrı çalışır; her turun sonucu (tam liste + diff)
+    bir kuyruğa konur. Arayüz bu kuyruğu `after()` ile yoklayarak sadece
+    değişen satırları günceller.
+
+    Kuyruk mesajları:
+        ("partial", [kayıt, ...])        -> ilk taramada kademeli dolum
+        ("snapshot", liste, diff)        -> tamamlanan tur
+
+    history_interval verilirse kaynak geçmişi (scanner.history) taramadan bağımsız
+    olarak bu aralıkla örneklenir (son taramanın işlem listesiyle); None ise
+    kaynak örneklemesi yapılmaz.
+    """
+
+    def __init__(self, scanner, interval=3.0, history_interval=None):
+        self.scanner = scanner
+        self.interval = interval
+        self.history_interval = history_interval
+        self._last_history = 0.0
+        self.queue = queue.Queue()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="process-sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def trigger(self):
+        """Beklemeden bir sonraki taramayı başlatır (örn. ⟳ butonu)."""
+        self._wake.set()
+
+    def _loop(self):
+        first = True
+        next_scan = 0.0
+        while not self._stop.is_set():
+            try:
+                if time.monotonic() >= next_scan:
+                    on_progress = (lambda partial: self.queue.put(("partial", partial))) if first else None
+                    first = False
+                    processes, diff = self.scanner.get_process_changes(on_progress=on_progress)
+                    self.queue.put(("snapshot", processes, diff))
+                    next_scan = time.monotonic() + self.interval
+                self._sample_history()
+            except Exception as e:
+                print(f"⚠️ Örnekleme Hatası: {e}")
+                next_scan = time.monotonic() + self.interval
+
+            # Tarama ve kaynak örneklemesi ayrı zamanlanır (history_interval, interval'in katı olmak zorunda değil)
+            deadline = next_scan
+            if self.history_interval:
+                deadline = min(deadline, self._last_history + self.history_interval)
+            if self._wake.wait(max(0.0, deadline - time.monotonic())):
+                next_scan = 0.0 # trigger(): hemen tara
+            self._wake.clear()
+
+    def _sample_history(self):
+        if not self.history_interval:
+            return
+        now = time.monotonic()
+        if now - self._last_history >= self.history_interval:
+            self._last_history = now
+            self.scanner.sample_resources()
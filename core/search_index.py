@@ -0,0 +1,103 @@
+class ProcessSearchIndex:
+    """
+    İşlem listesi için önceden hesaplanmış arama indeksi.
+    Her işlem için küçük harfli "isim / PID / dosya yolu" metni bir kez hazırlanır
+    ve trigram (3'lü harf grubu) indeksine eklenir. Kullanıcı yazmaya devam
+    ettikçe (yeni sorgu eskisini içeriyorsa) arama önceki sonuç üzerinde daraltılır.
+    """
+
+    def __init__(self):
+        self._entries = {}   # pid -> (kayıt, aranacak metin)
+        self._trigrams = {}  # trigram -> {pid, ...}
+        self._last_query = None
+        self._last_result = None # Son sorgunun eşleşen PID'leri
+
+    def build(self, records):
+        """İndeksi sıfırdan kurar."""
+        self._entries.clear()
+        self._trigrams.clear()
+        for record in records:
+            self.add(record)
+
+    def apply_diff(self, diff):
+        """ProcessScanner diff'ini (added/removed/updated) indekse uygular."""
+        for record in diff.get("removed", []):
+            self.remove(record.pid)
+        for record in diff.get("added", []):
+            self.add(record)
+
+    def add(self, record):
+        """Kaydı ekler (aynı PID varsa yeniden indeksler; örn. path sonradan geldiyse)."""
+        pid = record.pid
+        if pid in self._entries:
+            self.remove(pid)
+
+        text = self._make_text(record)
+        self._entries[pid] = (record, text)
+        for tri in self._trigrams_of(text):
+            self._trigrams.setdefault(tri, set()).add(pid)
+        self._invalidate()
+
+    def remove(self, pid):
+        entry = self._entries.pop(pid, None)
+        if entry is None:
+            return
+        for tri in self._trigrams_of(entry[1]):
+            bucket = self._trigrams.get(tri)
+            if bucket is not None:
+                bucket.discard(pid)
+                if not bucket:
+                    del self._trigrams[tri]
+        self._invalidate()
+
+    def search(self, query):
+        """Sorguyu içeren kayıtları döner (sırasız)."""
+        query = query.strip().lower()
+        if not query:
+            self._last_query, self._last_result = query, None
+            return [entry[0] for entry in self._entries.values()]
+
+        # Artımlı daraltma: "chr" -> "chro" ise sadece önceki sonuçlara bak
+        if self._last_result is not None and self._last_query and self._last_query in query:
+            candidates = self._last_result
+        elif len(query) >= 3:
+            candidates = self._candidates_from_trigrams(query)
+        else:
+            candidates = self._entries.keys()
+
+        result = [pid for pid in candidates if query in self._entries[pid][1]]
+        self._last_query, self._last_result = query, result
+        return [self._entries[pid][0] for pid in result]
+
+    def _candidates_from_trigrams(self, query):
+        # En küçük kümeden başlayarak kesişim al
+        buckets = []
+        for tri in self._trigrams_of(query):
+            bucket = self._trigrams.get(tri)
+            if not bucket:
+                return []
+            buckets.append(bucket)
+        buckets.sort(key=len)
+        result = set(buckets[0])
+        for bucket in buckets[1:]:
+            result &= bucket
+            if not result:
+                break
+        return result
+
+    def _invalidate(self):
+        self._last_query = None
+        self._last_result = None
+
+    @staticmethod
+    def _make_text(record):
+        # Ayırıcı, alanlar arası sahte eşleşmeleri önler
+        return "\x00".join((
+            (record.name or '').lower(),
+            str(record.pid),
+            (record.path or '').lower(),
+        ))
+
+    @staticmethod
+    def _trigrams_of(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
@@ -0,0 +1,357 @@
+import base64
+import glob
+import hashlib
+import os
+import queue
+import subprocess
+import threading
+from datetime import datetime
+from core.storage import Database
+from core.tracing import tracer
+
+# Arka uçların döndürdüğü ortak durum kodları (Get-AuthenticodeSignature ile aynı adlar)
+STATUS_VALID = "Valid"
+STATUS_NOT_SIGNED = "NotSigned"
+STATUS_HASH_MISMATCH = "HashMismatch"
+STATUS_NOT_TRUSTED = "NotTrusted"
+STATUS_TIMEOUT = "Timeout"
+STATUS_ERROR = "Error"
+
+
+def format_status(status):
+    """Durum kodunu arayüzde/prompt'ta kullanılan metne çevirir."""
+    if not status:
+        return "Bilinmiyor"
+    if "Valid" in status:
+        return "Geçerli (Doğrulanmış)"
+    elif "NotSigned" in status:
+        return "İmzasız"
+    elif "HashMismatch" in status:
+        return "İmza Bozuk (RİSKLİ)"
+    elif "NotTrusted" in status:
+        return "Güvenilmeyen Sertifika"
+    elif status == STATUS_TIMEOUT:
+        return "Kontrol Zaman Aşımı"
+    elif status == STATUS_ERROR:
+        return "Kontrol Edilemedi"
+    return f"Durum: {status}"
+
+
+class SignatureBackend:
+    """İmza doğrulama arka ucu arayüzü."""
+
+    name = "base"
+
+    def verify_many(self, items):
+        """items: [(yol, bilinen hash veya None), ...] -> {yol: durum kodu}."""
+        raise NotImplementedError
+
+    def verify(self, path, file_hash=None):
+        return self.verify_many([(path, file_hash)]).get(path, STATUS_ERROR)
+
+    def cache_key(self):
+        """
+        Önbellek anahtarındaki arka uç adı. Sonucu dış veriye (manifest vb.)
+        bağlı arka uçlar, o verinin durumunu da ekler; veri değişince eski kayıtlar kullanılmaz.
+        """
+        return self.name
+
+    def close(self):
+        pass
+
+
+class PowerShellSignatureBackend(SignatureBackend):
+    """
+    Windows: Tek bir uzun ömürlü PowerShell işlemi.
+    Her satırda bir dosya yolu okur, Get-AuthenticodeSignature sonucunu bir satır
+    olarak yazar. Böylece her dosya için ayrı PowerShell başlatma maliyeti ödenmez.
+    """
+
+    name = "powershell"
+
+    SCRIPT = (
+        "[Console]::InputEncoding = [Text.Encoding]::UTF8;"
+        "[Console]::OutputEncoding = [Text.Encoding]::UTF8;"
+        "while ($true) {"
+        " $p = [Console]::In.ReadLine(); if ($p -eq $null) { break };"
+        " try { $s = (Get-AuthenticodeSignature -LiteralPath $p -ErrorAction Stop).Status } catch { $s = 'Error' };"
+        " [Console]::Out.WriteLine([string]$s); [Console]::Out.Flush()"
+        "}"
+    )
+
+    def __init__(self, timeout=5.0):
+        self.timeout = timeout
+        self._proc = None
+        self._lines = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        encoded = base64.b64encode(self.SCRIPT.encode("utf-16-le")).decode("ascii")
+        self._proc = subprocess.Popen(
+            ["powershell", "-NoProfile", "-NonInteractive", "-EncodedCommand", encoded],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+            creationflags=0x08000000 # CREATE_NO_WINDOW
+        )
+        # Okuma ayrı thread'de: zaman aşımı ile beklenebilsin
+        self._lines = queue.Queue()
+        threading.Thread(target=self._reader, args=(self._proc, self._lines), daemon=True).start()
+
+    @staticmethod
+    def _reader(proc, lines):
+        for line in proc.stdout:
+            lines.put(line.strip())
+        lines.put(None) # İşlem kapandı
+
+    def verify_many(self, items):
+        results = {}
+        with self._lock:
+            for path, _ in items: # Authenticode dosyanın kendisine bakar; hash kullanılmaz
+                results[path] = self._query(path)
+        return results
+
+    def _query(self, path):
+        try:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            self._proc.stdin.write(path + "\n")
+            self._proc.stdin.flush()
+            status = self._lines.get(timeout=self.timeout)
+            if status is None:
+                self._proc = None
+                return STATUS_ERROR
+            return status or STATUS_ERROR
+        except queue.Empty:
+            # Takılan işlemi kapat; sonraki sorguda yenisi başlar
+            self.close()
+            return STATUS_TIMEOUT
+        except Exception:
+            self.close()
+            return STATUS_ERROR
+
+    def close(self):
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+            except Exception:
+                pass
+            self._proc = None
+
+
+class ChecksumManifestBackend(SignatureBackend):
+    """
+    Linux/test: Sağlama toplamı (checksum) manifestleriyle doğrulama.
+    - sha256sum biçimli manifest dosyaları ("<hash>  <yol>"): hash listede varsa Valid.
+    - dpkg veritabanı (/var/lib/dpkg/info/*.md5sums): paket dosyası ise MD5
+      karşılaştırılır; eşleşirse Valid, eşleşmezse HashMismatch.
+    Hiçbirinde yoksa NotSigned.
+    Çağıranın bildiği SHA256 ile karşılaştırılır; dosya yalnızca dpkg MD5'i için
+    (veya hash bilinmiyorsa) okunur. Manifest/dpkg değişince veriler yeniden yüklenir.
+    """
+
+    name = "manifest"
+
+    def __init__(self, manifests=None, dpkg_info_dir="/var/lib/dpkg/info"):
+        self.manifests = list(manifests or [])
+        self.dpkg_info_dir = dpkg_info_dir
+        self.trusted_sha256 = set()
+        self._dpkg_md5 = None # Yol -> md5 (ilk kullanımda yüklenir)
+        self._state = None    # Yüklü verilerin durumu (mtime'lar)
+        self._lock = threading.Lock()
+
+    def _current_state(self):
+        """Manifestlerin ve dpkg info dizininin mtime'ları (paket kur/kaldır dizini değiştirir)."""
+        state = []
+        for path in self.manifests + [self.dpkg_info_dir]:
+            try:
+                state.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                state.append(None)
+        return tuple(state)
+
+    def _ensure_loaded(self):
+        state = self._current_state()
+        if state == self._state:
+            return
+        self.trusted_sha256 = set()
+        for manifest in self.manifests:
+            self._load_sha256_manifest(manifest)
+        self._load_dpkg()
+        self._state = state
+
+    def cache_key(self):
+        with self._lock:
+            self._ensure_loaded()
+            digest = hashlib.sha1(repr(self._state).encode()).hexdigest()[:12]
+        return f"{self.name}:{digest}"
+
+    def _load_sha256_manifest(self, manifest):
+        try:
+            with open(manifest, "r", encoding="utf-8") as f:
+                for line in f:
+                    parts = line.split()
+                    if parts and len(parts[0]) == 64:
+                        self.trusted_sha256.add(parts[0].lower())
+        except OSError as e:
+            print(f"⚠️ Manifest okunamadı: {manifest} ({e})")
+
+    def _load_dpkg(self):
+        self._dpkg_md5 = {}
+        for md5sums in glob.glob(os.path.join(self.dpkg_info_dir, "*.md5sums")):
+            try:
+                with open(md5sums, "r", encoding="utf-8", errors="replace") as f:
+                    for line in f:
+                        digest, _, rel = line.rstrip("\n").partition("  ")
+                        if rel:
+                            self._dpkg_md5["/" + rel] = digest
+            except OSError:
+                continue
+
+    @staticmethod
+    def _path_aliases(path, real):
+        # usr-merge: dpkg "bin/ls" kaydeder, dosya /usr/bin/ls olarak görünür
+        aliases = [real, path]
+        if real.startswith("/usr/"):
+            aliases.append(real[4:])
+        else:
+            aliases.append("/usr" + real)
+        return aliases
+
+    def verify_many(self, items):
+        with self._lock:
+            self._ensure_loaded()
+        return {path: self._verify_one(path, file_hash) for path, file_hash in items}
+
+    @staticmethod
+    def _full_sha256(file_hash):
+        """Tam SHA256 ise küçük harfli değeri, değilse (kısmi/eksik) None."""
+        value = (file_hash or "").strip().lower()
+        if len(value) == 64 and all(c in "0123456789abcdef" for c in value):
+            return value
+        return None
+
+    def _verify_one(self, path, file_hash=None):
+        try:
+            real = os.path.realpath(path)
+            expected_md5 = None
+            for candidate in self._path_aliases(path, real):
+                expected_md5 = self._dpkg_md5.get(candidate)
+                if expected_md5:
+                    break
+
+            # 1) SHA256 manifestleri: bilinen hash ile, dosya okunmadan
+            sha256 = self._full_sha256(file_hash)
+            if sha256 is not None and sha256 in self.trusted_sha256:
+                return STATUS_VALID
+            # Hash bilinmiyorsa (kısmi değil, hiç yok) ve manifest varsa okumak gerekir
+            need_sha256 = sha256 is None and not file_hash and bool(self.trusted_sha256)
+            if expected_md5 is None and not need_sha256:
+                return STATUS_NOT_SIGNED
+
+            # 2) Okuma: dpkg MD5'i (ve gerekirse SHA256) tek geçişte
+            sha_hasher = hashlib.sha256() if need_sha256 else None
+            md5 = hashlib.md5() if expected_md5 is not None else None
+            with open(real, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    if sha_hasher is not None:
+                        sha_hasher.update(block)
+                    if md5 is not None:
+                        md5.update(block)
+
+            if sha_hasher is not None and sha_hasher.hexdigest() in self.trusted_sha256:
+                return STATUS_VALID
+            if md5 is not None:
+                return STATUS_VALID if md5.hexdigest() == expected_md5 else STATUS_HASH_MISMATCH
+            return STATUS_NOT_SIGNED
+        except OSError:
+            return STATUS_ERROR
+
+
+def default_backend():
+    """Platforma uygun arka uç (ScannerBackend üzerinden)."""
+    from core.backends import get_backend
+    return get_backend().create_signature_backend()
+
+
+class SignatureVerifier:
+    """
+    İmza doğrulama servisi: arka uç + dosya hash'ine göre kalıcı sonuç önbelleği.
+    Aynı içerikteki dosyanın imzası tekrar kontrol edilmez.
+    Zaman aşımı / hata sonuçları önbelleğe yazılmaz. Anahtardaki arka uç adı
+    `backend.cache_key()`'dir (manifest arka ucunda manifest/dpkg durumunu içerir).
+    """
+
+    def __init__(self, backend=None, db_path="process_audit.db"):
+        self.backend = backend or default_backend()
+        self.db = Database.shared(db_path)
+        self._init_db()
+
+    def _init_db(self):
+        try:
+            self.db.script('''
+                CREATE TABLE IF NOT EXISTS signature_cache (
+                    file_hash TEXT NOT NULL,
+                    backend TEXT NOT NULL,
+                    status TEXT,
+                    updated_at DATETIME,
+                    PRIMARY KEY (file_hash, backend)
+                );
+            ''')
+        except Exception as e:
+            print(f"⚠️ İmza Önbelleği Hatası: {e}")
+
+    def _get_cached(self, file_hash, backend_key):
+        try:
+            row = self.db.fetchone(
+                "SELECT status FROM signature_cache WHERE file_hash = ? AND backend = ?",
+                (file_hash, backend_key)
+            )
+            return row[0] if row else None
+        except Exception:
+            return None
+
+    def _store(self, file_hash, backend_key, status):
+        try:
+            self.db.execute('''
+                INSERT OR REPLACE INTO signature_cache (file_hash, backend, status, updated_at)
+                VALUES (?, ?, ?, ?)
+            ''', (file_hash, backend_key, status, datetime.now().isoformat()))
+        except Exception as e:
+            print(f"⚠️ İmza Önbelleği Kayıt Hatası: {e}")
+
+    def verify_many(self, items):
+        """
+        items: [(yol, hash veya None), ...]
+        Dönüş: {yol: biçimlendirilmiş durum metni}
+        Önbellekte olmayanlar arka uca tek seferde gönderilir.
+        """
+        statuses = {}
+        pending = []
+        backend_key = self.backend.cache_key()
+        for path, file_hash in items:
+            cached = self._get_cached(file_hash, backend_key) if file_hash else None
+            if cached:
+                statuses[path] = cached
+            else:
+                pending.append((path, file_hash))
+        tracer.count("signature.cache_hit", len(items) - len(pending))
+
+        if pending:
+            tracer.count("signature.cache_miss", len(pending))
+            with tracer.span("signature.verify", backend=self.backend.name, files=len(pending)):
+                fresh = self.backend.verify_many(pending)
+            for path, file_hash in pending:
+                status = fresh.get(path, STATUS_ERROR)
+                statuses[path] = status
+                if file_hash and status not in (STATUS_TIMEOUT, STATUS_ERROR):
+                    self._store(file_hash, backend_key, status)
+
+        return {path: format_status(status) for path, status in statuses.items()}
+
+    def verify(self, path, file_hash=None):
+        return self.verify_many([(path, file_hash)])[path]
+
+    def close(self):
+        self.backend.close()
@@ -0,0 +1,101 @@
+import sqlite3
+import threading
+import atexit
+
+
+class Database:
+    """
+    Uzun ömürlü, thread-safe SQLite bağlantısı.
+    - WAL modu: okumalar yazmaları beklemez.
+    - Hazır (prepared) ifadeler: sqlite3 modülünün ifade önbelleği kullanılır.
+    - Toplu commit: yazmalar biriktirilir, `batch_size` dolunca veya
+      `flush_interval` saniye geçince tek commit ile yazılır.
+    Aynı dosya için tek bağlantı kullanılması için `Database.shared()` tercih edilmeli.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, db_path, batch_size=50, flush_interval=1.0):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        self._pending = 0
+        self._timer = None
+        atexit.register(self.close)
+
+    @classmethod
+    def shared(cls, db_path):
+        """Aynı veritabanı dosyası için ortak bağlantıyı döner."""
+        with cls._instances_lock:
+            db = cls._instances.get(db_path)
+            if db is None:
+                db = cls(db_path)
+                cls._instances[db_path] = db
+            return db
+
+    def fetchone(self, sql, params=()):
+        with self.lock:
+            return self.conn.execute(sql, params).fetchone()
+
+    def fetchall(self, sql, params=()):
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def execute(self, sql, params=(), commit=False):
+        """
+        Yazma işlemi. Varsayılan olarak toplu commit kuyruğuna girer;
+        hemen kalıcı olması gerekenler (örn. ayarlar) için commit=True.
+        Aynı bağlantı kullanıldığı için commit edilmemiş veri de okunabilir.
+        """
+        with self.lock:
+            self.conn.execute(sql, params)
+            self._after_write(commit)
+
+    def executemany(self, sql, seq_of_params, commit=False):
+        with self.lock:
+            self.conn.executemany(sql, seq_of_params)
+            self._after_write(commit)
+
+    def script(self, sql):
+        """Şema oluşturma gibi çoklu ifadeler (hemen commit edilir)."""
+        with self.lock:
+            self.conn.executescript(sql)
+            self.conn.commit()
+
+    def flush(self):
+        """Bekleyen yazmaları commit eder."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._pending:
+                self.conn.commit()
+                self._pending = 0
+
+    def close(self):
+        with self.lock:
+            if self.conn is None:
+                return
+            self.flush()
+            self.conn.close()
+            self.conn = None
+        with Database._instances_lock:
+            if Database._instances.get(self.db_path) is self:
+                del Database._instances[self.db_path]
+
+    def _after_write(self, commit):
+        self._pending += 1
+        if commit or self._pending >= self.batch_size:
+            self.flush()
+        elif self._timer is None:
+            # İlk bekleyen yazmada zamanlayıcı kur
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
@@ -0,0 +1,188 @@
+"""
+Hafif izleme (tracing) katmanı: süre ölçümleri (span) ve sayaçlar.
+
+    from core.tracing import tracer
+    with tracer.span("scanner.hash"):
+        ...
+    tracer.count("gemini.cache_hit")
+
+Span süreleri monotonic saatle ölçülür ve isim başına toplanır (adet, toplam,
+en küçük/büyük, histogram). Son span'lar ayrıca kısa bir geçmişte tutulur.
+Dışa aktarım: to_json() / to_prometheus(). Ek bağımlılık yoktur.
+"""
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Histogram sınırları (saniye) — yerel işlemler (ms) ile model çağrıları (sn) arası
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class SpanStats:
+    """Tek bir span adının toplanmış süreleri."""
+
+    __slots__ = ("count", "total", "min", "max", "errors", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.errors = 0
+        self.buckets = [0] * (len(BUCKETS) + 1) # Son eleman: +Inf
+
+    def add(self, duration, error=False):
+        self.count += 1
+        self.total += duration
+        self.min = duration if self.min is None else min(self.min, duration)
+        self.max = max(self.max, duration)
+        if error:
+            self.errors += 1
+        for i, bound in enumerate(BUCKETS):
+            if duration <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def quantile(self, q):
+        """Histogramdan yaklaşık yüzdelik (bucket üst sınırı, gözlenen min/max ile sınırlı; saniye)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                bound = BUCKETS[i] if i < len(BUCKETS) else self.max
+                return max(self.min, min(bound, self.max))
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total / self.count * 1000, 3) if self.count else None,
+            "min_ms": round(self.min * 1000, 3) if self.min is not None else None,
+            "max_ms": round(self.max * 1000, 3),
+            "p50_ms": round(self.quantile(0.5) * 1000, 3) if self.count else None,
+            "p95_ms": round(self.quantile(0.95) * 1000, 3) if self.count else None,
+            "total_ms": round(self.total * 1000, 3),
+        }
+
+
+class Tracer:
+    def __init__(self, recent=200):
+        self.enabled = True
+        self._spans = {}    # isim -> SpanStats
+        self._counters = {} # isim -> sayı
+        self._recent = deque(maxlen=recent) # Son span'lar (tanılama paneli için)
+        self._lock = threading.Lock()
+        self._local = threading.local() # İç içe span'lar için thread başına yığın
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """Bloğun süresini ölçer; istisna olursa hata olarak sayılır ve yeniden fırlatılır."""
+        if not self.enabled:
+            yield
+            return
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        parent = stack[-1] if stack else None
+        stack.append(name)
+        start = time.monotonic()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            duration = time.monotonic() - start
+            stack.pop()
+            self.record(name, duration, error=error, parent=parent, **attrs)
+
+    def record(self, name, duration, error=False, parent=None, **attrs):
+        """Dışarıda ölçülmüş bir süreyi (saniye) ekler."""
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = self._spans[name] = SpanStats()
+            stats.add(duration, error)
+            self._recent.append({
+                "name": name,
+                "parent": parent,
+                "ms": round(duration * 1000, 3),
+                "error": error,
+                "ts": round(time.time(), 3),
+                **attrs,
+            })
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+            self._recent.clear()
+
+    def snapshot(self):
+        """{"spans": {isim: {...}}, "counters": {...}, "recent": [...]}"""
+        with self._lock:
+            return {
+                "spans": {name: stats.to_dict() for name, stats in sorted(self._spans.items())},
+                "counters": dict(sorted(self._counters.items())),
+                "recent": list(self._recent),
+            }
+
+    def to_json(self, indent=2):
+        return json.dumps(self.snapshot(), indent=indent, ensure_ascii=False)
+
+    def to_prometheus(self, prefix="checkprocess"):
+        """Prometheus metin biçimi (text exposition format 0.0.4)."""
+        lines = []
+        with self._lock:
+            spans = sorted(self._spans.items())
+            counters = sorted(self._counters.items())
+
+        metric = f"{prefix}_span_duration_seconds"
+        lines.append(f"# HELP {metric} Duration of traced operations.")
+        lines.append(f"# TYPE {metric} histogram")
+        for name, stats in spans:
+            label = _label(name)
+            cumulative = 0
+            for bound, n in zip(BUCKETS, stats.buckets):
+                cumulative += n
+                lines.append(f'{metric}_bucket{{span="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{span="{label}",le="+Inf"}} {stats.count}')
+            lines.append(f'{metric}_sum{{span="{label}"}} {stats.total:.6f}')
+            lines.append(f'{metric}_count{{span="{label}"}} {stats.count}')
+
+        errors = f"{prefix}_span_errors_total"
+        lines.append(f"# HELP {errors} Traced operations that raised.")
+        lines.append(f"# TYPE {errors} counter")
+        for name, stats in spans:
+            lines.append(f'{errors}{{span="{_label(name)}"}} {stats.errors}')
+
+        events = f"{prefix}_events_total"
+        lines.append(f"# HELP {events} Event counters (cache hits, retries, timeouts...).")
+        lines.append(f"# TYPE {events} counter")
+        for name, value in counters:
+            lines.append(f'{events}{{event="{_label(name)}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Uygulama genelinde ortak izleyici
+tracer = Tracer()
@@ -1,13 +1,25 @@
+import time
+_START_TIME = time.perf_counter() # Açılış ölçümü (benchmarks/bench_startup.py)
+
+import os
+import json
+import sys
 import customtkinter as ctk
-import psutil
 import threading
+import queue
 import tkinter as tk
 from tkinter import messagebox
-import os
-import subprocess
+# Not: requests, PIL ve pywin32 ilk kullanımda yüklenir (core modülleri içinde)
 from core.gemini_api import GeminiAnalyzer
 from core.process_scanner import ProcessScanner
 from core.languages import Language 
+from core.search_index import ProcessSearchIndex
+from core.sampler import ProcessSampler
+from core.process_record import format_mb
+from core.process_tree import ProcessTree
+from core.tracing import tracer
+from ui.virtual_list import VirtualProcessList
+from ui.icon_service import IconService
 
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
@@ -29,20 +41,41 @@ class App(ctk.CTk):
         # Araçlar
         self.scanner = ProcessScanner()
         self.gemini = GeminiAnalyzer()
+        self.batch = None # Çalışan toplu analiz (BatchAnalyzer)
+        self.batch_lbl = None     # Detay panelindeki toplu analiz etiketi (panel başka içerik gösterince yok olur)
+        self.batch_results = None # Son toplu analiz: (sonuçlar, durduruldu mu)
         
         # Değişkenler
         self.full_process_list = []
+        self.process_table = None # Sütunlu tablo; ilk tam taramada oluşur (numpy o zaman yüklenir)
+        self.process_tree = ProcessTree()
+        self.tree_mode = False # Ağaç görünümü (ebeveyn -> çocuk)
+        self._tree_depth = {}  # pid -> derinlik (ağaç görünümünde satır girintisi)
+        self._tree_totals = {} # pid -> alt ağaç toplamları
+        self.search_index = ProcessSearchIndex()
+        self._search_job = None # Arama debounce zamanlayıcısı
         self.selected_pid = None
         self.selected_proc_name = None
         self.current_icon = None
-        self.icon_cache = {} 
+        self._analysis_seq = 0      # Her analizde artar; eski analizin akış parçaları yok sayılır
+        self._streamed_fields = {}  # Akışla gelen (ekranda kartı olan) alanlar
+        self.icon_service = IconService(self, self.scanner) # Yol+mtime anahtarlı LRU ikon önbelleği
         
         # Sıralama: name, mem, pid
         self.sort_col = "name"
         self.sort_desc = False
+        self._list_loaded = False # İlk tam tarama tamamlandı mı
+
+        # Arka plan örnekleyici (Tarama UI thread'inde yapılmaz)
+        self.sampler = ProcessSampler(self.scanner, interval=3.0, history_interval=5.0)
 
         self._init_ui()
 
+        # Açılış ölçümü istenirse ilk çizimden sonra süreyi raporla
+        self._startup_bench = bool(os.environ.get("CHECKPROCESS_STARTUP_BENCH"))
+        if self._startup_bench:
+            self.after_idle(lambda: self._report_startup("first_paint"))
+
     def _init_ui(self):
         # --- SOL PANEL: Liste ---
         self.left_frame = ctk.CTkFrame(self, width=350, corner_radius=10)
@@ -59,6 +92,14 @@ class App(ctk.CTk):
         self.btn_refresh = ctk.CTkButton(self.header_frame, text="⟳", width=30, height=25, command=self.refresh_process_list)
         self.btn_refresh.pack(side="right", padx=(5,0))
 
+        # Ağaç görünümü
+        self.btn_tree = ctk.CTkButton(self.header_frame, text="🌳", width=30, height=25, fg_color="#444444", command=self.toggle_tree_mode)
+        self.btn_tree.pack(side="right", padx=(5,0))
+
+        # Tanılama (izleme) paneli
+        self.btn_diag = ctk.CTkButton(self.header_frame, text="📈", width=30, height=25, fg_color="#444444", command=self.open_diagnostics)
+        self.btn_diag.pack(side="right", padx=(5,0))
+
         # API Butonu
         self.btn_api = ctk.CTkButton(self.header_frame, text=self.loc["api_btn"], width=70, height=25, fg_color="#F57C00", hover_color="#E65100", command=self.open_api_settings)
         self.btn_api.pack(side="right", padx=5)
@@ -73,7 +114,7 @@ class App(ctk.CTk):
         
         self.search_entry = ctk.CTkEntry(self.search_container, placeholder_text=self.loc["search_placeholder"], height=28, font=("Roboto", 12))
         self.search_entry.pack(side="left", fill="x", expand=True)
-        self.search_entry.bind("<KeyRelease>", self.filter_process_list)
+        self.search_entry.bind("<KeyRelease>", self.schedule_filter)
         
         self.btn_clear_search = ctk.CTkButton(self.search_container, text="✕", width=28, height=28, fg_color="transparent", hover_color="#444444", text_color="#AAAAAA", command=self.clear_search)
         self.btn_clear_search.pack(side="right", padx=(5, 0))
@@ -101,9 +142,9 @@ class App(ctk.CTk):
                                        command=self.sort_by_mem)
         self.btn_h_mem.pack(side="left")
 
-        # Liste (Label Text kaldırıldı, headerlar yukarı taşındı)
-        self.scroll_frame = ctk.CTkScrollableFrame(self.left_frame, width=340)
-        self.scroll_frame.grid(row=3, column=0, padx=10, pady=5, sticky="nsew")
+        # Liste (Sanal liste: sadece görünen satırlar oluşturulur)
+        self.process_list = VirtualProcessList(self.left_frame, width=340, command=self.select_process, formatter=self._format_process_row)
+        self.process_list.grid(row=3, column=0, padx=10, pady=5, sticky="nsew")
 
         # --- SAĞ PANEL ---
         self.right_frame = ctk.CTkFrame(self, corner_radius=10)
@@ -151,7 +192,17 @@ class App(ctk.CTk):
         self.btn_kill = ctk.CTkButton(self.actions_frame, text=self.loc["kill_btn"], fg_color="#C62828", hover_color="#B71C1C", command=self.kill_selected_process)
         self.btn_kill.pack(side="right")
 
-        self.refresh_process_list()
+        self.btn_batch = ctk.CTkButton(self.actions_frame, text=self.loc["batch_btn"], width=140, fg_color="#00695C", hover_color="#004D40", command=self.on_batch_click)
+        self.btn_batch.pack(side="right", padx=(0, 10))
+
+        # Toplu analiz durumu: detay paneli başka işlemi gösterse de ilerleme burada görünür
+        self.lbl_batch_status = ctk.CTkLabel(self.right_frame, text="", font=("Roboto", 12), text_color="#80CBC4", cursor="hand2")
+        self.lbl_batch_status.grid(row=4, column=0, padx=20, pady=(0, 10), sticky="w")
+        self.lbl_batch_status.bind("<Button-1>", lambda e: self._show_batch_panel())
+
+        # Liste pencere açıldıktan sonra arka planda yüklenir ve periyodik yenilenir
+        self.sampler.start()
+        self.after(50, self._poll_sampler)
         
         # Başlangıçta API Key kontrolü
         self.after(1000, self.check_api_key)
@@ -239,6 +290,85 @@ class App(ctk.CTk):
         btn_cancel = ctk.CTkButton(btn_frame, text="Kapat", fg_color="#555555", hover_color="#333333", width=80, command=cancel_action)
         btn_cancel.pack(side="left")
 
+    def open_diagnostics(self):
+        """Tanılama penceresi: span süreleri, sayaçlar ve model sağlığı (1 sn'de bir yenilenir)."""
+        try:
+            if hasattr(self, 'diag_window') and self.diag_window.winfo_exists():
+                self.diag_window.lift()
+                return
+        except:
+            pass
+
+        self.diag_window = ctk.CTkToplevel(self)
+        self.diag_window.title(self.loc["diag_title"])
+        self.diag_window.geometry("640x480")
+
+        self.diag_text = ctk.CTkTextbox(self.diag_window, font=("Consolas", 12), wrap="none")
+        self.diag_text.pack(fill="both", expand=True, padx=10, pady=(10, 5))
+
+        self.lbl_diag_msg = ctk.CTkLabel(self.diag_window, text="", font=("Roboto", 11))
+        self.lbl_diag_msg.pack()
+
+        btn_frame = ctk.CTkFrame(self.diag_window, fg_color="transparent")
+        btn_frame.pack(pady=(0, 10))
+        ctk.CTkButton(btn_frame, text=self.loc["diag_export_json"], width=120,
+                      command=lambda: self._export_metrics("json")).pack(side="left", padx=5)
+        ctk.CTkButton(btn_frame, text=self.loc["diag_export_prom"], width=140,
+                      command=lambda: self._export_metrics("prom")).pack(side="left", padx=5)
+        ctk.CTkButton(btn_frame, text=self.loc["diag_reset"], width=80, fg_color="#555555", hover_color="#333333",
+                      command=lambda: (tracer.reset(), self._refresh_diagnostics(schedule=False))).pack(side="left", padx=5)
+
+        self._refresh_diagnostics()
+
+    def _diagnostics_text(self):
+        snap = tracer.snapshot()
+        lines = [self.loc["diag_spans"]]
+        if snap["spans"]:
+            lines.append(f"{'span':<24}{'n':>6}{'avg':>10}{'p50':>10}{'p95':>10}{'max':>10}{'err':>5}")
+            for name, s in snap["spans"].items():
+                lines.append(f"{name[:23]:<24}{s['count']:>6}{s['avg_ms']:>10.1f}{s['p50_ms']:>10.1f}"
+                             f"{s['p95_ms']:>10.1f}{s['max_ms']:>10.1f}{s['errors']:>5}")
+        else:
+            lines.append(self.loc["diag_empty"])
+
+        lines += ["", self.loc["diag_counters"]]
+        lines += [f"{name:<30}{value:>8}" for name, value in snap["counters"].items()] or [self.loc["diag_empty"]]
+
+        model_stats = self.gemini.get_model_stats()
+        if model_stats is not None:
+            lines += ["", self.loc["diag_models"]]
+            for model, s in model_stats.items():
+                avg = f"{s['avg_ms']:.0f} ms" if s['avg_ms'] is not None else "-"
+                lines.append(f"{model[:30]:<31}{s['calls']:>5} / {s['failures']:<4} {avg:>10}  {s['state']}")
+        return "\n".join(lines)
+
+    def _refresh_diagnostics(self, schedule=True):
+        try:
+            if not self.diag_window.winfo_exists():
+                return
+        except:
+            return
+        self.diag_text.configure(state="normal")
+        self.diag_text.delete("1.0", "end")
+        self.diag_text.insert("1.0", self._diagnostics_text())
+        self.diag_text.configure(state="disabled")
+        if schedule:
+            self.diag_window.after(1000, self._refresh_diagnostics)
+
+    def _export_metrics(self, fmt):
+        from tkinter import filedialog
+        ext = ".json" if fmt == "json" else ".prom"
+        path = filedialog.asksaveasfilename(parent=self.diag_window, defaultextension=ext,
+                                            initialfile=f"checkprocess_metrics{ext}")
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(tracer.to_json() if fmt == "json" else tracer.to_prometheus())
+            self.lbl_diag_msg.configure(text=self.loc["diag_saved"].format(path), text_color="green")
+        except Exception as e:
+            self.lbl_diag_msg.configure(text=str(e), text_color="red")
+
     def sort_by_name(self):
         if self.sort_col == "name":
             self.sort_desc = not self.sort_desc
@@ -266,6 +396,11 @@ class App(ctk.CTk):
         self.filter_process_list()
         self.update_ui_texts()
 
+    def toggle_tree_mode(self):
+        self.tree_mode = not self.tree_mode
+        self.btn_tree.configure(fg_color="#1F6AA5" if self.tree_mode else "#444444")
+        self.filter_process_list()
+
     def toggle_language(self):
         if self.current_lang == "TR":
             self.current_lang = "EN"
@@ -301,6 +436,7 @@ class App(ctk.CTk):
         self.btn_reanalyze.configure(text=self.loc.get("reanalyze_btn", "Yeniden"))
         self.btn_open_folder.configure(text=self.loc["folder_btn"])
         self.btn_kill.configure(text=self.loc["kill_btn"])
+        self.btn_batch.configure(text=self.loc["batch_cancel"] if self.batch else self.loc["batch_btn"])
         self.details_scroll_frame.configure(label_text=self.loc["card_result"])
         
         # Eğer henüz analiz yapılmadıysa başlangıç mesajını güncelle
@@ -317,114 +453,203 @@ class App(ctk.CTk):
         self.filter_process_list()
 
     def refresh_process_list(self):
-        # Tüm listeyi çek ve sakla
-        self.full_process_list = self.scanner.get_running_processes()
-        # Filtrele ve göster
-        self.filter_process_list()
+        """Arka plan örnekleyicisinden hemen yeni bir tarama ister (UI donmaz)."""
+        self.sampler.trigger()
+
+    def _poll_sampler(self):
+        """Örnekleyici kuyruğunu ana thread'de boşaltır ve değişiklikleri uygular."""
+        latest = None
+        try:
+            while True:
+                message = self.sampler.queue.get_nowait()
+                if message[0] == "partial":
+                    self._show_partial_list(message[1])
+                else:
+                    # Birden fazla tur biriktiyse farkları birleştir
+                    latest = self._merge_snapshots(latest, message)
+        except queue.Empty:
+            pass
+
+        if latest is not None:
+            self._apply_process_list(latest[1], latest[2])
+        self.after(250, self._poll_sampler)
+
+    @staticmethod
+    def _merge_snapshots(previous, message):
+        if previous is None:
+            return message
+        _, _, old = previous
+        _, processes, new = message
+        # Önce eklenip sonra kapanan işlem hiç görülmemiş sayılır
+        gone = {id(r) for r in new["removed"]}
+        old_added = {id(r) for r in old["added"]}
+        merged = {
+            "added": [r for r in old["added"] if id(r) not in gone] + new["added"],
+            "removed": old["removed"] + [r for r in new["removed"] if id(r) not in old_added],
+            "updated": [r for r in old["updated"] + new["updated"] if id(r) not in gone],
+        }
+        return ("snapshot", processes, merged)
+
+    def _show_partial_list(self, partial):
+        if not self._list_loaded:
+            self.process_list.set_items([p for p in partial if p.name])
+
+    def _apply_process_list(self, processes, diff):
+        first_load = not self._list_loaded
+        self._list_loaded = True
+        self.full_process_list = processes
+        # Sıralama/gruplama için sütunlu tablo (RSS değerleri her turda değişir)
+        from core.process_table import ProcessTable
+        self.process_table = ProcessTable(processes)
+        # Arama indeksini ve işlem ağacını farklarla güncelle
+        self.search_index.apply_diff(diff)
+        if first_load:
+            self.process_tree.build(processes)
+        else:
+            self.process_tree.apply_diff(diff)
+
+        # Ağaç görünümünde bellek/ebeveyn değişimi alt ağaç toplamlarını da değiştirir
+        resort = self.sort_col == "mem" or self.tree_mode
+        if first_load or diff["added"] or diff["removed"] or (diff["updated"] and resort):
+            # Satır kümesi/sırası değişti: yeniden filtrele (kaydırma ve seçim korunur)
+            self.filter_process_list()
+        elif diff["updated"]:
+            # Sadece bellek değerleri değişti: görünen satırların metnini güncelle
+            self.process_list.refresh_rows()
+
+        # Seçili işlemin bellek bilgisi
+        if self.selected_pid and diff["updated"]:
+            for proc in diff["updated"]:
+                if proc.pid == self.selected_pid:
+                    self.lbl_mem.configure(text=self._memory_text(proc))
+                    break
+
+        if first_load and self._startup_bench:
+            self._report_startup("list_loaded", processes=len(processes))
+            self.after(100, self.destroy)
+
+    def _report_startup(self, stage, **extra):
+        """Açılış ölçümünü (ms) gerçek stdout'a JSON satırı olarak yazar."""
+        elapsed_ms = round((time.perf_counter() - _START_TIME) * 1000, 1)
+        sys.__stdout__.write(json.dumps({"stage": stage, "ms": elapsed_ms, **extra}) + "\n")
+        sys.__stdout__.flush()
+
+    def schedule_filter(self, event=None):
+        """Tuş vuruşlarını birleştirir; yazma bitince (150ms) tek bir filtreleme yapar."""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(150, self.filter_process_list)
 
     def filter_process_list(self, event=None):
+        self._search_job = None
         # Arama metnini al
-        query = self.search_entry.get().lower()
-        
-        # UI temizle
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
+        query = self.search_entry.get()
+        if self.process_table is None:
+            return # İlk tarama bitmedi; tamamlanınca liste zaten filtrelenir
             
-        # Filtreleme
-        display_list = [p for p in self.full_process_list if (query in p['name'].lower() or query in str(p['pid'])) and p['name']]
+        # Filtreleme (Önceden hazırlanmış indeks üzerinden; boş sorguda maske yok)
+        mask = None
+        if query.strip():
+            mask = self.process_table.pid_mask(p.pid for p in self.search_index.search(query))
+
+        # SIRALAMA (Sütunlu tablo üzerinde, vektörel)
+        if self.tree_mode:
+            # Kardeşler seçili sütuna göre sıralı; aramada eşleşenler ve ataları gösterilir
+            include = None if mask is None else self.process_table.pid[mask].tolist()
+            rows = self.process_tree.flatten(self.process_table.sorted_records(self.sort_col, self.sort_desc), include)
+            self._tree_depth = {record.pid: depth for record, depth in rows}
+            self._tree_totals = self.process_tree.totals()
+            display_list = [record for record, _ in rows if record.name]
+        else:
+            display_list = [p for p in self.process_table.sorted_records(self.sort_col, self.sort_desc, mask) if p.name]
+        
+        # Sanal listeyi yerinde güncelle (Butonlar yeniden kullanılır)
+        self.process_list.set_items(display_list)
+
+    def _format_process_row(self, proc):
+        """Liste satırı metni (Hizalama Consolas fontuna göre)."""
+        # PID: 7 karakter
+        pid_str = f"[{proc.pid}]".ljust(7)
+        
+        # İsim: 28 karakter (Sığması için)
+        raw_name = proc.name
+        total = None
+        if self.tree_mode:
+            # Ağaç: derinliğe göre girinti; çocuğu olanlarda alt ağaç toplam belleği
+            raw_name = "  " * min(self._tree_depth.get(proc.pid, 0), 6) + raw_name
+            total = self._tree_totals.get(proc.pid)
+        if len(raw_name) > 28:
+            name_str = raw_name[:25] + "..."
+        else:
+            name_str = raw_name
+        name_str = name_str.ljust(29)
         
-        # SIRALAMA
-        if self.sort_col == "name":
-            display_list.sort(key=lambda x: x['name'].lower(), reverse=self.sort_desc)
-        elif self.sort_col == "mem":
-            # memory_info.rss (byte) üzerinden sırala
-            display_list.sort(key=lambda x: x['memory_info'].rss, reverse=self.sort_desc)
-        elif self.sort_col == "pid":
-            display_list.sort(key=lambda x: x['pid'], reverse=self.sort_desc)
-        
-        # Butonları oluştur
-        for proc in display_list:
-            # Hizalama
-            # PID: 7 karakter
-            pid_str = f"[{proc['pid']}]".ljust(7)
-            
-            # İsim: 28 karakter (Sığması için)
-            raw_name = proc['name']
-            if len(raw_name) > 28:
-                name_str = raw_name[:25] + "..."
-            else:
-                name_str = raw_name
-            name_str = name_str.ljust(29)
-            
-            # Bellek
-            mem_str = f"({proc['memory_mb']})"
-            
-            # SADECE DEĞERLERİ YAZDIRIYORUZ (Hizalamayı buton içindeki font hallediyor)
-            # Ancak Headerlar ayrı buton olduğu için, buradaki boşluklar (ljust)
-            # header butonlarının genişliklerine denk gelmeli.
-            # Header PID: 65px. Consolas 7 char ~63px. Uygun.
-            # Header Name: Esnek.
-            # Header Mem: 90px.
-            
-            btn_text = f"{pid_str} {name_str} {mem_str}"
-            
-            btn = ctk.CTkButton(
-                self.scroll_frame, 
-                text=btn_text, 
-                height=35,
-                font=("Consolas", 12), # Monospace
-                fg_color="transparent", 
-                border_width=1,
-                border_color="#333333",
-                text_color="#DDDDDD",
-                anchor="w",
-                command=lambda p=proc: self.select_process(p)
-            )
-            btn.pack(fill="x", padx=2, pady=2)
+        # Bellek
+        if total and total["count"] > 1:
+            mem_str = f"(Σ{format_mb(total['rss'])})"
+        else:
+            mem_str = f"({format_mb(proc.rss)})"
+        
+        # Headerlar ayrı buton olduğu için, buradaki boşluklar (ljust)
+        # header butonlarının genişliklerine denk gelmeli.
+        # Header PID: 65px. Consolas 7 char ~63px. Uygun.
+        # Header Name: Esnek.
+        # Header Mem: 90px.
+        return f"{pid_str} {name_str} {mem_str}"
+
+    def _memory_text(self, proc):
+        """Bellek etiketi; yeterli geçmiş varsa son 5 dakikadaki eğilim (MB/dk) eklenir."""
+        text = str(self.loc["memory"]).replace("-", format_mb(proc.rss))
+        stats = self.scanner.history.stats(proc.pid, "rss", window=300)
+        if stats and stats["count"] >= 3:
+            per_min = stats["slope"] * 60 / (1024 * 1024)
+            if abs(per_min) >= 0.01:
+                text += f"  ({'↑' if per_min > 0 else '↓'} {abs(per_min):.2f} MB/dk)"
+        return text
 
     def select_process(self, proc_info):
-        self.selected_pid = proc_info['pid']
-        self.selected_proc_name = proc_info['name']
+        self.selected_pid = proc_info.pid
+        self.selected_proc_name = proc_info.name
+        self._begin_analysis() # Önceki işlemin süren analizi bu paneli artık güncellemez
         
         # Bilgileri güncelle
-        self.lbl_pid.configure(text=str(self.loc["pid"]).replace("-", str(proc_info['pid'])))
-        self.lbl_name.configure(text=str(self.loc["name"]).replace("-", str(proc_info['name'])))
-        self.lbl_mem.configure(text=str(self.loc["memory"]).replace("-", str(proc_info['memory_mb'])))
+        self.lbl_pid.configure(text=str(self.loc["pid"]).replace("-", str(proc_info.pid)))
+        self.lbl_name.configure(text=str(self.loc["name"]).replace("-", str(proc_info.name)))
+        self.lbl_mem.configure(text=self._memory_text(proc_info))
         
-        # İkonu belirle (Önce cache, sonra tarama)
-        final_icon = None
+        # İkon: önbellekte varsa hemen, yoksa arka planda yüklenip sonradan gelir
+        self._set_process_icon(None)
+        pid = self.selected_pid
         try:
-            cache_key = (self.selected_pid, proc_info['name'])
-            
-            if cache_key in self.icon_cache:
-                final_icon = self.icon_cache[cache_key]
-            else:
-                icon_img = self.scanner.get_process_icon(self.selected_pid)
-                if icon_img:
-                    final_icon = ctk.CTkImage(light_image=icon_img, dark_image=icon_img, size=(64, 64))
-                    self.icon_cache[cache_key] = final_icon
+            self.icon_service.request(pid, lambda image: self._on_icon_ready(pid, image))
         except Exception:
             pass
 
+        # Paneli temizle ve sıfırla
+        for w in self.details_scroll_frame.winfo_children():
+            w.destroy()
+        
+        lbl = ctk.CTkLabel(self.details_scroll_frame, text=self.loc["start_msg"])
+        lbl.pack(pady=20)
+
+    def _on_icon_ready(self, pid, image):
+        # Bu arada başka işlem seçildiyse eski ikonu gösterme
+        if pid == self.selected_pid:
+            self._set_process_icon(image)
+
+    def _set_process_icon(self, image):
         # UI Güncelle (Elementi yeniden oluşturarak hayalet görüntü sorununu çöz)
         if self.lbl_icon:
             self.lbl_icon.destroy()
 
-        if final_icon:
-            self.current_icon = final_icon # Referansı tut
-            self.lbl_icon = ctk.CTkLabel(self.info_frame, text="", image=final_icon, width=64, height=64)
+        if image:
+            self.current_icon = image # Referansı tut
+            self.lbl_icon = ctk.CTkLabel(self.info_frame, text="", image=image, width=64, height=64)
         else:
             self.current_icon = None
             self.lbl_icon = ctk.CTkLabel(self.info_frame, text="?", width=64, height=64, fg_color="#333333", corner_radius=8)
-            
-        self.lbl_icon.grid(row=0, column=0, rowspan=3, padx=(0, 15))
 
-        # Paneli temizle ve sıfırla
-        for w in self.details_scroll_frame.winfo_children():
-            w.destroy()
-        
-        lbl = ctk.CTkLabel(self.details_scroll_frame, text=self.loc["start_msg"])
-        lbl.pack(pady=20)
+        self.lbl_icon.grid(row=0, column=0, rowspan=3, padx=(0, 15))
 
     def on_analyze_click(self):
         if not self.selected_pid:
@@ -435,12 +660,16 @@ class App(ctk.CTk):
         for w in self.details_scroll_frame.winfo_children():
             w.destroy()
         
+        # Hedef ana thread'de sabitlenir: update() veya analiz sırasında seçim değişebilir
+        target = self._analysis_target()
+        seq = self._begin_analysis()
+
         loading_lbl = ctk.CTkLabel(self.details_scroll_frame, text=self.loc["loading"], font=("Roboto", 14))
         loading_lbl.pack(pady=40)
         
         self.update() # UI güncellensin
 
-        threading.Thread(target=self._run_analysis, daemon=True).start()
+        threading.Thread(target=self._run_analysis, args=(target, False, seq), daemon=True).start()
 
     def on_force_analyze_click(self):
         if not self.selected_pid:
@@ -451,6 +680,9 @@ class App(ctk.CTk):
         for w in self.details_scroll_frame.winfo_children():
             w.destroy()
         
+        target = self._analysis_target()
+        seq = self._begin_analysis()
+
         msg = "ZORLA YENİLEME:\n" + self.loc["loading"]
         loading_lbl = ctk.CTkLabel(self.details_scroll_frame, text=msg, font=("Roboto", 14), text_color="#F9A825")
         loading_lbl.pack(pady=40)
@@ -458,53 +690,177 @@ class App(ctk.CTk):
         self.update()
 
         # True ile gönder (Force Refresh)
-        threading.Thread(target=self._run_analysis, args=(True,), daemon=True).start()
-
-    def _run_analysis(self, force_refresh=False):
+        threading.Thread(target=self._run_analysis, args=(target, True, seq), daemon=True).start()
+
+    def _begin_analysis(self):
+        """Ana thread: yeni analiz numarası alır; eski analizlerin sonuçları yok sayılır."""
+        self._analysis_seq += 1
+        self._streamed_fields = {}
+        return self._analysis_seq
+
+    def _analysis_target(self):
+        """Ana thread: seçili işlem (pid, isim, kayıt veya None)."""
+        pid = self.selected_pid
+        record = next((p for p in self.full_process_list if p.pid == pid), None)
+        return pid, self.selected_proc_name, record
+
+    def _run_analysis(self, target, force_refresh=False, seq=0):
+        pid, proc_name, record = target
         try:
-            print(f"--- Analiz Başlatıldı: PID {self.selected_pid} (Force: {force_refresh}) ---")
-            # HATA DÜZELTME: self.current_processes yerine self.full_process_list kullanılmalı
-            proc = next((p for p in self.full_process_list if p['pid'] == self.selected_pid), None)
-            
-            if not proc:
+            print(f"--- Analiz Başlatıldı: PID {pid} (Force: {force_refresh}) ---")
+
+            if record:
+                proc = record.to_info()
+            elif pid:
                 # Eğer listede yoksa (örn: işlem kapandıysa) ama PID varsa devam etmeye çalış
-                if self.selected_pid:
-                    proc = {'pid': self.selected_pid, 'name': self.selected_proc_name, 'memory_mb': '?'}
-                else:
-                    self.after(0, lambda: self._update_analysis_ui({"error": self.loc["error_list"]}))
-                    return
+                proc = {'pid': pid, 'name': proc_name, 'memory_mb': '?'}
+            else:
+                self.after(0, lambda: self._on_analysis_result(seq, {"error": self.loc["error_list"]}))
+                return
 
             # 1. Dosya yolu ve Hash hesapla (Zaman alabilir)
             print(self.loc["analyzing"])
-            details = self.scanner.get_process_details(self.selected_pid)
+            details = self.scanner.get_process_details(pid)
             proc.update(details) # path ve hash ekle
+            # Dosya yolu ile de aranabilsin (İndeks ana thread'de güncellenir)
+            if record and details.get('path') not in (None, "Bilinmiyor"):
+                record.path = details['path']
+                self.after(0, lambda: self.search_index.add(record))
             
             # 2. Analiz
             print(self.loc["analyzing_2"])
             # Dili ve force değerini gönder
-            result_json = self.gemini.analyze_single_process(proc, lang=self.current_lang, force_refresh=force_refresh)
+            # Kartlar, model yanıtı akarken alan alan doldurulur (API thread'inden ana thread'e)
+            def on_field(key, value):
+                self.after(0, lambda: self._on_analysis_field(seq, key, value))
+
+            with tracer.span("analysis.single", force=force_refresh):
+                result_json = self.gemini.analyze_single_process(proc, lang=self.current_lang,
+                                                                 force_refresh=force_refresh, on_field=on_field)
             print(self.loc["analyzing_3"])
             
             # 3. Sonucu göster
-            self.after(0, lambda: self._update_analysis_ui(result_json))
+            self.after(0, lambda: self._on_analysis_result(seq, result_json))
 
         except Exception as e:
             print(f"!!! KRİTİK HATA (_run_analysis): {e}")
             import traceback
             traceback.print_exc()
             error_msg = str(e)
-            self.after(0, lambda: self._update_analysis_ui({"error": f"Analiz Hatası: {error_msg}"}))
+            self.after(0, lambda: self._on_analysis_result(seq, {"error": f"Analiz Hatası: {error_msg}"}))
+
+    def on_batch_click(self):
+        """
+        Listede görünen (filtrelenmiş) tüm işlemleri toplu analiz eder; çalışıyorsa durdurur.
+        Ağaç görünümünde bir işlem seçiliyse sadece o işlem ve alt işlemleri analiz edilir.
+        """
+        if self.batch:
+            self.batch.cancel()
+            return
+        from core.batch_analyzer import BatchAnalyzer
 
-    def _update_analysis_ui(self, result_data):
-        # Mevcut widgetları temizle
+        if self.tree_mode and self.selected_pid in self.process_tree.nodes:
+            targets = self.process_tree.subtree(self.selected_pid)
+            message = self.loc["subtree_confirm"].format(self.selected_proc_name, self.selected_pid, len(targets))
+        else:
+            targets = list(self.process_list.items)
+            message = self.loc["batch_confirm"].format(len(targets))
+        if not targets:
+            return
+        if not tk.messagebox.askyesno("Onay", message):
+            return
+
+        self._begin_analysis() # Süren tekli analiz artık paneli güncellemez
         for w in self.details_scroll_frame.winfo_children():
             w.destroy()
+        text = self.loc["batch_progress"].format(0, "?")
+        self.batch_lbl = ctk.CTkLabel(self.details_scroll_frame, text=text, font=("Roboto", 14))
+        self.batch_lbl.pack(pady=40)
+        self.batch_results = None
+        self.lbl_batch_status.configure(text=text)
 
-        if "error" in result_data:
-            err_lbl = ctk.CTkLabel(self.details_scroll_frame, text=result_data["error"], text_color="red")
-            err_lbl.pack(pady=10)
+        self.batch = BatchAnalyzer(self.scanner, self.gemini)
+        self.btn_batch.configure(text=self.loc["batch_cancel"])
+        threading.Thread(target=self._run_batch, args=(self.batch, targets, self.current_lang), daemon=True).start()
+
+    def _run_batch(self, batch, targets, lang):
+        def progress(done, total, item):
+            self.after(0, lambda: self._on_batch_progress(done, total))
+
+        try:
+            results = batch.run(targets, lang=lang, progress=progress)
+        except Exception as e:
+            print(f"!!! KRİTİK HATA (_run_batch): {e}")
+            results = []
+        self.after(0, lambda: self._show_batch_results(results, batch.cancelled))
+
+    def _batch_panel_active(self):
+        """Detay paneli hâlâ toplu analizi mi gösteriyor (seçim/tekli analiz paneli temizlemediyse)."""
+        return self.batch_lbl is not None and self.batch_lbl.winfo_exists()
+
+    def _on_batch_progress(self, done, total):
+        text = self.loc["batch_progress"].format(done, total)
+        self.lbl_batch_status.configure(text=text)
+        if self._batch_panel_active():
+            self.batch_lbl.configure(text=text)
+
+    def _batch_summary(self):
+        results, cancelled = self.batch_results
+        cached = sum(1 for r in results if r["cached"])
+        return self.loc["batch_cancelled"].format(len(results)) if cancelled else self.loc["batch_done"].format(len(results), cached)
+
+    def _show_batch_results(self, results, cancelled):
+        self.batch = None
+        self.btn_batch.configure(text=self.loc["batch_btn"])
+        self.batch_results = (results, cancelled)
+
+        if self._batch_panel_active():
+            self._show_batch_panel()
+        else:
+            # Kullanıcı bu arada başka içeriğe geçti: ekranı silme, durum satırından açılabilsin
+            self.lbl_batch_status.configure(text=f"{self._batch_summary()} {self.loc['batch_show']}")
+
+    def _show_batch_panel(self):
+        """Son toplu analiz sonuçlarını detay panelinde gösterir (durum satırına tıklanınca da)."""
+        if self.batch_results is None:
             return
+        results, _ = self.batch_results
+        summary = self._batch_summary()
+        self.lbl_batch_status.configure(text=summary)
 
+        self._begin_analysis() # Süren tekli analiz bu paneli ezmesin
+        for w in self.details_scroll_frame.winfo_children():
+            w.destroy()
+
+        self.batch_lbl = ctk.CTkLabel(self.details_scroll_frame, text=summary, font=("Roboto", 14, "bold"))
+        self.batch_lbl.pack(pady=10)
+
+        # En riskli dosyalar üstte
+        def risk_of(item):
+            try:
+                return float(str(item["result"].get("risk_skoru", "0")).split("/")[0])
+            except (ValueError, AttributeError):
+                return 0.0
+
+        for item in sorted(results, key=risk_of, reverse=True):
+            data = item["result"] or {}
+            title = f"{item['name']} ({len(item['pids'])}) - {data.get('risk_skoru', '?')}"
+            content = f"{item['path']}\n{data.get('sonuc', '')}\n\n{data.get('guvenlik_analizi', '')}"
+            self._create_collapsible_card(title, content)
+
+    def _on_analysis_field(self, seq, key, value):
+        """Akıştan tamamlanan tek alan (ana thread). Başka bir analiz başladıysa yok sayılır."""
+        if seq != self._analysis_seq:
+            return
+        self._update_analysis_ui({key: value}, partial=True)
+
+    def _on_analysis_result(self, seq, result_data):
+        """Analizin son sonucu veya hatası (ana thread). Başka analiz/seçim olduysa yok sayılır."""
+        if seq != self._analysis_seq:
+            return
+        self._update_analysis_ui(result_data)
+
+    def _update_analysis_ui(self, result_data, partial=False):
         # Sonuç başlıkları ve verileri
         mapping = {
             "kimlik": self.loc["card_identity"],
@@ -513,7 +869,34 @@ class App(ctk.CTk):
             "bellek_analizi": self.loc["card_memory"],
             "sonuc": self.loc["card_result"]
         }
-        
+
+        if partial:
+            # Akış: sadece yeni tamamlanan alanların kartları eklenir ("Yükleniyor" ilk kartta kalkar)
+            if not self._streamed_fields:
+                for w in self.details_scroll_frame.winfo_children():
+                    w.destroy()
+            for key, content in result_data.items():
+                if key in mapping and key not in self._streamed_fields:
+                    self._streamed_fields[key] = content
+                    self._create_collapsible_card(mapping[key], content)
+            return
+
+        # Tam sonuç akışla gelenle aynıysa kartlar zaten ekranda (yeniden çizip titretme)
+        streamed, self._streamed_fields = self._streamed_fields, {}
+        if "error" not in result_data and all(
+            key in streamed and streamed[key] == result_data.get(key) for key in mapping
+        ):
+            return
+
+        # Mevcut widgetları temizle
+        for w in self.details_scroll_frame.winfo_children():
+            w.destroy()
+
+        if "error" in result_data:
+            err_lbl = ctk.CTkLabel(self.details_scroll_frame, text=result_data["error"], text_color="red")
+            err_lbl.pack(pady=10)
+            return
+
         for key, title in mapping.items():
             content = result_data.get(key, "Bilgi yok")
             self._create_collapsible_card(title, content)
@@ -543,11 +926,8 @@ class App(ctk.CTk):
         if not self.selected_pid:
             return
             
-        path = self.scanner.get_process_path(self.selected_pid)
-        if path and os.path.exists(path):
-            # Dosya gezgininde seçili olarak aç (Windows)
-            subprocess.Popen(f'explorer /select,"{path}"')
-        else:
+        # Dosya gezgininde seçili olarak aç (Platform arka ucu)
+        if not self.scanner.open_location(self.selected_pid):
             tk.messagebox.showerror("Hata", self.loc["error_path"])
 
     def kill_selected_process(self):
@@ -561,30 +941,16 @@ class App(ctk.CTk):
                 tk.messagebox.showinfo("Başarılı", self.loc["success_kill"])
                 self.refresh_process_list()
                 self.selected_pid = None
+                self.process_list.set_selected(None)
                 self.lbl_pid.configure(text=self.loc["pid"])
             else:
                 tk.messagebox.showerror("Hata", msg)
 
 if __name__ == "__main__":
-    import sys
-    import datetime
-
-    class Logger(object):
-        def __init__(self, filename="app_log.txt"):
-            self.log = open(filename, "a", encoding="utf-8")
-    
-        def write(self, message):
-            if message.strip():
-                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.log.write(f"[{timestamp}] {message.strip()}\n")
-                self.log.flush()
-            
-        def flush(self):
-            self.log.flush()
+    from core.app_log import install
 
-    # Terminal çıktısını dosyaya yönlendir
-    sys.stdout = Logger()
-    sys.stderr = sys.stdout
+    # Terminal çıktısını dosyaya yönlendir (arka planda, partiler halinde yazılır)
+    install("app_log.txt")
     
     app = App()
     app.mainloop()
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Testler depo kökünden çalıştırılmasa da core/ ve benchmarks/ import edilebilsin
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "benchmarks")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
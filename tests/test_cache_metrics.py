@@ -0,0 +1,61 @@
+import pytest
+
+from core.batch_analyzer import BatchAnalyzer
+from core.gemini_api import GeminiAnalyzer
+from core.process_record import ProcessRecord
+from core.process_scanner import ProcessScanner
+from core.storage import Database
+from core.tracing import tracer
+from fake_gemini import FakeGeminiServer
+
+
+@pytest.fixture
+def setup(tmp_path):
+    db_path = str(tmp_path / "metrics.db")
+    with FakeGeminiServer() as server:
+        gemini = GeminiAnalyzer(db_path=db_path, api_base=server.base_url)
+        gemini.api_key = "test-key"
+        scanner = ProcessScanner(db_path=db_path)
+        tracer.reset()
+        yield scanner, gemini, tmp_path
+    Database._instances[db_path].close()
+    tracer.reset()
+
+
+def _counters():
+    return tracer.snapshot()["counters"]
+
+
+def _records(tmp_path, count):
+    records = []
+    for i in range(count):
+        exe = tmp_path / f"app{i}.bin"
+        exe.write_bytes(f"binary {i}".encode())
+        records.append(ProcessRecord(1000 + i, exe.name, path=str(exe)))
+    return records
+
+
+@pytest.mark.parametrize("count", [1, 3])
+def test_batch_counts_each_lookup_once(setup, count):
+    scanner, gemini, tmp_path = setup
+    records = _records(tmp_path, count)
+
+    results = BatchAnalyzer(scanner, gemini, requests_per_minute=0).run(records)
+    assert len(results) == count
+    assert _counters().get("gemini.cache_miss") == count
+    assert "gemini.cache_hit" not in _counters()
+
+    tracer.reset()
+    BatchAnalyzer(scanner, gemini, requests_per_minute=0).run(records)
+    assert _counters().get("gemini.cache_hit") == count
+    assert "gemini.cache_miss" not in _counters()
+
+
+def test_single_analysis_counts_once(setup):
+    scanner, gemini, tmp_path = setup
+    info = {"name": "app0.bin", "path": str(tmp_path / "app0.bin"), "hash": "e" * 64}
+
+    gemini.analyze_single_process(dict(info))
+    gemini.analyze_single_process(dict(info))
+    assert _counters().get("gemini.cache_miss") == 1
+    assert _counters().get("gemini.cache_hit") == 1
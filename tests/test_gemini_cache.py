@@ -0,0 +1,117 @@
+import json
+import sqlite3
+
+import pytest
+
+from core.gemini_api import GeminiAnalyzer, PROMPT_VERSION
+from core.storage import Database
+
+
+def _create_legacy_table(db_path, rows):
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE TABLE process_analysis (
+            cache_key TEXT PRIMARY KEY,
+            process_name TEXT,
+            file_path TEXT,
+            signature TEXT,
+            risk_score TEXT,
+            analysis_json TEXT,
+            updated_at DATETIME
+        )
+    ''')
+    conn.executemany("INSERT INTO process_analysis VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    db_path = str(tmp_path / "legacy.db")
+    analysis = json.dumps({"risk_skoru": "1/10"})
+    _create_legacy_table(db_path, [
+        # name|path|signature|lang|pid
+        ("app.exe|C:/apps/app.exe|Microsoft|TR|100", "app.exe", "C:/apps/app.exe", "Microsoft", "1/10", analysis, "2024-01-01"),
+        # Ad "|" içeriyor: dil yine sondan bulunmalı
+        ("a|b.exe|C:/x/a|b.exe|-|EN|200", "a|b.exe", "C:/x/a|b.exe", "-", "3/10", analysis, "2024-01-02"),
+        # Bozuk dil alanı: taşınmaz
+        ("bad.exe|C:/bad.exe|-|XX|300", "bad.exe", "C:/bad.exe", "-", "5/10", analysis, "2024-01-03"),
+        # Yolu bilinmeyen kayıt: taşınmaz
+        ("ghost.exe|Bilinmiyor|-|TR|400", "ghost.exe", "Bilinmiyor", "-", "5/10", analysis, "2024-01-04"),
+        # Eksik alanlı anahtar: taşınmaz
+        ("short.exe|TR|500", "short.exe", "C:/short.exe", "-", "5/10", analysis, "2024-01-05"),
+    ])
+    yield db_path
+    db = Database._instances.get(db_path)
+    if db is not None:
+        db.close()
+
+
+def test_legacy_rows_are_migrated_by_path(legacy_db):
+    analyzer = GeminiAnalyzer(db_path=legacy_db)
+    rows = analyzer.db.fetchall(
+        "SELECT file_hash, lang, prompt_version, process_name FROM analysis_cache ORDER BY process_name")
+
+    assert rows == [
+        ("path:C:/apps/app.exe", "TR", PROMPT_VERSION, "app.exe"),
+        ("path:C:/x/a|b.exe", "EN", PROMPT_VERSION, "a|b.exe"),
+    ]
+    assert analyzer.db.fetchone(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'process_analysis'") is None
+
+
+def test_migration_runs_once(legacy_db):
+    GeminiAnalyzer(db_path=legacy_db)
+    analyzer = GeminiAnalyzer(db_path=legacy_db) # Eski tablo yok: tekrar taşınmaz
+    assert analyzer.db.fetchone("SELECT COUNT(*) FROM analysis_cache")[0] == 2
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    yield GeminiAnalyzer(db_path=db_path)
+    Database._instances[db_path].close()
+
+
+SHA = "a" * 64
+PARTIAL = "partial:" + "b" * 64
+
+
+def test_content_key_uses_full_or_partial_fingerprint_only(analyzer):
+    assert analyzer._content_key({"hash": SHA.upper(), "path": "/x"}) == SHA
+    assert analyzer._content_key({"hash": PARTIAL, "path": "/big"}) == PARTIAL
+    # Hash yok (erişim engeli): yol ile önbelleğe alınmaz
+    assert analyzer._content_key({"hash": "Hesaplanamadı", "path": "/x"}) is None
+    assert analyzer._content_key({"hash": "partial:bozuk", "path": "/x"}) is None
+
+
+def test_partial_fingerprint_change_misses_cache(analyzer):
+    info = {"name": "big.bin", "path": "/big", "hash": PARTIAL}
+    analyzer._save_to_db(PARTIAL, "TR", info, {"risk_skoru": "1/10"})
+
+    assert analyzer._get_cached(info, "TR") == {"risk_skoru": "1/10"}
+    replaced = dict(info, hash="partial:" + "c" * 64) # Aynı yol, farklı içerik
+    assert analyzer._get_cached(replaced, "TR") is None
+
+
+def test_path_row_is_not_promoted_after_file_changes(analyzer, tmp_path):
+    exe = tmp_path / "app.exe"
+    exe.write_bytes(b"v1")
+    info = {"name": "app.exe", "path": str(exe), "hash": SHA}
+    analyzer._save_to_db(analyzer._path_key(str(exe)), "TR", info, {"sonuc": "Güvenli"})
+    # Kayıt dosyanın son değişikliğinden önce yazılmış gibi
+    analyzer.db.execute("UPDATE analysis_cache SET updated_at = ?", ("2000-01-01T00:00:00",))
+
+    assert analyzer._get_cached(info, "TR") is None
+    assert analyzer.db.fetchone("SELECT COUNT(*) FROM analysis_cache")[0] == 0
+
+
+def test_path_row_is_promoted_when_file_unchanged(analyzer, tmp_path):
+    exe = tmp_path / "app.exe"
+    exe.write_bytes(b"v1")
+    info = {"name": "app.exe", "path": str(exe), "hash": SHA}
+    analyzer._save_to_db(analyzer._path_key(str(exe)), "TR", info, {"sonuc": "Güvenli"})
+
+    assert analyzer._get_cached(info, "TR") == {"sonuc": "Güvenli"}
+    rows = analyzer.db.fetchall("SELECT file_hash FROM analysis_cache")
+    assert rows == [(SHA,)] # Yol kaydı hash altına taşındı
@@ -0,0 +1,47 @@
+import hashlib
+
+import pytest
+
+import core.hash_service as hash_service
+from core.hash_cache import MMAP_THRESHOLD, sha256_file
+from core.hash_service import HashService, PARTIAL_PREFIX
+
+
+@pytest.fixture
+def service():
+    svc = HashService(max_workers=2)
+    yield svc
+    svc.shutdown()
+
+
+def test_hash_many_returns_each_path_once(service, tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"f{i}.bin"
+        path.write_bytes(b"x" * (i + 1))
+        paths.append(str(path))
+
+    result = dict(service.hash_many(paths + [paths[0]]))
+    assert result == {p: hashlib.sha256(open(p, "rb").read()).hexdigest() for p in paths}
+
+
+def test_large_file_gets_partial_fingerprint(tmp_path):
+    path = tmp_path / "big.bin"
+    path.write_bytes(b"y" * 4096)
+    svc = HashService(partial_threshold=1024)
+    try:
+        assert svc.hash_file(str(path)).startswith(PARTIAL_PREFIX)
+    finally:
+        svc.shutdown()
+
+
+def test_file_truncated_before_mmap_yields_none(service, tmp_path, monkeypatch):
+    empty = tmp_path / "truncated.bin"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        sha256_file(str(empty), size=MMAP_THRESHOLD) # stat büyük gördü, dosya boşaldı
+
+    # stat ile okuma arasında boşalmış gibi: hash_many toplu analizi düşürmemeli
+    monkeypatch.setattr(hash_service, "sha256_file", lambda path, size: sha256_file(path, MMAP_THRESHOLD))
+    missing = str(tmp_path / "missing.bin")
+    assert dict(service.hash_many([str(empty), missing])) == {str(empty): None, missing: None}
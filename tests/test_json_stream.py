@@ -0,0 +1,49 @@
+import json
+
+from core.json_stream import JsonFieldStream
+
+RESPONSE = {
+    "kimlik": "Windows \"Explorer\" kabuğu, {ayraç} ve , içerir",
+    "risk_skoru": "2/10",
+    "guvenlik_analizi": {"imza": "Microsoft", "bulgular": ["a", "b,c"]},
+    "bellek_analizi": "120.5 MB",
+    "sonuc": "Güvenli",
+}
+
+
+def _feed_all(chunks):
+    parser = JsonFieldStream()
+    completed = []
+    for chunk in chunks:
+        completed.extend(parser.feed(chunk))
+    return parser, completed
+
+
+def test_fields_complete_in_order_when_split_per_character():
+    text = "```json\n" + json.dumps(RESPONSE, ensure_ascii=False, indent=2) + "\n```"
+    parser, completed = _feed_all(list(text))
+
+    assert completed == list(RESPONSE.items())
+    assert parser.fields == RESPONSE
+    assert parser.done
+
+
+def test_split_inside_key_string_and_escape():
+    text = json.dumps(RESPONSE, ensure_ascii=False)
+    # Parça sınırları anahtarın ve kaçış dizisinin ortasına denk gelsin
+    cut_key = text.index("risk_skoru") + 4
+    cut_escape = text.index('\\"') + 1
+    cuts = sorted({cut_escape, cut_key})
+    chunks = [text[:cuts[0]], text[cuts[0]:cuts[1]], text[cuts[1]:]]
+    parser, completed = _feed_all(chunks)
+
+    assert dict(completed) == RESPONSE
+    assert parser.text == text
+
+
+def test_field_reported_once_when_value_closes_in_later_chunk():
+    parser = JsonFieldStream()
+    assert parser.feed('{"risk_skoru": "2/') == []
+    assert parser.feed('10"') == [] # Ayraç (, veya }) gelene kadar tamamlanmış sayılmaz
+    assert parser.feed(', "sonuc": "Güvenli"}') == [("risk_skoru", "2/10"), ("sonuc", "Güvenli")]
+    assert parser.feed('{"baska": 1}') == [] # Nesne kapandıktan sonrası yok sayılır
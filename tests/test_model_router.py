@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from core.gemini_api import GeminiAnalyzer
+from core.model_router import AsyncModelRouter
+from core.storage import Database
+from fake_gemini import FakeGeminiServer
+
+MODELS = ["model-a", "model-b", "model-c"]
+
+
+@pytest.fixture
+def make_analyzer(tmp_path):
+    """Sahte sunucuya yönlendirilmiş GeminiAnalyzer (API anahtarı ayarlı)."""
+    db_path = str(tmp_path / "router.db")
+
+    def make(server):
+        analyzer = GeminiAnalyzer(db_path=db_path, api_base=server.base_url)
+        analyzer.api_key = "test-key"
+        return analyzer
+
+    yield make
+    db = Database._instances.get(db_path)
+    if db is not None:
+        db.close()
+
+
+def _router(analyzer, **kwargs):
+    return AsyncModelRouter(analyzer._call_api, MODELS, **kwargs)
+
+
+def test_failover_to_next_model(make_analyzer):
+    with FakeGeminiServer(fail_models={"model-a"}) as server:
+        router = _router(make_analyzer(server))
+        text, model = asyncio.run(router.request("prompt"))
+
+    assert model == "model-b"
+    assert "risk_skoru" in text
+    assert server.calls == ["model-a", "model-b"]
+
+
+def test_all_models_failing_returns_none(make_analyzer):
+    with FakeGeminiServer(fail_models=set(MODELS)) as server:
+        router = _router(make_analyzer(server))
+        assert asyncio.run(router.request("prompt")) == (None, None)
+
+    assert server.calls == MODELS
+
+
+def test_circuit_breaker_skips_failing_model_until_cooldown(make_analyzer):
+    with FakeGeminiServer(fail_models={"model-a"}) as server:
+        router = _router(make_analyzer(server), failure_threshold=2, cooldown=60.0)
+        for _ in range(2):
+            asyncio.run(router.request("prompt"))
+        assert router.stats()["model-a"]["state"] == "open"
+
+        before = len(server.calls)
+        text, model = asyncio.run(router.request("prompt"))
+        assert model == "model-b"
+        assert server.calls[before:] == ["model-b"] # Devresi açık model denenmedi
+
+        # Soğuma bitince tekrar denenir
+        router._health["model-a"].open_until = 0.0
+        before = len(server.calls)
+        asyncio.run(router.request("prompt"))
+        assert server.calls[before:] == ["model-a", "model-b"]
+
+
+def test_acquire_gates_every_attempt(make_analyzer):
+    acquired = []
+
+    def acquire():
+        acquired.append(1)
+        return True
+
+    with FakeGeminiServer(fail_models={"model-a", "model-b"}) as server:
+        router = _router(make_analyzer(server))
+        text, model = asyncio.run(router.request("prompt", acquire=acquire))
+
+    assert model == "model-c"
+    assert len(acquired) == len(server.calls) == 3
+
+
+def test_cancelled_acquire_sends_no_request(make_analyzer):
+    with FakeGeminiServer() as server:
+        router = _router(make_analyzer(server))
+        assert asyncio.run(router.request("prompt", acquire=lambda: False)) == (None, None)
+
+    assert server.calls == []
+
+
+def test_model_stats_do_not_create_router(make_analyzer):
+    with FakeGeminiServer() as server:
+        analyzer = make_analyzer(server)
+        assert analyzer.get_model_stats() is None
+        assert analyzer._router is None
+
+        analyzer.models = MODELS
+        analyzer._get_best_response("prompt")
+        stats = analyzer.get_model_stats()
+
+    assert stats["model-a"]["calls"] == 1
+    assert stats["model-a"]["state"] == "closed"
@@ -0,0 +1,32 @@
+from core.process_record import ProcessRecord
+from core.process_table import ProcessTable
+
+NAMES = ["zeta", "alpha", "mu", "beta", "omega", "gamma"]
+
+
+def _table():
+    records = [ProcessRecord(pid, name, rss=(pid * 37) % 11 * 1024, cpu_percent=float(pid % 4), ppid=0)
+               for pid, name in enumerate(NAMES, start=1)]
+    return ProcessTable(records)
+
+
+def _names(table, rows):
+    return [record.name for record in table.take(rows)]
+
+
+def test_top_by_name_is_ascending():
+    table = _table()
+    assert _names(table, table.top("name", 3, descending=False)) == ["alpha", "beta", "gamma"]
+
+
+def test_top_matches_argsort_prefix():
+    table = _table()
+    for column, descending in (("name", False), ("mem", True), ("rss", False)):
+        expected = table.argsort(column, descending)[:4].tolist()
+        assert table.top(column, 4, descending=descending).tolist() == expected
+
+
+def test_top_with_mask():
+    table = _table()
+    mask = table.name_mask("a")
+    assert _names(table, table.top("name", 2, mask, descending=False)) == ["alpha", "beta"]
@@ -0,0 +1,45 @@
+import os
+import pwd
+
+import pytest
+
+from core.backends.procfs import ProcfsSnapshot
+
+pytestmark = pytest.mark.skipif(not os.path.isdir("/proc"), reason="Sadece Linux")
+
+
+def _write_process(root, pid, name, uids, ppid=1):
+    proc_dir = root / str(pid)
+    proc_dir.mkdir()
+    # ")" sonrası: durum, ppid, ... utime(11), stime(12), starttime(19), vsize(20), rss(21)
+    fields = ["S", str(ppid)] + ["0"] * 9 + ["5", "3"] + ["0"] * 6 + ["100", "4096", "10"]
+    (proc_dir / "stat").write_text(f"{pid} ({name}) {' '.join(fields)}\n")
+    (proc_dir / "status").write_text(f"Name:\t{name}\nUid:\t{uids}\nGid:\t0\t0\t0\t0\n")
+
+
+@pytest.fixture
+def proc_root(tmp_path):
+    (tmp_path / "stat").write_text("cpu  0 0 0 0\nbtime 1700000000\n")
+    return tmp_path
+
+
+def test_username_uses_real_uid_not_proc_owner(proc_root):
+    # setpriv --euid=65534 gibi: gerçek uid 0, etkin uid 65534
+    _write_process(proc_root, 1234, "dropper", "0\t65534\t65534\t65534")
+    records, diff = ProcfsSnapshot(str(proc_root)).refresh()
+
+    assert [r.username for r in records] == [pwd.getpwuid(0).pw_name]
+    assert diff["added"][0].pid == 1234
+
+
+def test_unknown_uid_is_reported_as_number(proc_root):
+    uid = 4242424
+    try:
+        pwd.getpwuid(uid)
+        pytest.skip("uid sistemde tanımlı")
+    except KeyError:
+        pass
+    _write_process(proc_root, 77, "orphan", f"{uid}\t{uid}\t{uid}\t{uid}")
+    records, _ = ProcfsSnapshot(str(proc_root)).refresh()
+
+    assert records[0].username == str(uid)
@@ -0,0 +1,48 @@
+import time
+
+from core.sampler import ProcessSampler
+
+
+class _FakeScanner:
+    def __init__(self):
+        self.scans = []
+        self.samples = []
+
+    def get_process_changes(self, on_progress=None):
+        self.scans.append(time.monotonic())
+        return [], {"added": [], "removed": [], "updated": []}
+
+    def sample_resources(self):
+        self.samples.append(time.monotonic())
+
+
+def _run(sampler, seconds):
+    sampler.start()
+    time.sleep(seconds)
+    sampler.stop()
+    sampler._thread.join(timeout=2)
+
+
+def test_history_follows_its_own_interval():
+    # 0.5 sn, 0.3 sn'nin katı değil: tarama turuna bağlı olsaydı 0.6 sn arayla örneklenirdi
+    scanner = _FakeScanner()
+    _run(ProcessSampler(scanner, interval=0.3, history_interval=0.5), 1.75)
+
+    gaps = [b - a for a, b in zip(scanner.samples, scanner.samples[1:])]
+    assert len(scanner.samples) == 4
+    assert all(abs(gap - 0.5) < 0.08 for gap in gaps), gaps
+    assert 5 <= len(scanner.scans) <= 7
+
+
+def test_trigger_scans_immediately():
+    scanner = _FakeScanner()
+    sampler = ProcessSampler(scanner, interval=10.0)
+    sampler.start()
+    time.sleep(0.1)
+    sampler.trigger()
+    time.sleep(0.1)
+    sampler.stop()
+    sampler._thread.join(timeout=2)
+
+    assert len(scanner.scans) == 2
+    assert scanner.samples == [] # history_interval yok: örnekleme yapılmaz
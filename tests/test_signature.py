@@ -0,0 +1,120 @@
+import hashlib
+import os
+
+import pytest
+
+from core.signature import (
+    ChecksumManifestBackend, SignatureBackend, SignatureVerifier, format_status,
+    STATUS_VALID, STATUS_NOT_SIGNED, STATUS_HASH_MISMATCH, STATUS_TIMEOUT, STATUS_ERROR,
+)
+from core.storage import Database
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def files(tmp_path):
+    trusted = tmp_path / "trusted.bin"
+    trusted.write_bytes(b"trusted")
+    unknown = tmp_path / "unknown.bin"
+    unknown.write_bytes(b"unknown")
+    manifest = tmp_path / "SHA256SUMS"
+    manifest.write_text(f"{_sha256(b'trusted')}  trusted.bin\n")
+    dpkg = tmp_path / "dpkg"
+    dpkg.mkdir()
+    return trusted, unknown, manifest, dpkg
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_manifest_hit_is_valid_and_miss_is_not_signed(files):
+    trusted, unknown, manifest, dpkg = files
+    backend = ChecksumManifestBackend([str(manifest)], dpkg_info_dir=str(dpkg))
+
+    result = backend.verify_many([(str(trusted), _sha256(b"trusted")), (str(unknown), _sha256(b"unknown"))])
+    assert result == {str(trusted): STATUS_VALID, str(unknown): STATUS_NOT_SIGNED}
+    # Hash bilinmiyorsa dosya okunarak karşılaştırılır
+    assert backend.verify(str(trusted)) == STATUS_VALID
+
+
+def test_dpkg_md5_mismatch_is_hash_mismatch(files, tmp_path):
+    trusted, unknown, manifest, dpkg = files
+    tool = tmp_path / "tool"
+    tool.write_bytes(b"original")
+    # dpkg yolları kökten görelidir ("usr/bin/ls")
+    (dpkg / "pkg.md5sums").write_text(f"{hashlib.md5(b'original').hexdigest()}  {str(tool).lstrip('/')}\n")
+    backend = ChecksumManifestBackend([], dpkg_info_dir=str(dpkg))
+    assert backend.verify(str(tool), _sha256(b"original")) == STATUS_VALID
+
+    tool.write_bytes(b"tampered")
+    assert backend.verify(str(tool), _sha256(b"tampered")) == STATUS_HASH_MISMATCH
+    assert format_status(STATUS_HASH_MISMATCH) == "İmza Bozuk (RİSKLİ)"
+
+
+def test_manifest_change_changes_cache_key(files):
+    trusted, unknown, manifest, dpkg = files
+    backend = ChecksumManifestBackend([str(manifest)], dpkg_info_dir=str(dpkg))
+    before = backend.cache_key()
+    assert backend.cache_key() == before # Değişiklik yoksa sabit
+
+    with open(manifest, "a") as f:
+        f.write(f"{_sha256(b'unknown')}  unknown.bin\n")
+    _bump_mtime(manifest)
+
+    assert backend.cache_key() != before
+    assert backend.verify(str(unknown), _sha256(b"unknown")) == STATUS_VALID # Yeniden yüklendi
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "signature.db")
+    yield path
+    db = Database._instances.get(path)
+    if db is not None:
+        db.close()
+
+
+def test_verifier_cache_is_invalidated_by_manifest_update(files, db_path):
+    trusted, unknown, manifest, dpkg = files
+    verifier = SignatureVerifier(ChecksumManifestBackend([str(manifest)], dpkg_info_dir=str(dpkg)), db_path)
+    item = [(str(unknown), _sha256(b"unknown"))]
+    assert verifier.verify_many(item) == {str(unknown): format_status(STATUS_NOT_SIGNED)}
+
+    with open(manifest, "a") as f:
+        f.write(f"{_sha256(b'unknown')}  unknown.bin\n")
+    _bump_mtime(manifest)
+
+    assert verifier.verify_many(item) == {str(unknown): format_status(STATUS_VALID)}
+
+
+class _ScriptedBackend(SignatureBackend):
+    """Her yol için sabit durum döner, çağrıları sayar."""
+
+    name = "scripted"
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.calls = []
+
+    def verify_many(self, items):
+        self.calls.extend(path for path, _ in items)
+        return {path: self.statuses[path] for path, _ in items}
+
+
+def test_timeout_and_error_are_not_cached(db_path):
+    backend = _ScriptedBackend({"/ok": STATUS_VALID, "/slow": STATUS_TIMEOUT, "/bad": STATUS_ERROR})
+    verifier = SignatureVerifier(backend, db_path)
+    items = [("/ok", "1" * 64), ("/slow", "2" * 64), ("/bad", "3" * 64)]
+
+    first = verifier.verify_many(items)
+    assert first["/slow"] == format_status(STATUS_TIMEOUT)
+    assert first["/bad"] == format_status(STATUS_ERROR)
+
+    backend.calls.clear()
+    assert verifier.verify_many(items) == first
+    assert sorted(backend.calls) == ["/bad", "/slow"] # Sadece Valid önbellekten geldi
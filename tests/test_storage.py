@@ -0,0 +1,66 @@
+import sqlite3
+
+from core.storage import Database
+
+
+def _count(db_path):
+    """Ayrı bir bağlantıdan (commit edilmiş) satır sayısı."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _make_db(tmp_path, batch_size=3):
+    db_path = str(tmp_path / "test.db")
+    db = Database(db_path, batch_size=batch_size, flush_interval=60.0)
+    db.script("CREATE TABLE t (v INTEGER)")
+    return db, db_path
+
+
+def test_writes_are_committed_in_batches(tmp_path):
+    db, db_path = _make_db(tmp_path, batch_size=3)
+    try:
+        db.execute("INSERT INTO t VALUES (?)", (1,))
+        db.execute("INSERT INTO t VALUES (?)", (2,))
+        assert _count(db_path) == 0 # Henüz commit yok
+        assert db.fetchone("SELECT COUNT(*) FROM t")[0] == 2 # Aynı bağlantı görür
+
+        db.execute("INSERT INTO t VALUES (?)", (3,))
+        assert _count(db_path) == 3 # batch_size doldu: tek commit
+    finally:
+        db.close()
+
+
+def test_commit_true_flushes_immediately(tmp_path):
+    db, db_path = _make_db(tmp_path, batch_size=50)
+    try:
+        db.execute("INSERT INTO t VALUES (?)", (1,))
+        db.execute("INSERT INTO t VALUES (?)", (2,), commit=True)
+        assert _count(db_path) == 2
+    finally:
+        db.close()
+
+
+def test_close_flushes_pending_writes(tmp_path):
+    db, db_path = _make_db(tmp_path, batch_size=50)
+    db.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(5)])
+    assert _count(db_path) == 0
+    db.close()
+    assert _count(db_path) == 5
+    db.close() # İkinci kapatma zararsız
+
+
+def test_shared_returns_single_connection_per_file(tmp_path):
+    db_path = str(tmp_path / "shared.db")
+    first = Database.shared(db_path)
+    try:
+        assert Database.shared(db_path) is first
+    finally:
+        first.close()
+    second = Database.shared(db_path) # Kapanınca yenisi oluşturulur
+    try:
+        assert second is not first
+    finally:
+        second.close()
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+from core.gemini_api import GeminiAnalyzer
+from core.storage import Database
+from fake_gemini import FakeGeminiServer, fake_analysis
+
+INFO = {"pid": 42, "name": "app.exe", "path": "/opt/app.exe", "hash": "d" * 64,
+        "signature": "-", "rss": 10 * 1024 * 1024}
+
+
+@pytest.fixture
+def server():
+    # Küçük parçalar + aralık: alanlar akış bitmeden tamamlanmalı
+    with FakeGeminiServer(chunk_size=16, chunk_delay=0.02) as fake:
+        yield fake
+
+
+@pytest.fixture
+def analyzer(tmp_path, server):
+    db_path = str(tmp_path / "stream.db")
+    analyzer = GeminiAnalyzer(db_path=db_path, api_base=server.base_url)
+    analyzer.api_key = "test-key"
+    analyzer.models = ["model-a"]
+    yield analyzer
+    Database._instances[db_path].close()
+
+
+def test_call_api_stream_joins_chunks(analyzer, server):
+    chunks = []
+    text = analyzer._call_api_stream("model-a", "prompt", chunks.append)
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == text
+    assert "Güvenli" in text # UTF-8 olaylar doğru çözülür
+
+
+def test_on_field_order_result_and_cache(analyzer, server):
+    expected = fake_analysis()
+    fields = []
+
+    def on_field(key, value):
+        fields.append((key, value, time.monotonic()))
+
+    result = analyzer.analyze_single_process(dict(INFO), on_field=on_field)
+    finished = time.monotonic()
+
+    assert [(key, value) for key, value, _ in fields] == list(expected.items())
+    assert result == expected
+    # İlk alan yanıtın sonundan belirgin şekilde önce geldi (akış)
+    assert fields[0][2] < finished - 0.1
+
+    # İkinci istek önbellekten: sunucuya gidilmez, alan bildirimi olmaz
+    calls = len(server.calls)
+    fields.clear()
+    cached = analyzer.analyze_single_process(dict(INFO), on_field=on_field)
+    assert len(server.calls) == calls
+    assert fields == []
+    assert {k: v for k, v in cached.items() if k != "bellek_analizi"} == \
+        {k: v for k, v in expected.items() if k != "bellek_analizi"}
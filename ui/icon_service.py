@@ -0,0 +1,120 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import customtkinter as ctk
+
+
+class IconService:
+    """
+    İşlem ikonları için önbellekli, asenkron servis.
+    - Anahtar: (çalıştırılabilir dosya yolu, mtime). 50 svchost = tek ikon.
+    - Bellekte LRU: en fazla `max_items` CTkImage tutulur. İkonu çıkarılamayan
+      dosyalar da (None olarak) tutulur; yavaş çıkarma her seçimde tekrarlanmaz.
+    - Diskte küçük resim önbelleği (PNG): sonraki açılışlarda ikon çıkarılmaz.
+      En fazla `max_disk_items` dosya; fazlası en eski kullanılandan silinir.
+    - Çıkarma işlemi arka plan thread'inde yapılır; hazır olunca geri çağrı
+      Tk ana thread'inde (`after`) çalıştırılır.
+    """
+
+    PRUNE_EVERY = 32 # Bu kadar yeni PNG yazıldıkça disk önbelleği budanır
+
+    def __init__(self, root, scanner, max_items=128, cache_dir="icon_cache", size=(64, 64), max_disk_items=512):
+        self.root = root
+        self.scanner = scanner
+        self.max_items = max_items
+        self.cache_dir = cache_dir
+        self.size = size
+        self.max_disk_items = max_disk_items
+
+        self._images = OrderedDict() # (path, mtime) -> CTkImage veya None (ikon yok)
+        self._saved = 0              # Son budamadan beri yazılan PNG sayısı
+        self._pending = {}           # (path, mtime) -> [geri çağrı, ...]
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="icon")
+        self._pool.submit(self._prune_disk) # Önceki oturumlardan kalan fazlalık
+
+    def request(self, pid, callback):
+        """
+        PID'nin ikonunu ister. Önbellekte varsa callback hemen çağrılır;
+        yoksa arka planda hazırlanır. callback(CTkImage veya None)
+        """
+        path = self.scanner.get_process_path(pid)
+        if not path:
+            callback(None)
+            return
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+        except OSError:
+            callback(None)
+            return
+
+        if key in self._images:
+            self._images.move_to_end(key) # LRU: en son kullanılan
+            callback(self._images[key])   # None: ikon yok (tekrar denenmez)
+            return
+
+        with self._lock:
+            waiters = self._pending.get(key)
+            if waiters is not None:
+                waiters.append(callback) # Aynı ikon zaten hazırlanıyor
+                return
+            self._pending[key] = [callback]
+        self._pool.submit(self._load, key)
+
+    def _thumb_path(self, key):
+        digest = hashlib.sha1(f"{key[0]}|{key[1]}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.png")
+
+    def _load(self, key):
+        """Arka plan: önce disk önbelleği, yoksa platformdan ikon çıkarma."""
+        pil_image = None
+        thumb = self._thumb_path(key)
+        try:
+            if os.path.exists(thumb):
+                from PIL import Image
+                with Image.open(thumb) as img:
+                    pil_image = img.copy()
+                os.utime(thumb) # Budamada en son kullanılan sayılsın
+            else:
+                pil_image = self.scanner.backend.get_file_icon(key[0])
+                if pil_image is not None:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    pil_image.save(thumb, "PNG")
+                    self._saved += 1
+                    if self._saved >= self.PRUNE_EVERY:
+                        self._saved = 0
+                        self._prune_disk()
+        except Exception as e:
+            print(f"⚠️ İkon Hatası: {e}")
+        self.root.after(0, lambda: self._deliver(key, pil_image))
+
+    def _prune_disk(self):
+        """Disk önbelleğini `max_disk_items` dosyaya indirir (en eski kullanılan silinir)."""
+        try:
+            entries = [e for e in os.scandir(self.cache_dir) if e.name.endswith(".png")]
+        except OSError:
+            return
+        if len(entries) <= self.max_disk_items:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[:len(entries) - self.max_disk_items]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def _deliver(self, key, pil_image):
+        """Ana thread: CTkImage oluştur, LRU'ya ekle (ikon yoksa None), bekleyenleri çağır."""
+        image = None
+        if pil_image is not None:
+            image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=self.size)
+        self._images[key] = image
+        while len(self._images) > self.max_items:
+            self._images.popitem(last=False)
+
+        with self._lock:
+            callbacks = self._pending.pop(key, [])
+        for callback in callbacks:
+            callback(image)
@@ -0,0 +1,171 @@
+import customtkinter as ctk
+
+
+class VirtualProcessList(ctk.CTkFrame):
+    """
+    Sanal (virtualized) işlem listesi.
+    Sadece görünen satırlar kadar buton oluşturur; kaydırırken aynı butonlar
+    yeniden kullanılır ve liste değişince sadece metinleri güncellenir.
+    Böylece arama/sıralama süresi işlem sayısından bağımsız kalır.
+    """
+
+    def __init__(self, master, command=None, formatter=None, row_height=39, **kwargs):
+        super().__init__(master, **kwargs)
+        self.command = command
+        self.formatter = formatter or (lambda item: str(item))
+        self.row_height = row_height
+
+        self.items = []
+        self.offset = 0          # Görünen ilk satırın indeksi
+        self.selected_key = None # Seçili işlemin PID'si
+        self._rows = []          # Yeniden kullanılan buton havuzu
+        self._row_texts = []     # Gereksiz configure çağrılarını önlemek için son metinler
+        self._row_selected = []
+        self._capacity = 0
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.grid(row=0, column=0, sticky="nsew")
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.body.bind("<Configure>", self._on_configure)
+        self._bind_wheel(self.body)
+
+    # --- Dış API ---
+    def set_items(self, items):
+        """
+        Listeyi yerinde günceller. Kaydırma konumu korunur: en üstte görünen
+        işlem yeni listede de varsa görünüm onun üzerinde sabit kalır.
+        """
+        anchor = self.items[self.offset].pid if self.offset and self.offset < len(self.items) else None
+        self.items = items
+        if anchor is not None:
+            for index, item in enumerate(items):
+                if item.pid == anchor:
+                    self.offset = index
+                    break
+        self._clamp_offset()
+        self._render()
+
+    def refresh_rows(self):
+        """Liste aynı, sadece içerik (örn. bellek) değiştiyse görünen satırları yeniden yazar."""
+        self._render()
+
+    def set_selected(self, key):
+        self.selected_key = key
+        self._render()
+
+    def scroll_to_index(self, index):
+        if index < self.offset or index >= self.offset + self._visible_count():
+            self.offset = index
+            self._clamp_offset()
+            self._render()
+
+    # --- Çizim ---
+    def _visible_count(self):
+        return max(1, self.body.winfo_height() // self.row_height)
+
+    def _on_configure(self, event=None):
+        capacity = max(1, event.height // self.row_height + 1) if event else self._visible_count() + 1
+        # Havuzu sadece büyüt (küçülünce fazla satırlar gizlenir)
+        while len(self._rows) < capacity:
+            self._rows.append(self._create_row(len(self._rows)))
+            self._row_texts.append(None)
+            self._row_selected.append(None)
+        self._capacity = capacity
+        self._clamp_offset()
+        self._render()
+
+    def _create_row(self, slot):
+        btn = ctk.CTkButton(
+            self.body,
+            text="",
+            height=self.row_height - 4,
+            font=("Consolas", 12), # Monospace
+            fg_color="transparent",
+            border_width=1,
+            border_color="#333333",
+            text_color="#DDDDDD",
+            anchor="w",
+            command=lambda s=slot: self._on_row_click(s)
+        )
+        self._bind_wheel(btn)
+        return btn
+
+    def _render(self):
+        for slot, btn in enumerate(self._rows):
+            index = self.offset + slot
+            if slot >= self._capacity or index >= len(self.items):
+                if self._row_texts[slot] is not None:
+                    btn.place_forget()
+                    self._row_texts[slot] = None
+                continue
+
+            item = self.items[index]
+            text = self.formatter(item)
+            selected = self.selected_key is not None and item.pid == self.selected_key
+
+            if self._row_texts[slot] is None:
+                # CTk widget'larında genişlik place() ile değil relwidth ile verilir
+                btn.place(x=0, y=slot * self.row_height + 2, relwidth=1)
+            if text != self._row_texts[slot]:
+                btn.configure(text=text)
+                self._row_texts[slot] = text
+            if selected != self._row_selected[slot]:
+                btn.configure(border_color="#1F6AA5" if selected else "#333333")
+                self._row_selected[slot] = selected
+
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        total = len(self.items)
+        if total == 0:
+            self.scrollbar.set(0, 1)
+            return
+        visible = self._visible_count()
+        self.scrollbar.set(self.offset / total, min(1.0, (self.offset + visible) / total))
+
+    def _clamp_offset(self):
+        max_offset = max(0, len(self.items) - self._visible_count())
+        self.offset = max(0, min(self.offset, max_offset))
+
+    # --- Olaylar ---
+    def _on_row_click(self, slot):
+        index = self.offset + slot
+        if index < len(self.items) and self.command:
+            item = self.items[index]
+            self.set_selected(item.pid)
+            self.command(item)
+
+    def _on_scrollbar(self, *args):
+        # Tk scroll protokolü: ("moveto", oran) veya ("scroll", n, "units"/"pages")
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * len(self.items))
+        elif args[0] == "scroll":
+            step = self._visible_count() if args[2] == "pages" else 1
+            self.offset += int(args[1]) * step
+        self._clamp_offset()
+        self._render()
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4:
+            delta = -3
+        elif getattr(event, "num", None) == 5:
+            delta = 3
+        else:
+            delta = -3 if event.delta > 0 else 3
+        self.offset += delta
+        self._clamp_offset()
+        self._render()
+        return "break"
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel)  # Windows / macOS
+        widget.bind("<Button-4>", self._on_wheel)    # Linux
+        widget.bind("<Button-5>", self._on_wheel)